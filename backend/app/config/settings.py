@@ -5,8 +5,44 @@ class Settings(BaseSettings):
     AZURE_OPENAI_ENDPOINT: str
     AZURE_OPENAI_API_VERSION: str = "preview"
     AZURE_OPENAI_MODEL: str = "gpt-4o-mini-01"
+    OPENAI_MAX_CONNECTIONS: int = 20  # pooled HTTP connections to the OpenAI endpoint
+    OPENAI_TIMEOUT_SECONDS: float = 60  # per attempt
+    OPENAI_MAX_CONCURRENCY: int = 16  # completions in flight per process
+    OPENAI_MAX_RETRIES: int = 3  # retries on 429/5xx/connection errors
+    OPENAI_BACKOFF_SECONDS: float = 0.5  # base of the exponential backoff
+    OPENAI_BACKOFF_MAX_SECONDS: float = 20
+    CHAT_EXTRACTION_MODE: str = "structured"  # "structured" (one call per turn), "incremental" or "full"
+    CHAT_SESSION_TTL_SECONDS: int = 86400  # idle chat sessions are deleted after this (TTL index)
+    CHAT_SESSION_CACHE_SIZE: int = 1000  # sessions kept in the in-process LRU (0 = always read Mongo)
+    CHAT_HISTORY_TOKEN_BUDGET: int = 2000  # recent messages sent verbatim; older ones are summarized
+    CHAT_HISTORY_KEEP_MESSAGES: int = 4  # always kept verbatim, even over budget
     MONGO_URI: str
     MONGO_DB_NAME: str
+    PASSWORD_HASH_WORKERS: int = 4  # threads running bcrypt
+    PASSWORD_HASH_MAX_PENDING: int = 64  # hash/verify calls queued or running at once
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 60  # how long a changed or revoked user can stay authorised in other processes
+    PRINCIPAL_CACHE_SIZE: int = 10000  # authenticated users cached per process
+    AUDIO_PIPELINE_WORKERS: int = 1  # local worker processes started with the API (0 = run them separately)
+    WHISPER_MODEL: str = "base"
+    WHISPER_WORKERS: int = 0  # transcription processes per pool (0 = half the CPU count)
+    WHISPER_MAX_QUEUE: int = 4  # transcriptions allowed to wait for a free worker
+    WHISPER_QUEUE_TIMEOUT_SECONDS: float = 30
+    WHISPER_CHUNKED_MIN_SECONDS: float = 600  # longer recordings are split at silences and transcribed in parallel
+    WHISPER_WINDOW_SECONDS: float = 120
+    WHISPER_SPLIT_SEARCH_SECONDS: float = 15  # how far from the target cut to look for a pause
+    LIVE_TRANSCRIPTION_STEP_SECONDS: float = 5  # new audio needed before the window is transcribed again
+    LIVE_TRANSCRIPTION_WINDOW_SECONDS: float = 20  # window length at which earlier segments are finalized
+    LIVE_TRANSCRIPTION_WORKERS: int = 1  # Whisper processes per API process, started on the first live session
+    EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"
+    EMBEDDING_BACKEND: str = "torch"  # "torch", "onnx" or "onnx-int8"
+    EMBEDDING_ONNX_INT8_FILE: str = "onnx/model_quint8_avx2.onnx"  # quantized export used by "onnx-int8"
+    EMBEDDING_BATCH_SIZE: int = 64
+    EMBEDDING_QUERY_CACHE_SIZE: int = 2048  # query embeddings kept in the LRU cache
+    VECTOR_STORE_WORKERS: int = 4  # threads running Chroma queries and embedding
+    CHROMA_SERVER_HOST: str = ""  # Chroma server shared by the API and pipeline workers; "" = embedded, safe for one process only
+    CHROMA_SERVER_PORT: int = 8001
+    MODEL_WARMUP: list[str] = ["embedding_model", "vector_store"]  # loaded in the background at startup; /health/ready waits for them
+    VECTOR_PARTITION_STRATEGY: str = "doctor"  # Chroma collection per "doctor", per "month", or "none" (single collection)
     model_config = SettingsConfigDict(env_file=".env", extra="allow")  # 👈 allow extra if needed
 
 # create instance
@@ -1,5 +1,4 @@
 import certifi
-from pymongo import MongoClient
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 
@@ -16,14 +15,6 @@ client = AsyncIOMotorClient(
 )
 db = client[settings.MONGO_DB_NAME]
 
-# Synchronous DB client for GridFS (binary files only)
-sync_client = MongoClient(
-    settings.MONGO_URI,
-    tls=True,
-    tlsCAFile=ca
-)
-sync_db = sync_client[settings.MONGO_DB_NAME]
-
 def get_db() -> AsyncIOMotorDatabase:
     return db
 
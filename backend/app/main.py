@@ -1,3 +1,5 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.routes import patient_routes, consultation_notes_routes
 from app.routes import doctor_routes
@@ -8,13 +10,41 @@ from app.routes import note_chatbot_routes
 from app.routes import appointment_chatbot_routes
 from app.routes import message_routes
 from app.routes import auth_routes
+from app.routes import export_routes
+from app.routes import health_routes
 from fastapi.middleware.cors import CORSMiddleware
 from app.routes import chat_routes
+from app.database import get_database
+from app.services.index_service import ensure_indexes
+from app.config.settings import settings
+from app.workers.audio_pipeline_worker import start_worker_processes, stop_worker_processes
+from app.services.model_registry import model_registry
+from app.services.live_transcription_service import live_transcription_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Make sure every index in the registry exists before serving traffic
+    await ensure_indexes(get_database())
+    # Local workers for the upload-audio -> transcribe -> embed pipeline
+    workers = start_worker_processes(settings.AUDIO_PIPELINE_WORKERS)
+    if workers and not settings.CHROMA_SERVER_HOST:
+        print("⚠️ Pipeline workers and the API share an embedded Chroma store; "
+              "set CHROMA_SERVER_HOST to a Chroma server to avoid corrupting vector_db")
+    # Models load in the background so the server accepts traffic right away
+    warm_up = asyncio.create_task(model_registry.warm_up(settings.MODEL_WARMUP))
+    yield
+    warm_up.cancel()
+    stop_worker_processes(workers)
+    # Whisper processes started by live transcription sessions in this process
+    live_transcription_pool.shutdown()
+
 
 app = FastAPI(
     title="Doctor Appointment Booking API",
     description="Backend for AI-powered doctor booking system",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS setup - More explicit configuration
@@ -58,6 +88,8 @@ app.include_router(audio_routes.router)
 app.include_router(consultation_notes_routes.router)
 app.include_router(message_routes.router)
 app.include_router(chat_routes.router)
+app.include_router(export_routes.router)
+app.include_router(health_routes.router)
 app.include_router(appointment_chatbot_routes.router, tags=["Appointment Chatbot"])
 app.include_router(note_chatbot_routes.router, tags=["VoiceNote Chatbot"])
 app.router.redirect_slashes = False
@@ -1,43 +1,18 @@
-import os
 import re
 import json
-from dotenv import load_dotenv
-from langchain.vectorstores import Chroma
-from langchain.embeddings import HuggingFaceEmbeddings
-from openai import OpenAI
+import asyncio
 from openai.types.chat import ChatCompletionMessageToolCall
 from openai.types.shared_params import FunctionDefinition
+from app.services.vector_store_service import vector_store
+from app.services.llm_client import llm_client
 
-# ==== Load environment variables ====
-print("🔧 Loading environment variables...")
-load_dotenv()
-AZURE_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
-AZURE_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
-
-# ==== Initialize embedding function ====
-print("🧠 Loading embedding model...")
-embedding_model_name = "all-MiniLM-L6-v2"
-embedding_function = HuggingFaceEmbeddings(model_name=embedding_model_name)
-print("✅ Embedding model loaded.")
-
-# ==== Load Chroma Vector Store ====
-VECTOR_DB_DIR = os.path.abspath("vector_db")
-print(f"📦 Loading vector store from: {VECTOR_DB_DIR}")
-vectorstore = Chroma(
-    persist_directory=VECTOR_DB_DIR,
-    embedding_function=embedding_function
-)
-print("📦 Vector store document count:", vectorstore._collection.count())
-print("✅ Vector store loaded.")
-
-# ==== Azure OpenAI Client Setup ====
-print("🔗 Connecting to Azure OpenAI API...")
-client = OpenAI(
-    api_key=AZURE_API_KEY,
-    base_url=AZURE_ENDPOINT,
-    default_query={"api-version": "preview"},
-)
-print("✅ Azure OpenAI connection ready.")
+# ==== Vector Store ====
+# The embedding model and Chroma index are shared with ingestion (rag_service)
+# through vector_store_service and loaded on first use.
+
+# ==== Azure OpenAI Client ====
+# The shared async client (llm_client): pooled connections, timeouts,
+# retries on 429/5xx and a bound on concurrent completions.
 
 # ==== Define Tools for Function Calling ====
 tools = [
@@ -70,20 +45,15 @@ tools = [
 ]
 
 # ==== Retrieval Function ====
-def retrieve_relevant_chunks(query: str, appointment_id: str, top_k: int = 3) -> list[str]:
+async def retrieve_relevant_chunks(query: str, appointment_id: str, top_k: int = 3) -> list[str]:
     print(f"🔍 Searching for query: '{query}' in appointment: {appointment_id}")
-    print(f"🔍 Vector store document count: {vectorstore._collection.count()}")
     
     try:
-        results = vectorstore.similarity_search(
-            query,
-            k=top_k,
-            filter={"appointment_id": appointment_id}  # metadata filter
-        )
+        results = await vector_store.query(query, appointment_id=appointment_id, k=top_k)
         print(f"🔍 Found {len(results)} results")
         for i, result in enumerate(results):
-            print(f"🔍 Result {i+1}: {result.page_content[:100]}...")
-        return [doc.page_content for doc in results]
+            print(f"🔍 Result {i+1}: {result[:100]}...")
+        return results
     except Exception as e:
         print(f"❌ Error in retrieve_relevant_chunks: {e}")
         import traceback
@@ -109,7 +79,7 @@ history = [
 user_name = None  # To store user name if provided
 
 # ==== Answer Generation ====
-def generate_answer(query: str, appointment_id: str) -> str:
+async def generate_answer(query: str, appointment_id: str) -> str:
     global user_name
 
     # Extract user name from greeting
@@ -135,7 +105,7 @@ def generate_answer(query: str, appointment_id: str) -> str:
 
 
     # First API call with function calling
-    response = client.chat.completions.create(
+    response = await llm_client.chat(
         model="gpt-4o",
         messages=history,
         tools=tools,
@@ -151,7 +121,7 @@ def generate_answer(query: str, appointment_id: str) -> str:
                 args = json.loads(tool_call.function.arguments)
                 args["appointment_id"] = appointment_id
                 top_k = args.get("top_k", 3)
-                chunks = retrieve_relevant_chunks(args["query"], appointment_id=args["appointment_id"], top_k=top_k)
+                chunks = await retrieve_relevant_chunks(args["query"], appointment_id=args["appointment_id"], top_k=top_k)
 
                 context = "\n\n".join(chunks)
 
@@ -164,7 +134,7 @@ def generate_answer(query: str, appointment_id: str) -> str:
                 print("🛠️ Tool called: retrieve_relevant_chunks")
 
                 # Retry completion with transcript context
-                second_response = client.chat.completions.create(
+                second_response = await llm_client.chat(
                     model="gpt-4o",
                     messages=history
                 )
@@ -178,7 +148,7 @@ def generate_answer(query: str, appointment_id: str) -> str:
     history.append({"role": "assistant", "content": reply})
     return reply
 
-def summarize_key_points(docs: list[str], max_chunks: int = 5) -> str:
+async def summarize_key_points(docs: list[str], max_chunks: int = 5) -> str:
     context = "\n\n".join(docs[:max_chunks])  # Limit context to avoid overloading
 
     prompt = f"""
@@ -202,7 +172,7 @@ Transcript:
 {context}
 """.strip()
 
-    response = client.chat.completions.create(
+    response = await llm_client.chat(
         model="gpt-4o-mini-01",
         messages=[
             {
@@ -218,20 +188,25 @@ Transcript:
 
 
 # ==== Main Loop ====
-if __name__ == "__main__":
-    appointment_id = input("Enter appointment ID: ").strip()
-    key_chunks = retrieve_relevant_chunks("summary", appointment_id=appointment_id, top_k=5)
+async def main():
+    # One event loop for the whole session, so the shared client's connection pool is reused
+    appointment_id = (await asyncio.to_thread(input, "Enter appointment ID: ")).strip()
+    key_chunks = await retrieve_relevant_chunks("summary", appointment_id=appointment_id, top_k=5)
     # Extract key points
-    summary = summarize_key_points(key_chunks)
+    summary = await summarize_key_points(key_chunks)
     print("\n📌 Key Points from the Transcript:\n")
     print(summary)
     print("🧠 Ready! Ask your medical consultation question (type 'quit' to exit):")
 
 
     while True:
-        user_query = input("User: ").strip()
+        user_query = (await asyncio.to_thread(input, "User: ")).strip()
         if user_query.lower() == "quit":
             break
 
-        answer = generate_answer(user_query, appointment_id)
+        answer = await generate_answer(user_query, appointment_id)
         print("\nAssistant:", answer)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
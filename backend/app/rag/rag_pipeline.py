@@ -1,16 +1,9 @@
-import os
 import json
-from dotenv import load_dotenv
+import asyncio
 from chromadb import Client
 from chromadb.config import Settings
-from sentence_transformers import SentenceTransformer
-from openai import OpenAI
-
-# ==== Load ENV ====
-print("🔧 Loading environment variables...")
-load_dotenv()
-AZURE_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
-AZURE_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
+from app.services.embedding_service import embedding_service
+from app.services.llm_client import llm_client
 
 # ==== Load Transcripts ====
 def load_transcripts(json_path):
@@ -20,21 +13,11 @@ def load_transcripts(json_path):
     print(f"✅ Loaded {len(data)} transcript segments.")
     return data
 
-# ==== Embedding Function using SentenceTransformers ====
-class SentenceTransformerEmbeddingFunction:
-    def __init__(self, model_name="all-MiniLM-L6-v2"):
-        print(f"🧠 Loading embedding model: {model_name}")
-        self.model = SentenceTransformer(model_name)
-        print("✅ Embedding model loaded.")
-
-    def __call__(self, input):
-        print(f"🔍 Generating embeddings for {len(input)} texts...")
-        return self.model.encode(input).tolist()
-
 # ==== Setup ChromaDB ====
 def setup_chroma(transcripts):
     print("🗂️ Setting up ChromaDB...")
-    embedding_fn = SentenceTransformerEmbeddingFunction()
+    # Same batched, normalized embedding model as the API
+    embedding_fn = embedding_service
 
     client = Client(Settings(anonymized_telemetry=False))
     collection = client.create_collection(
@@ -43,14 +26,12 @@ def setup_chroma(transcripts):
     )
 
     print("📥 Adding transcript segments to ChromaDB collection...")
-    for i, note in enumerate(transcripts):
-        collection.add(
-            documents=[note["text"]],
-            ids=[str(i)],
-            # metadatas=[{"speaker": note["speaker"], "start": note["start"]}]  # ❌ Previous code with speaker label
-            metadatas=[{"start": note["start"], "end": note["end"]}]  # ✅ Modified for JSON without speaker
-
-        )
+    # One add call, so the segments are embedded in batches rather than one at a time
+    collection.add(
+        documents=[note["text"] for note in transcripts],
+        ids=[str(i) for i in range(len(transcripts))],
+        metadatas=[{"start": note["start"], "end": note["end"]} for note in transcripts]  # ✅ Modified for JSON without speaker
+    )
     print("✅ ChromaDB setup complete.")
     return collection
 
@@ -62,15 +43,8 @@ def retrieve(collection, query, top_k=3):
     return results["documents"][0]
 
 # ==== Azure OpenAI LLM ====
-print("🔗 Connecting to Azure OpenAI API...")
-client = OpenAI(
-    api_key=AZURE_API_KEY,
-    base_url=AZURE_ENDPOINT,
-    default_query={"api-version": "preview"},
-)
-print("✅ Azure OpenAI connection ready.")
-
-def generate_answer(query, retrieved_docs):
+# Shared async client (llm_client), same pooling/retries/timeouts as the API
+async def generate_answer(query, retrieved_docs):
     print("💬 Generating answer from retrieved context...")
     context = "\n\n".join(retrieved_docs)
 
@@ -91,7 +65,7 @@ def generate_answer(query, retrieved_docs):
     Answer:
     """.strip()
 
-    response = client.chat.completions.create(
+    response = await llm_client.chat(
         model="gpt-4o-mini-01",  # Change to your Azure deployment name
         messages=[{"role": "user", "content": prompt}]
     )
@@ -116,7 +90,7 @@ if __name__ == "__main__":
     top_chunks = retrieve(chroma_collection, user_query)
 
     # Generate answer
-    answer = generate_answer(user_query, top_chunks)
+    answer = asyncio.run(generate_answer(user_query, top_chunks))
 
     print("\n💬 Answer:")
     print(answer)
@@ -2,10 +2,11 @@ from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import List, Dict, Optional, Any
 from app.schemas.appointment_schema import AppointmentCreate
-from app.services.openaiService import OpenAIService
+from app.services.openaiService import OpenAIService, APPOINTMENT_INFO_FIELDS
 from app.services.atlasSearchService import DoctorSearchService
-from app.services.appointment_service import create_appointment_logic, update_slot_status_to_booked
+from app.services.appointment_service import book_appointment, SlotUnavailableError
 from app.services.patient_service import get_patient_by_user_id
+from app.services.chat_session_service import chat_sessions
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.database import get_database
 from app.routes.auth_routes import get_current_user
@@ -27,7 +28,10 @@ class ChatMessage(BaseModel):
 
 class ChatRequest(BaseModel):
     message: str
-    conversationHistory: List[ChatMessage]
+    sessionId: Optional[str] = None  # conversation state is kept server-side, per user and session
+    # Only used to start a session from a client-held history (older clients resend it every turn)
+    conversationHistory: List[ChatMessage] = []
+    appointmentInfo: Optional[Dict[str, Any]] = None
 
 
 @router.post("/chat")
@@ -41,19 +45,27 @@ async def chat_endpoint(
         raise HTTPException(status_code=403, detail="Only patients can use the chat")
     
     message = body.message
-    conversation_history = [msg.dict() for msg in body.conversationHistory]
 
     # Get patient profile
     patient = await get_patient_by_user_id(current_user.id)
     if not patient:
         raise HTTPException(status_code=404, detail="Patient profile not found")
 
-    ai_response = openai_service.chat_with_patient(message, conversation_history)
+    session = await chat_sessions.get(current_user.id, body.sessionId)
+    chat_sessions.seed(session, [msg.dict() for msg in body.conversationHistory])
+
+    previous_info = session["appointment_info"]
+    if previous_info is None and body.appointmentInfo is not None:
+        previous_info = {key: value for key, value in body.appointmentInfo.items() if key in APPOINTMENT_INFO_FIELDS}
+
+    # Reply and appointment fields (one structured completion by default, see CHAT_EXTRACTION_MODE),
+    # over the summary and recent turns rather than the whole conversation
+    ai_response = await openai_service.chat_with_extraction(message, chat_sessions.prompt_history(session), previous_info)
 
     if not ai_response.get("success"):
         return {"error": ai_response["message"]}
 
-    extracted_info = openai_service.extract_appointment_info_with_llm(ai_response["conversationHistory"])
+    extracted_info = ai_response["appointmentInfo"]
     clean_extracted_info = {}
 
     for key, value in extracted_info.items():
@@ -134,9 +146,15 @@ These are real doctors from our database who specialize in treating conditions l
                 # Update the AI response to include the real doctor data
                 ai_response["message"] = doctor_message
 
+    # Record the turn as the patient saw it
+    session = await chat_sessions.append_turn(
+        session, message, ai_response["message"], extracted_info, openai_service.summarize_conversation
+    )
+
     return {
         "message": ai_response["message"],
-        "conversationHistory": ai_response["conversationHistory"],
+        "sessionId": session["session_id"],
+        "conversationHistory": chat_sessions.prompt_history(session),
         "appointmentInfo": {
             **appointment_info,
             "id": patient.id,  # Include patient ID for appointment booking
@@ -151,15 +169,14 @@ These are real doctors from our database who specialize in treating conditions l
 
 
 @router.post("/clear-session")
-async def clear_session(current_user: User = Depends(get_current_user)):
-    """Clear the chat session for the current user"""
+async def clear_session(session_id: Optional[str] = None, current_user: User = Depends(get_current_user)):
+    """Clear the chat session (or, without session_id, all chat sessions) of the current user"""
     # Only patients can clear their session
     if current_user.role != "patient":
         raise HTTPException(status_code=403, detail="Only patients can clear their session")
-    
-    # For now, just return success since we're not storing session state on backend
-    # In a real implementation, you might clear conversation history from a database
-    return {"message": "Session cleared successfully"}
+
+    deleted = await chat_sessions.clear(current_user.id, session_id)
+    return {"message": "Session cleared successfully", "deleted": deleted}
 
 
 @router.post("/book-appointment-from-chat")
@@ -192,18 +209,7 @@ async def book_appointment_from_chat(
         if not doctor:
             raise HTTPException(status_code=404, detail=f"Doctor not found for id: {doctor_id}")
 
-        # Check if the slot is still available
-        slot = await db.availabilities.find_one({
-            "doctorId": doctor_id,
-            "date": date,
-            "startTime": time,
-            "status": "Available"
-        })
-        
-        if not slot:
-            raise HTTPException(status_code=400, detail="Selected time slot is no longer available")
-
-        # Create appointment in appointments_new collection
+        # Claim the slot and create the appointment in appointments_new collection
         appointment_data = AppointmentCreate(
             patient_id=patient_id,
             doctor_id=doctor_id,
@@ -212,15 +218,7 @@ async def book_appointment_from_chat(
             condition=condition
         )
 
-        created_appointment = await create_appointment_logic(appointment_data)
-
-        # Update the availability slot status to "Booked"
-        slot_updated = await update_slot_status_to_booked(doctor_id, date, time)
-        
-        if slot_updated:
-            print(f"✅ Successfully updated slot status to 'Booked' for appointment {created_appointment.id}")
-        else:
-            print(f"⚠️ Warning: Could not update slot status for appointment {created_appointment.id}")
+        created_appointment = await book_appointment(appointment_data)
 
         return {
             "success": True,
@@ -228,6 +226,10 @@ async def book_appointment_from_chat(
             "message": "Appointment booked successfully"
         }
 
+    except SlotUnavailableError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         import traceback
         traceback.print_exc()
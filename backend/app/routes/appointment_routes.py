@@ -1,28 +1,36 @@
 # backend/app/routes/appointment_routes.py
 
-from fastapi import APIRouter, HTTPException, UploadFile, File, Depends
+import asyncio
+import json
+from fastapi import APIRouter, HTTPException, UploadFile, File, Depends, Query, Response, WebSocket, WebSocketDisconnect, status
+from typing import Optional
 from app.database import get_database
 from app.schemas.appointment_schema import AppointmentCreate, AppointmentResponse
 from app.services.appointment_service import (
-    create_appointment_logic,
-    get_all_appointments,
+    get_appointments_page,
     get_appointment_by_id,
     get_appointments_by_patient_id,
     delete_appointment, 
     attach_audio_to_appointment,
     update_appointment_logic,
-    update_appointment_status
+    update_appointment_status,
+    book_appointment,
+    SlotUnavailableError
 )
-from app.services.audio_storage_service import save_audio_to_gridfs
-from app.services.consultation_notes_service import save_consultation_note
+from app.services.audio_storage_service import save_upload_to_gridfs, delete_audio_from_gridfs
 from app.services.rag_service import build_vector_store_from_appointment
-from app.utils.transcription import transcribe_audio_from_gridfs
-from app.services.whisper_transcriber_service import merge_segments_by_token_limit, test_whisper_installation
-from app.routes.auth_routes import get_current_user
+from app.services.whisper_transcriber_service import test_whisper_installation
+from app.services.job_queue_service import get_latest_job
+from app.workers.audio_pipeline_worker import enqueue_audio_pipeline
+from app.services.consultation_notes_service import get_transcript_end
+from app.services.live_transcription_service import LiveTranscriptionSession, StreamDecoder, PCM_FORMAT
+from app.services.whisper_transcriber_service import SAMPLE_RATE
+from app.routes.auth_routes import get_current_user, get_user_from_token
 from app.models.user import User
 from app.services.patient_service import get_patient_by_user_id
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/appointments", tags=["Appointments"])
 
@@ -35,7 +43,11 @@ async def create_appointment(
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Only admins can create appointments")
     
-    return await create_appointment_logic(data)
+    # Same slot claim as patient bookings, so an admin can't double-book a slot either
+    try:
+        return await book_appointment(data)
+    except SlotUnavailableError as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
 # POST: Create appointment (patient can create their own)
 @router.post("/patient-create", response_model=AppointmentResponse)
@@ -62,43 +74,49 @@ async def create_patient_appointment(
         if not doctor:
             raise HTTPException(status_code=404, detail=f"Doctor not found for id: {data.doctor_id}")
         
-        # Check if the slot is available
-        slot = await db.availabilities.find_one({
-            "doctorId": data.doctor_id,
-            "date": data.date,
-            "startTime": data.time,
-            "status": "Available"
-        })
-        
-        if not slot:
-            raise HTTPException(status_code=400, detail="Selected time slot is no longer available")
-        
-        # Create appointment
-        created_appointment = await create_appointment_logic(data)
-        
-        # Update the availability slot status to "Booked"
-        from app.services.appointment_service import update_slot_status_to_booked
-        slot_updated = await update_slot_status_to_booked(data.doctor_id, data.date, data.time)
-        
-        if slot_updated:
-            print(f"✅ Successfully updated slot status to 'Booked' for appointment {created_appointment.id}")
-        else:
-            print(f"⚠️ Warning: Could not update slot status for appointment {created_appointment.id}")
-        
-        return created_appointment
+        # Claim the slot and create the appointment
+        return await book_appointment(data)
         
+    except SlotUnavailableError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=400, detail=f"Error creating appointment: {e}")
 
-# GET: All appointments (admin only)
+# GET: All appointments (admin only), paginated via the X-Next-Cursor header
 @router.get("/", response_model=list[AppointmentResponse])
-async def read_all_appointments(current_user: User = Depends(get_current_user)):
+async def read_all_appointments(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    doctor_id: Optional[str] = None,
+    patient_id: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Only admins can view all appointments")
     
-    return await get_all_appointments()
+    try:
+        appointments, next_cursor = await get_appointments_page(
+            limit, cursor,
+            status=status,
+            date_from=date_from,
+            date_to=date_to,
+            doctor_id=doctor_id,
+            patient_id=patient_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return appointments
 
 # GET: Patient's own appointments
 @router.get("/my-appointments", response_model=list[AppointmentResponse])
@@ -212,37 +230,128 @@ async def upload_audio_for_appointment(
         if not patient or appointment.patient_id != patient.id:
             raise HTTPException(status_code=403, detail="Access denied")
     
-    db = get_database()
-    file_bytes = await audio_file.read()
-    print(f"💾 Saving {len(file_bytes)} bytes to GridFS...")
-    file_id = save_audio_to_gridfs(file_bytes, audio_file.filename)
-    print(f"✅ File saved with ID: {file_id}")
+    print(f"💾 Streaming upload to GridFS...")
+    file_id, sha256 = await save_upload_to_gridfs(audio_file)
+    print(f"✅ File saved with ID: {file_id} (sha256 {sha256[:12]}...)")
+
+    # A retried upload of the recording that is currently attached reuses its job. Only the
+    # latest job counts: re-uploading an earlier recording after another one must re-attach it.
+    existing_job = await get_latest_job(appointment_id=appointment_id)
+    if existing_job and existing_job.get("audio_sha256") == sha256 and existing_job["status"] != "failed":
+        await delete_audio_from_gridfs(file_id)
+        print(f"♻️ Same audio already uploaded, reusing job {existing_job['job_id']}")
+        return {
+            "message": "Audio already uploaded, reusing existing transcription",
+            "file_id": existing_job["file_id"],
+            "job_id": existing_job["job_id"],
+            "status": existing_job["status"]
+        }
 
     await attach_audio_to_appointment(appointment_id, file_id)
     print(f"🔗 Audio attached to appointment")
 
-    # Transcribe after saving
-    print(f"🎤 Starting transcription process...")
-    transcript = await transcribe_audio_from_gridfs(db, file_id)
-    print(f"📝 Transcription result: {transcript}")
+    # Transcription, chunking, saving the note and embedding run in a background worker
+    job = await enqueue_audio_pipeline(appointment_id, file_id, sha256)
+    print(f"📬 Queued processing job {job['job_id']}")
+
+    return {
+        "message": "Audio uploaded, transcription queued",
+        "file_id": str(file_id),
+        "job_id": job["job_id"],
+        "status": job["status"]
+    }
+
 
-    segments = transcript.get("segments", [])
-    print(f"📊 Found {len(segments)} segments")
+# WebSocket: Live transcription during a consultation
+@router.websocket("/{appointment_id}/live-transcription")
+async def live_transcription(
+    websocket: WebSocket,
+    appointment_id: str,
+    token: str = Query(...),
+    format: str = Query(PCM_FORMAT, description="pcm_s16le (16 kHz mono) or any container ffmpeg can stream, e.g. webm")
+):
+    """
+    Stream audio frames (binary messages) and receive transcript segments back.
 
-    #Divide into chunks
-    transcript = merge_segments_by_token_limit(segments, max_tokens=300)
-    print(f"📦 Created {len(transcript)} chunks")
+    The server sends {"type": "partial"} segments that may still change and
+    {"type": "final"} segments, which are already saved to the consultation
+    note. Send {"type": "stop"} (or disconnect) to finish; the remaining
+    audio is finalized and the vector store rebuilt.
+    """
+    # Browsers can't set an Authorization header on a WebSocket, so the token comes as a query parameter
+    try:
+        current_user = await get_user_from_token(token)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
 
-    # Saving to consultation notes
-    print(f"💾 Saving to consultation notes...")
-    await save_consultation_note(appointment_id, transcript)
-    print(f"✅ Consultation note saved")
+    appointment = await get_appointment_by_id(appointment_id)
+    if not appointment:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    if current_user.role == "patient":
+        patient = await get_patient_by_user_id(current_user.id)
+        if not patient or appointment.patient_id != patient.id:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
 
-    print(f"🔍 Building vector store...")
-    await build_vector_store_from_appointment(appointment_id)
-    print(f"✅ Vector store built")
+    await websocket.accept()
+    state = {"connected": True}
 
-    return {"message": "Audio uploaded and transcribed", "file_id": str(file_id), "transcript": transcript}
+    async def send(message):
+        if state["connected"]:
+            try:
+                await websocket.send_json(message)
+            except Exception:
+                state["connected"] = False
+
+    # A reconnect continues the timeline of the note written so far
+    start_offset = await get_transcript_end(appointment_id)
+    session = LiveTranscriptionSession(appointment_id, send, start_offset=start_offset)
+    decoder = None
+    if format != PCM_FORMAT:
+        decoder = StreamDecoder(session.add_pcm)
+        await decoder.start()
+    await send({"type": "ready", "offset": start_offset, "sample_rate": SAMPLE_RATE})
+    print(f"🎙️ Live transcription started for appointment {appointment_id} ({format})")
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                state["connected"] = False
+                break
+            if message.get("bytes"):
+                if decoder:
+                    await decoder.write(message["bytes"])
+                else:
+                    session.add_pcm(message["bytes"])
+                session.maybe_transcribe()
+            elif message.get("text"):
+                try:
+                    command = json.loads(message["text"])
+                except ValueError:
+                    continue
+                if command.get("type") == "stop":
+                    break
+    except WebSocketDisconnect:
+        state["connected"] = False
+    except Exception as e:
+        # e.g. ffmpeg exited (BrokenPipeError); keep what was received so far
+        print(f"❌ Live transcription stream error for appointment {appointment_id}: {e}")
+        await send({"type": "error", "detail": str(e)})
+    finally:
+        # Always stop ffmpeg and finalize the buffered audio, however the stream ended
+        if decoder:
+            await decoder.close()
+        finalized = await session.finish()
+    print(f"✅ Live transcription finished for appointment {appointment_id}: {finalized} segments")
+
+    if finalized:
+        await build_vector_store_from_appointment(appointment_id)
+    await send({"type": "done", "segments": finalized})
+    if state["connected"]:
+        await websocket.close()
 
 
 # GET: Check transcription status for an appointment
@@ -264,6 +373,22 @@ async def get_transcription_status(
         if not patient or appointment.patient_id != patient.id:
             raise HTTPException(status_code=403, detail="Access denied")
     
+    # Report progress from the processing job, if the audio went through the job queue
+    job = await get_latest_job(appointment_id=appointment_id)
+    if job and job["status"] != "completed":
+        return {
+            "status": "failed" if job["status"] == "failed" else "processing",
+            "message": job.get("error") or f"Job is {job['status']}",
+            "job_id": job["job_id"],
+            "job_status": job["status"],
+            "stage": job.get("stage"),
+            "stages": {
+                name: job["stages"].get(name, {}).get("status")
+                for name in job.get("stage_order", job["stages"].keys())
+            },
+            "attempts": job.get("attempts", 0)
+        }
+
     # Check if consultation note exists
     db = get_database()
     consultation_note = await db.consultation_notes.find_one({"appointment_id": appointment_id})
@@ -333,7 +458,7 @@ async def rebuild_vector_store(
 async def test_whisper():
     """Test if Whisper is properly installed and working"""
     try:
-        result = test_whisper_installation()
+        result = await asyncio.to_thread(test_whisper_installation)
         return {
             "status": "success" if result else "failed",
             "message": "Whisper test completed",
@@ -1,14 +1,62 @@
 # backend/app/routes/audio_routes.py
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Request, Response
 from fastapi.responses import StreamingResponse
-from app.services.audio_storage_service import save_audio_to_gridfs, get_audio_from_gridfs
+from app.services.audio_storage_service import save_upload_to_gridfs, open_audio_from_gridfs, iter_gridfs_range
 from app.routes.auth_routes import get_current_user
 from app.models.user import User
-import io
+from bson.errors import InvalidId
+from gridfs.errors import NoFile
+from typing import Optional, Tuple
+import mimetypes
+import os
 
 router = APIRouter(prefix="/audio", tags=["Audio"])
 
+# Audio types that mimetypes doesn't reliably know about
+AUDIO_MEDIA_TYPES = {
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+    ".m4a": "audio/mp4",
+    ".ogg": "audio/ogg",
+}
+
+
+def _media_type(filename: str, metadata: Optional[dict]) -> str:
+    if metadata and metadata.get("contentType"):
+        return metadata["contentType"]
+    _, ext = os.path.splitext(filename or "")
+    return AUDIO_MEDIA_TYPES.get(ext.lower()) or mimetypes.guess_type(filename or "")[0] or "application/octet-stream"
+
+
+def _parse_range(range_header: str, length: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single 'bytes=' range into inclusive (start, end) offsets.
+
+    Returns None if the header should be ignored (malformed or multiple ranges),
+    and raises ValueError if the range cannot be satisfied.
+    """
+    if not range_header.startswith("bytes=") or "," in range_header:
+        return None
+    start_str, sep, end_str = range_header[len("bytes="):].strip().partition("-")
+    if not sep or not start_str + end_str or not all(part == "" or part.isdigit() for part in (start_str, end_str)):
+        return None
+
+    if start_str == "":
+        # Suffix range: the last N bytes
+        suffix = int(end_str)
+        if suffix == 0:
+            raise ValueError("Range not satisfiable")
+        return max(length - suffix, 0), length - 1
+
+    start = int(start_str)
+    end = int(end_str) if end_str else length - 1
+    if start > end:
+        return None
+    if start >= length:
+        raise ValueError("Range not satisfiable")
+    return start, min(end, length - 1)
+
 
 @router.post("/upload")
 async def upload_audio(
@@ -22,14 +70,14 @@ async def upload_audio(
     if not file.filename.endswith((".mp3", ".wav", ".m4a", ".ogg")):
         raise HTTPException(status_code=400, detail="Invalid audio format")
 
-    contents = await file.read()
-    file_id = save_audio_to_gridfs(contents, file.filename)
-    return {"file_id": file_id}
+    file_id, sha256 = await save_upload_to_gridfs(file)
+    return {"file_id": file_id, "sha256": sha256}
 
 
 @router.get("/stream/{file_id}")
 async def stream_audio(
     file_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user)
 ):
     # Only patients can stream audio
@@ -37,7 +85,42 @@ async def stream_audio(
         raise HTTPException(status_code=403, detail="Only patients can access audio")
     
     try:
-        audio_bytes = get_audio_from_gridfs(file_id)
-        return StreamingResponse(io.BytesIO(audio_bytes), media_type="audio/mpeg")
-    except Exception:
+        grid_out = await open_audio_from_gridfs(file_id)
+    except (NoFile, InvalidId):
         raise HTTPException(status_code=404, detail="Audio not found")
+
+    length = grid_out.length
+    md5 = getattr(grid_out, "md5", None)
+    etag = f'"{md5}"' if md5 else f'"{file_id}-{int(grid_out.upload_date.timestamp())}-{length}"'
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+    }
+
+    # The client already has this exact file
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]):
+        return Response(status_code=304, headers=headers)
+
+    media_type = _media_type(grid_out.filename, grid_out.metadata)
+    start, end = 0, length - 1
+    status_code = 200
+
+    range_header = request.headers.get("range")
+    if range_header and length > 0:
+        try:
+            byte_range = _parse_range(range_header, length)
+        except ValueError:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{length}"})
+        if byte_range:
+            start, end = byte_range
+            status_code = 206
+            headers["Content-Range"] = f"bytes {start}-{end}/{length}"
+
+    headers["Content-Length"] = str(end - start + 1 if length > 0 else 0)
+    return StreamingResponse(
+        iter_gridfs_range(grid_out, start, end),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers
+    )
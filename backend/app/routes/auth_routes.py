@@ -8,29 +8,50 @@ from app.schemas.auth_schema import (
 )
 from app.services.auth_service import register_patient, login_user, verify_token, get_user_by_contact
 from app.models.user import User
+from app.services.principal_cache import principal_cache, Principal
+from app.services.password_service import password_hasher
+from app.services.embedding_service import embedding_service
+from app.services.llm_client import llm_client
+from app.database import get_database
+from app.models.patient import Patient
+from app.utils.serializers import serialize_mongo_doc
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 security = HTTPBearer()
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
-    token = credentials.credentials
-    print(f"Received token: {token[:20]}..." if token else "No token")
-    
+    return await get_user_from_token(credentials.credentials)
+
+async def get_user_from_token(token: str) -> User:
+    """Resolve a bearer token to its user (also used by WebSocket routes, which can't send headers)."""
     payload = verify_token(token)
-    print(f"Token payload: {payload}")
     
     if payload is None:
         print("Token verification failed")
         raise HTTPException(status_code=401, detail="Invalid token")
     
+    # Serve the user (and patient profile) from the principal cache when possible
+    subject = payload.get("sub")
+    cached = principal_cache.get(subject)
+    if cached is not None:
+        return cached.user
+    
     # Get user from database
-    user = await get_user_by_contact(payload.get("sub"))
+    user = await get_user_by_contact(subject)
     print(f"Found user: {user.email if user else 'None'}")
     
     if user is None:
         print("User not found in database")
         raise HTTPException(status_code=401, detail="User not found")
     
+    # Resolve the patient profile together with the user, since most patient routes need it
+    patient = None
+    if user.role == "patient":
+        db = get_database()
+        doc = await db.patients_new.find_one({"user_id": user.id})
+        patient = Patient(**serialize_mongo_doc(doc)) if doc else None
+    
+    principal_cache.set(subject, Principal(user=user, patient=patient))
     return user
 
 @router.post("/patient/signup", response_model=dict)
@@ -78,4 +99,23 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
         "contact": current_user.email,  # Return contact instead of email
         "role": current_user.role,
         "is_active": current_user.is_active
-    } 
\ No newline at end of file
+    } 
+
+@router.get("/metrics/password-hashing")
+async def get_password_hashing_metrics(current_user: User = Depends(get_current_user)):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can view metrics")
+    return password_hasher.stats()
+
+@router.get("/metrics/embeddings")
+async def get_embedding_metrics(current_user: User = Depends(get_current_user)):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can view metrics")
+    return embedding_service.stats()
+
+
+@router.get("/metrics/llm")
+async def get_llm_metrics(current_user: User = Depends(get_current_user)):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can view metrics")
+    return llm_client.stats()
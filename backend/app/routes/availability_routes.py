@@ -1,14 +1,16 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from typing import Optional
 from app.schemas.availability_schema import DoctorAvailabilityCreate, DoctorAvailabilityResponse
 from app.services.availability_service import (
     create_availability_logic,
-    get_all_availabilities,
+    get_availabilities_page,
     get_availabilities_by_doctor,
     delete_availability_by_id,
     update_availability
 )
 from app.routes.auth_routes import get_current_user
 from app.models.user import User
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/availabilities", tags=["Doctor Availability"])
 
@@ -25,8 +27,29 @@ async def create_availability(
 
 
 @router.get("/", response_model=list[DoctorAvailabilityResponse])
-async def read_all_availabilities(current_user: User = Depends(get_current_user)):
-    slots = await get_all_availabilities()
+async def read_all_availabilities(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    doctorId: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        slots, next_cursor = await get_availabilities_page(
+            limit, cursor,
+            status=status,
+            date_from=date_from,
+            date_to=date_to,
+            doctor_id=doctorId
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return slots
 
 
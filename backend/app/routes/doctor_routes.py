@@ -1,14 +1,16 @@
 # backend/app/routes/doctor_routes.py
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from typing import Optional
 from app.schemas.doctor_schema import DoctorCreate, DoctorResponse
 from app.services.doctor_service import (
     create_doctor_logic,
-    get_all_doctors,
+    get_doctors_page,
     get_doctor_by_id,
     delete_doctor
 )
 from app.routes.auth_routes import get_current_user
 from app.models.user import User
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/doctors", tags=["Doctors"])
 
@@ -22,10 +24,28 @@ async def create_doctor(
         raise HTTPException(status_code=403, detail="Only admins can create doctors")
     return await create_doctor_logic(doctor)
 
-# GET: List all doctors (Admin and Patient can view)
+# GET: List doctors (Admin and Patient can view), paginated via the X-Next-Cursor header
 @router.get("/", response_model=list[DoctorResponse])
-async def get_doctors(current_user: User = Depends(get_current_user)):
-    return await get_all_doctors()
+async def get_doctors(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    availability: Optional[str] = None,
+    specialization: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        doctors, next_cursor = await get_doctors_page(
+            limit, cursor,
+            availability=availability,
+            specialization=specialization
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return doctors
 
 # GET: Get doctor by ID (Admin and Patient can view)
 @router.get("/{doctor_id}", response_model=DoctorResponse)
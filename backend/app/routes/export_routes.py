@@ -0,0 +1,59 @@
+# backend/app/routes/export_routes.py
+
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
+from typing import Literal, Optional
+from app.services.export_service import (
+    EXPORTABLE_COLLECTIONS,
+    CSV_COLUMNS,
+    DEFAULT_BATCH_SIZE,
+    build_export_cursor,
+    stream_ndjson,
+    stream_csv
+)
+from app.routes.auth_routes import get_current_user
+from app.models.user import User
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+
+# GET: Stream a whole collection as NDJSON or CSV (admin only)
+@router.get("/{collection_name}")
+async def export_collection(
+    collection_name: str,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    batch_size: int = Query(DEFAULT_BATCH_SIZE, ge=1, le=10000),
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can export data")
+
+    if collection_name not in EXPORTABLE_COLLECTIONS:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown export. Must be one of: {list(EXPORTABLE_COLLECTIONS)}"
+        )
+
+    if format == "csv" and collection_name not in CSV_COLUMNS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{collection_name} has no fixed set of columns; export it as ndjson"
+        )
+
+    cursor = build_export_cursor(collection_name, batch_size, date_from, date_to)
+
+    if format == "csv":
+        body = stream_csv(cursor, CSV_COLUMNS[collection_name])
+        media_type = "text/csv"
+    else:
+        body = stream_ndjson(cursor)
+        media_type = "application/x-ndjson"
+
+    filename = f"{collection_name}.{format}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
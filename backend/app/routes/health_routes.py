@@ -0,0 +1,25 @@
+# backend/app/routes/health_routes.py
+
+from fastapi import APIRouter, Response
+from app.config.settings import settings
+from app.services.model_registry import model_registry
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+@router.get("/live")
+async def liveness():
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+async def readiness(response: Response):
+    """503 until every model in MODEL_WARMUP is loaded; reports the state of all of them."""
+    ready = model_registry.is_ready(settings.MODEL_WARMUP)
+    if not ready:
+        response.status_code = 503
+    return {
+        "status": "ready" if ready else "loading",
+        "required": settings.MODEL_WARMUP,
+        "models": model_registry.status()
+    }
@@ -1,20 +1,31 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from typing import List, Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
 from app.database import get_db
 from app.schemas.message_schema import MessageCreate, MessageResponse
 from app.models.message import Message as MessageModel
 from app.utils.serializers import serialize_mongo_doc
+from app.utils.pagination import fetch_page, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/messages", tags=["Messages"])
 
 
 @router.get("/", response_model=List[MessageResponse])
-async def list_messages(db: AsyncIOMotorDatabase = Depends(get_db)):
-    cursor = db.messages.find()
-    messages = [MessageResponse(**serialize_mongo_doc(doc)) async for doc in cursor]
-    return messages
+async def list_messages(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncIOMotorDatabase = Depends(get_db)
+):
+    try:
+        docs, next_cursor = await fetch_page(db.messages, {}, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return [MessageResponse(**serialize_mongo_doc(doc)) for doc in docs]
 
 
 @router.post("/", response_model=MessageResponse)
@@ -19,11 +19,11 @@ class SummaryResponse(BaseModel):
 # Chat endpoint
 @router.post("/chatV", response_model=ChatResponse)
 async def chat_endpoint(req: ChatRequest):
-    response = generate_answer(req.message, req.appointment_id)
+    response = await generate_answer(req.message, req.appointment_id)
     return ChatResponse(response=response)
 
 @router.get("/appointments/{appointment_id}/summary", response_model=SummaryResponse)
 async def summary_endpoint(appointment_id: str):
-    chunks = retrieve_relevant_chunks("summary", appointment_id=appointment_id, top_k=5)
-    summary = summarize_key_points(chunks)
+    chunks = await retrieve_relevant_chunks("summary", appointment_id=appointment_id, top_k=5)
+    summary = await summarize_key_points(chunks)
     return SummaryResponse(summary=summary)
\ No newline at end of file
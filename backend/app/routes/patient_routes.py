@@ -1,8 +1,9 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from typing import Optional
 from app.schemas.patient_schema import PatientCreate, PatientResponse, PatientUpdate
 from app.services.patient_service import (
     create_patient_logic,
-    get_all_patients,
+    get_patients_page,
     get_patient_by_id,
     get_patient_by_user_id,
     delete_patient, 
@@ -10,6 +11,7 @@ from app.services.patient_service import (
 )
 from app.routes.auth_routes import get_current_user
 from app.models.user import User
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/patients", tags=["Patients"])
 
@@ -25,13 +27,24 @@ async def create_patient(
     created = await create_patient_logic(patient, current_user.id)
     return PatientResponse(**created.dict())
 
-# Admin only - READ all
+# Admin only - READ all, paginated via the X-Next-Cursor header
 @router.get("/", response_model=list[PatientResponse])
-async def list_patients(current_user: User = Depends(get_current_user)):
+async def list_patients(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Only admins can view all patients")
     
-    patients = await get_all_patients()
+    try:
+        patients, next_cursor = await get_patients_page(limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return [PatientResponse(**patient.dict()) for patient in patients]
 
 # Admin only - READ by ID
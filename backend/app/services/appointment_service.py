@@ -4,9 +4,12 @@ from app.schemas.appointment_schema import AppointmentCreate
 from app.models.appointment import Appointment
 from app.database import get_database
 from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 from datetime import datetime
 from app.utils.serializers import serialize_mongo_doc
-from typing import List
+from app.utils.pagination import fetch_page, date_range_filter
+from typing import List, Optional, Tuple
 import uuid
 
 
@@ -24,129 +27,193 @@ async def create_appointment_logic(data: AppointmentCreate) -> Appointment:
         "updated_at": now
     })
 
-    result = await db.appointments_new.insert_one(appointment_dict)
-    created_doc = await db.appointments_new.find_one({"_id": result.inserted_id})
-    return Appointment(**serialize_mongo_doc(created_doc))
+    # insert_one sets appointment_dict["_id"], so no need to read the document back
+    await db.appointments_new.insert_one(appointment_dict)
+    return Appointment(**serialize_mongo_doc(appointment_dict))
 
-# READ ALL Appointments
-async def get_all_appointments() -> List[Appointment]:
+
+class SlotUnavailableError(ValueError):
+    """Raised when the requested availability slot is not (or no longer) available."""
+
+
+# BOOK: Claim the slot atomically, then create the appointment
+async def book_appointment(data: AppointmentCreate) -> Appointment:
+    """
+    Book an appointment for an availability slot.
+
+    The slot is claimed first with a single conditional update
+    (Available -> Booked), so only one of several concurrent requests for
+    the same slot can win. If creating the appointment then fails, the slot
+    is released again.
+
+    Args:
+        data: The appointment to create
+
+    Returns:
+        Appointment: The created appointment
+
+    Raises:
+        SlotUnavailableError: If the slot does not exist or is already booked
+    """
     db = get_database()
-    cursor = db.appointments_new.find()
+
+    slot = await db.availabilities.find_one_and_update(
+        {
+            "doctorId": data.doctor_id,
+            "date": data.date,
+            "startTime": data.time,
+            "status": "Available"
+        },
+        {"$set": {"status": "Booked", "updated_at": datetime.utcnow()}},
+        projection={"_id": 1},
+        return_document=ReturnDocument.AFTER
+    )
+    if not slot:
+        raise SlotUnavailableError("Selected time slot is no longer available")
+
+    try:
+        return await create_appointment_logic(data)
+    except Exception as e:
+        # Compensate: give the slot back so it can be booked again
+        await db.availabilities.update_one(
+            {"_id": slot["_id"], "status": "Booked"},
+            {"$set": {"status": "Available", "updated_at": datetime.utcnow()}}
+        )
+        print(f"❌ Booking failed, released slot for doctor {data.doctor_id} on {data.date} at {data.time}: {e}")
+        if isinstance(e, DuplicateKeyError):
+            raise SlotUnavailableError("Selected time slot is no longer available")
+        raise
+
+# Resolve patient/doctor names for a batch of appointment docs in two queries
+async def lookup_appointment_names(db, docs: List[dict], patient_name: str | None = None) -> List[Tuple[str, str]]:
+    """
+    Look up the patient and doctor names for a whole batch of appointment docs.
+
+    Instead of looking up the patient and doctor for every appointment, all ids are
+    collected first and fetched with one `$in` query per collection.
+
+    Args:
+        db: The database instance
+        docs: Raw appointment documents from appointments_new
+        patient_name: Fixed patient name to use (skips the patient lookup)
+
+    Returns:
+        List[Tuple[str, str]]: (patientName, doctorName) per doc, in the same order as docs
+    """
+    patient_ids = set()
+    doctor_ids = set()
+    for doc in docs:
+        if patient_name is None and doc.get("patient_id"):
+            patient_ids.add(doc["patient_id"])
+        if doc.get("doctor_id") and ObjectId.is_valid(doc["doctor_id"]):
+            doctor_ids.add(doc["doctor_id"])
+
+    # Patients may be referenced by ObjectId (old format) or UUID string (new format)
+    patients_by_oid = {}
+    patients_by_uuid = {}
+    if patient_ids:
+        patient_oids = [ObjectId(pid) for pid in patient_ids if ObjectId.is_valid(pid)]
+        cursor = db.patients_new.find(
+            {"$or": [{"_id": {"$in": patient_oids}}, {"id": {"$in": list(patient_ids)}}]},
+            {"_id": 1, "id": 1, "name": 1}
+        )
+        async for patient in cursor:
+            patients_by_oid[str(patient["_id"])] = patient
+            if patient.get("id"):
+                patients_by_uuid[patient["id"]] = patient
+
+    doctors_by_id = {}
+    if doctor_ids:
+        cursor = db.doctors.find(
+            {"_id": {"$in": [ObjectId(did) for did in doctor_ids]}},
+            {"_id": 1, "name": 1}
+        )
+        async for doctor in cursor:
+            doctors_by_id[str(doctor["_id"])] = doctor
+
+    names = []
+    for doc in docs:
+        pid = doc.get("patient_id")
+        patient = (patients_by_oid.get(pid) or patients_by_uuid.get(pid)) if pid else None
+        doctor = doctors_by_id.get(doc.get("doctor_id"))
+        if patient_name is None:
+            patient_name_for_doc = patient.get("name", "Unknown") if patient else "Unknown"
+        else:
+            patient_name_for_doc = patient_name
+        names.append((patient_name_for_doc, doctor.get("name", "Unknown") if doctor else "Unknown"))
+
+    return names
+
+
+async def _enrich_appointment_docs(db, docs: List[dict], patient_name: str | None = None) -> List[Appointment]:
+    """Build Appointment models with patientName/doctorName for a whole batch of docs."""
+    names = await lookup_appointment_names(db, docs, patient_name)
+
     appointments = []
-    
-    async for doc in cursor:
-        # Get patient and doctor names
-        # Try to find patient by ObjectId first, then by UUID string
-        patient = None
-        patient_id = doc.get("patient_id")
-        if patient_id:
-            # Try as ObjectId first (old format)
-            try:
-                from bson import ObjectId
-                patient = await db.patients_new.find_one({"_id": ObjectId(patient_id)})
-            except:
-                pass
-            
-            # If not found, try as UUID string (new format)
-            if not patient:
-                patient = await db.patients_new.find_one({"id": patient_id})
-        
-        # Get doctor by ObjectId
-        doctor = None
-        doctor_id = doc.get("doctor_id")
-        if doctor_id:
-            try:
-                from bson import ObjectId
-                doctor = await db.doctors.find_one({"_id": ObjectId(doctor_id)})
-            except:
-                pass
-        
+    for doc, (patient_name_for_doc, doctor_name) in zip(docs, names):
+        condition = doc.get("condition", "")
         appointment_data = serialize_mongo_doc(doc)
-        appointment_data["patientName"] = patient.get("name", "Unknown") if patient else "Unknown"
-        appointment_data["doctorName"] = doctor.get("name", "Unknown") if doctor else "Unknown"
+        appointment_data["patientName"] = patient_name_for_doc
+        appointment_data["doctorName"] = doctor_name
         appointment_data["type"] = "Consultation"  # Default type
-        appointment_data["notes"] = doc.get("condition", "")  # Use condition as notes
-        
+        appointment_data["notes"] = condition  # Use condition as notes
+
         appointments.append(Appointment(**appointment_data))
-    
+
     return appointments
 
+
+def _appointment_id_filter(appointment_id: str) -> dict:
+    """Match an appointment by either its 'id' field or its '_id' field."""
+    if ObjectId.is_valid(appointment_id):
+        return {"$or": [{"id": appointment_id}, {"_id": ObjectId(appointment_id)}]}
+    return {"id": appointment_id}
+
+
+# READ ALL Appointments
+async def get_all_appointments() -> List[Appointment]:
+    db = get_database()
+    docs = await db.appointments_new.find().to_list(length=None)
+    return await _enrich_appointment_docs(db, docs)
+
+# READ a page of Appointments (keyset pagination + server-side filters)
+async def get_appointments_page(
+    limit: int,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    doctor_id: Optional[str] = None,
+    patient_id: Optional[str] = None,
+) -> Tuple[List[Appointment], Optional[str]]:
+    db = get_database()
+    query = date_range_filter("date", date_from, date_to)
+    if status:
+        query["status"] = status
+    if doctor_id:
+        query["doctor_id"] = doctor_id
+    if patient_id:
+        query["patient_id"] = patient_id
+
+    docs, next_cursor = await fetch_page(db.appointments_new, query, limit, cursor)
+    return await _enrich_appointment_docs(db, docs), next_cursor
+
 # READ by ID
 async def get_appointment_by_id(appointment_id: str) -> Appointment | None:
     db = get_database()
-    # Try to find by either 'id' field or '_id' field
-    try:
-        from bson import ObjectId
-        doc = await db.appointments_new.find_one({
-            "$or": [{"id": appointment_id}, {"_id": ObjectId(appointment_id)}]
-        })
-    except:
-        # If ObjectId conversion fails, just search by id field
-        doc = await db.appointments_new.find_one({"id": appointment_id})
-    
+    doc = await db.appointments_new.find_one(_appointment_id_filter(appointment_id))
     if not doc:
         return None
-    
-    # Get patient and doctor names
-    # Try to find patient by ObjectId first, then by UUID string
-    patient = None
-    patient_id = doc.get("patient_id")
-    if patient_id:
-        # Try as ObjectId first (old format)
-        try:
-            from bson import ObjectId
-            patient = await db.patients_new.find_one({"_id": ObjectId(patient_id)})
-        except:
-            pass
-        
-        # If not found, try as UUID string (new format)
-        if not patient:
-            patient = await db.patients_new.find_one({"id": patient_id})
-    
-    # Get doctor by ObjectId
-    doctor = None
-    doctor_id = doc.get("doctor_id")
-    if doctor_id:
-        try:
-            from bson import ObjectId
-            doctor = await db.doctors.find_one({"_id": ObjectId(doctor_id)})
-        except:
-            pass
-    
-    appointment_data = serialize_mongo_doc(doc)
-    appointment_data["patientName"] = patient.get("name", "Unknown") if patient else "Unknown"
-    appointment_data["doctorName"] = doctor.get("name", "Unknown") if doctor else "Unknown"
-    appointment_data["type"] = "Consultation"  # Default type
-    appointment_data["notes"] = doc.get("condition", "")  # Use condition as notes
-    
-    return Appointment(**appointment_data)
+
+    appointments = await _enrich_appointment_docs(db, [doc])
+    return appointments[0]
 
 # READ by Patient ID
 async def get_appointments_by_patient_id(patient_id: str) -> List[Appointment]:
     db = get_database()
-    cursor = db.appointments_new.find({"patient_id": patient_id})
-    appointments = []
-    
-    async for doc in cursor:
-        # Get doctor name
-        doctor = None
-        doctor_id = doc.get("doctor_id")
-        if doctor_id:
-            try:
-                from bson import ObjectId
-                doctor = await db.doctors.find_one({"_id": ObjectId(doctor_id)})
-            except:
-                pass
-        
-        appointment_data = serialize_mongo_doc(doc)
-        appointment_data["patientName"] = "You"  # Since it's the patient's own appointments
-        appointment_data["doctorName"] = doctor.get("name", "Unknown") if doctor else "Unknown"
-        appointment_data["type"] = "Consultation"  # Default type
-        appointment_data["notes"] = doc.get("condition", "")  # Use condition as notes
-        
-        appointments.append(Appointment(**appointment_data))
-    
-    return appointments
+    docs = await db.appointments_new.find({"patient_id": patient_id}).to_list(length=None)
+    # Since it's the patient's own appointments
+    return await _enrich_appointment_docs(db, docs, patient_name="You")
 
 # DELETE
 async def delete_appointment(appointment_id: str) -> bool:
@@ -172,30 +239,10 @@ async def update_appointment_status(appointment_id: str, status: str) -> Appoint
     """Update only the status of an appointment."""
     print(f"🔍 update_appointment_status called with id: {appointment_id}, status: {status}")
     db = get_database()
-    
-    # First, let's check if the appointment exists
-    existing = await db.appointments_new.find_one({"id": appointment_id})
-    print(f"🔍 Existing appointment found: {existing is not None}")
-    if existing:
-        print(f"🔍 Current appointment data: {existing}")
-    
-    # Let's also check what appointments exist in the database
-    all_appointments = await db.appointments_new.find().to_list(length=10)
-    print(f"🔍 All appointments in database: {[app.get('id') for app in all_appointments]}")
-    
-    # Try searching by ObjectId as well
-    try:
-        from bson import ObjectId
-        existing_by_objectid = await db.appointments_new.find_one({"_id": ObjectId(appointment_id)})
-        print(f"🔍 Found by ObjectId: {existing_by_objectid is not None}")
-        if existing_by_objectid:
-            print(f"🔍 Appointment found by ObjectId: {existing_by_objectid}")
-    except:
-        print(f"🔍 Could not search by ObjectId for: {appointment_id}")
-    
-    # Try to find and update by either 'id' field or '_id' field
+
+    # Find and update by either 'id' field or '_id' field
     result = await db.appointments_new.find_one_and_update(
-        {"$or": [{"id": appointment_id}, {"_id": ObjectId(appointment_id)}]},
+        _appointment_id_filter(appointment_id),
         {"$set": {"status": status, "updated_at": datetime.utcnow()}},
         return_document=True
     )
@@ -203,37 +250,10 @@ async def update_appointment_status(appointment_id: str, status: str) -> Appoint
     if not result:
         print(f"❌ No appointment found with id: {appointment_id}")
         return None
-    
+
     # Get patient and doctor names for the response
-    doc = result
-    patient = None
-    patient_id = doc.get("patient_id")
-    if patient_id:
-        try:
-            from bson import ObjectId
-            patient = await db.patients_new.find_one({"_id": ObjectId(patient_id)})
-        except:
-            pass
-        
-        if not patient:
-            patient = await db.patients_new.find_one({"id": patient_id})
-    
-    doctor = None
-    doctor_id = doc.get("doctor_id")
-    if doctor_id:
-        try:
-            from bson import ObjectId
-            doctor = await db.doctors.find_one({"_id": ObjectId(doctor_id)})
-        except:
-            pass
-    
-    appointment_data = serialize_mongo_doc(doc)
-    appointment_data["patientName"] = patient.get("name", "Unknown") if patient else "Unknown"
-    appointment_data["doctorName"] = doctor.get("name", "Unknown") if doctor else "Unknown"
-    appointment_data["type"] = "Consultation"  # Default type
-    appointment_data["notes"] = doc.get("condition", "")  # Use condition as notes
-    
-    return Appointment(**appointment_data)
+    appointments = await _enrich_appointment_docs(db, [result])
+    return appointments[0]
 
 # UPDATE: Add/Update audio file reference
 async def attach_audio_to_appointment(appointment_id: str, audio_file_id: str) -> bool:
@@ -248,46 +268,3 @@ async def attach_audio_to_appointment(appointment_id: str, audio_file_id: str) -
         }
     )
     return result.modified_count == 1
-
-# UPDATE: Update availability slot status to "Booked"
-async def update_slot_status_to_booked(doctor_id: str, date: str, time: str) -> bool:
-    """
-    Update the status of an availability slot to "Booked" when an appointment is created.
-    
-    Args:
-        doctor_id: The ID of the doctor
-        date: The appointment date (YYYY-MM-DD format)
-        time: The appointment time (HH:MM format)
-    
-    Returns:
-        bool: True if slot was updated successfully, False otherwise
-    """
-    try:
-        db = get_database()
-        
-        # Find and update the specific slot
-        result = await db.availabilities.update_one(
-            {
-                "doctorId": doctor_id,
-                "date": date,
-                "startTime": time,
-                "status": "Available"  # Only update if still available
-            },
-            {
-                "$set": {
-                    "status": "Booked",
-                    "updated_at": datetime.utcnow()
-                }
-            }
-        )
-        
-        if result.modified_count == 1:
-            print(f"✅ Successfully updated slot status to 'Booked' for doctor {doctor_id} on {date} at {time}")
-            return True
-        else:
-            print(f"⚠️ No slot found or already booked for doctor {doctor_id} on {date} at {time}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Error updating slot status: {e}")
-        return False
\ No newline at end of file
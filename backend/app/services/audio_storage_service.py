@@ -1,17 +1,88 @@
 # backend/app/services/audio_storage_service.py
 
-import gridfs
-from app.database import sync_db
+import hashlib
+from typing import AsyncIterator, Tuple
+from fastapi import UploadFile
+from motor.motor_asyncio import AsyncIOMotorGridFSBucket, AsyncIOMotorGridOut
+from app.database import get_database
 from bson import ObjectId
 
-fs = gridfs.GridFS(sync_db)
+# Size of the pieces read from the upload and written to GridFS
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
+# Size of the pieces sent to the client when streaming a file back
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
 
-def save_audio_to_gridfs(file_bytes: bytes, filename: str) -> str:
-    file_id = fs.put(file_bytes, filename=filename)
+
+def get_gridfs_bucket() -> AsyncIOMotorGridFSBucket:
+    return AsyncIOMotorGridFSBucket(get_database())
+
+
+async def save_upload_to_gridfs(upload: UploadFile, filename: str | None = None) -> Tuple[str, str]:
+    """
+    Stream an uploaded file into GridFS chunk by chunk.
+
+    Only one chunk is held in memory at a time, so large recordings
+    don't have to be read into memory before being stored. The SHA-256 of
+    the content is computed on the way through and stored in the file's
+    metadata, so identical re-uploads can be recognised.
+
+    Returns:
+        Tuple[str, str]: The GridFS file id and the content's SHA-256 hex digest
+    """
+    fs = get_gridfs_bucket()
+    grid_in = fs.open_upload_stream(
+        filename or upload.filename,
+        metadata={"contentType": upload.content_type}
+    )
+    digest = hashlib.sha256()
+    try:
+        while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            await grid_in.write(chunk)
+        # Written into the files document when the stream is closed
+        await grid_in.set("metadata", {"contentType": upload.content_type, "sha256": digest.hexdigest()})
+    except Exception:
+        await grid_in.abort()
+        raise
+    await grid_in.close()
+    return str(grid_in._id), digest.hexdigest()
+
+
+async def save_audio_to_gridfs(file_bytes: bytes, filename: str) -> str:
+    fs = get_gridfs_bucket()
+    file_id = await fs.upload_from_stream(filename, file_bytes)
     return str(file_id)
 
 
-def get_audio_from_gridfs(file_id: str) -> bytes:
-    audio = fs.get(ObjectId(file_id))
-    return audio.read()
+async def delete_audio_from_gridfs(file_id: str) -> None:
+    fs = get_gridfs_bucket()
+    await fs.delete(ObjectId(file_id))
+
+
+async def get_audio_from_gridfs(file_id: str) -> bytes:
+    fs = get_gridfs_bucket()
+    grid_out = await fs.open_download_stream(ObjectId(file_id))
+    return await grid_out.read()
+
+
+async def open_audio_from_gridfs(file_id: str) -> AsyncIOMotorGridOut:
+    """Open a GridFS file for reading. Raises gridfs.errors.NoFile if it doesn't exist."""
+    fs = get_gridfs_bucket()
+    return await fs.open_download_stream(ObjectId(file_id))
+
+
+async def iter_gridfs_range(grid_out: AsyncIOMotorGridOut, start: int, end: int) -> AsyncIterator[bytes]:
+    """
+    Yield bytes start..end (inclusive) of a GridFS file in DOWNLOAD_CHUNK_SIZE pieces.
+
+    Only the GridFS chunks covering the requested range are fetched.
+    """
+    grid_out.seek(start)
+    remaining = end - start + 1
+    while remaining > 0:
+        data = await grid_out.read(min(DOWNLOAD_CHUNK_SIZE, remaining))
+        if not data:
+            break
+        remaining -= len(data)
+        yield data
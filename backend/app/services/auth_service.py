@@ -1,26 +1,24 @@
 import jwt
 from datetime import datetime, timedelta
-from passlib.context import CryptContext
 from typing import Optional
 from app.models.user import User
 from app.models.patient import Patient
 from app.schemas.auth_schema import PatientSignupRequest, LoginResponse
 from app.database import get_database
+from app.services.password_service import password_hasher
 import uuid
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # JWT settings
 SECRET_KEY = "your-secret-key-here"  # In production, use environment variable
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+# Password hashing runs bcrypt in a worker pool so it doesn't block the event loop
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify(plain_password, hashed_password)
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+async def get_password_hash(password: str) -> str:
+    return await password_hasher.hash(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -40,7 +38,7 @@ async def create_user(contact: str, password: str, role: str) -> User:
     user = User(
         id=user_id,
         email=contact,  # Store contact in email field for consistency
-        password_hash=get_password_hash(password),
+        password_hash=await get_password_hash(password),
         role=role,
         created_at=now,
         updated_at=now
@@ -60,7 +58,7 @@ async def authenticate_user(contact: str, password: str) -> Optional[User]:
     user = await get_user_by_contact(contact)
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+    if not await verify_password(password, user.password_hash):
         return None
     return user
 
@@ -3,6 +3,8 @@ from app.models.availability import DoctorAvailability
 from app.database import db
 from bson import ObjectId
 from app.utils.serializers import serialize_mongo_doc
+from app.utils.pagination import fetch_page, date_range_filter
+from typing import Optional, Tuple, List
 
 
 # CREATE
@@ -19,6 +21,25 @@ async def get_all_availabilities() -> list[DoctorAvailability]:
     return [DoctorAvailability(**serialize_mongo_doc(doc)) async for doc in cursor]
 
 
+# READ a page (keyset pagination + server-side filters)
+async def get_availabilities_page(
+    limit: int,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    doctor_id: Optional[str] = None,
+) -> Tuple[List[DoctorAvailability], Optional[str]]:
+    query = date_range_filter("date", date_from, date_to)
+    if status:
+        query["status"] = status
+    if doctor_id:
+        query["doctorId"] = doctor_id
+
+    docs, next_cursor = await fetch_page(db.availabilities, query, limit, cursor)
+    return [DoctorAvailability(**serialize_mongo_doc(doc)) for doc in docs], next_cursor
+
+
 # READ BY DOCTOR ID
 async def get_availabilities_by_doctor(doctor_id: str) -> list[DoctorAvailability]:
     cursor = db.availabilities.find({"doctorId": doctor_id})
@@ -0,0 +1,226 @@
+# backend/app/services/chat_session_service.py
+
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from pymongo.errors import DuplicateKeyError
+from app.database import get_database
+from app.config.settings import settings
+
+CHAT_SESSIONS_COLLECTION = "chat_sessions"
+
+DEFAULT_SESSION = "default"
+
+SAVE_ATTEMPTS = 3  # a turn is re-applied on a fresh copy when another process saved the session first
+
+
+def estimate_tokens(text: str) -> int:
+    # ~4 characters per token for English text; close enough for budgeting
+    return len(text or "") // 4 + 1
+
+
+def message_tokens(message: Dict[str, Any]) -> int:
+    return estimate_tokens(message.get("content", "")) + 4  # role and message framing
+
+
+def _new_session(key: str, user_id: str, session_id: str) -> Dict[str, Any]:
+    now = datetime.utcnow()
+    return {
+        "_id": key,
+        "user_id": user_id,
+        "session_id": session_id,
+        "messages": [],  # recent turns, verbatim: {"role", "content"}
+        "summary": "",  # rolling summary of the turns folded out of "messages"
+        "appointment_info": None,  # fields extracted so far (None until the first turn)
+        "version": 0,  # incremented by every save; saves are conditional on it (0 = never saved)
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+class ChatSessionStore:
+    """
+    Server-side state of the appointment chatbot conversations.
+
+    Sessions are stored in Mongo (`chat_sessions`, expired by a TTL index on
+    updated_at) with an in-process LRU in front, so a turn normally costs
+    one write and no read. Each session keeps the recent messages verbatim
+    within a token budget; when they outgrow it, the oldest ones are folded
+    into a rolling summary, so the prompt stays bounded however long the
+    conversation gets.
+
+    Saves are conditional on the session's version, so with several API
+    processes a stale cached copy can never overwrite turns another process
+    wrote: the save fails, the session is reloaded from Mongo and the turn
+    is applied again on the fresh copy. (A stale copy can still be used as
+    the prompt for that one turn; routing a session's turns to one process
+    avoids even that.)
+    """
+
+    def __init__(self, ttl_seconds: int, max_cached: int, token_budget: int, keep_messages: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_cached = max_cached
+        self.token_budget = token_budget
+        self.keep_messages = keep_messages
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    @staticmethod
+    def _key(user_id: str, session_id: Optional[str]) -> str:
+        # Namespaced by user, so a session id can never reach another user's conversation
+        return f"{user_id}:{session_id or DEFAULT_SESSION}"
+
+    def _expired(self, session: Dict[str, Any]) -> bool:
+        return session["updated_at"] < datetime.utcnow() - timedelta(seconds=self.ttl_seconds)
+
+    async def get(self, user_id: str, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """The user's session, or a new empty one."""
+        key = self._key(user_id, session_id)
+        session = self._sessions.get(key)
+        if session is not None and not self._expired(session):
+            self._sessions.move_to_end(key)
+            return session
+
+        return await self._load(key, user_id, session_id or DEFAULT_SESSION)
+
+    async def _load(self, key: str, user_id: str, session_id: str) -> Dict[str, Any]:
+        db = get_database()
+        session = await db[CHAT_SESSIONS_COLLECTION].find_one({"_id": key})
+        if session is None:
+            session = _new_session(key, user_id, session_id)
+        elif self._expired(session):
+            # The TTL monitor only runs once a minute; keep the version so the next save replaces it
+            session = {**_new_session(key, user_id, session_id), "version": session.get("version", 0)}
+        self._remember(session)
+        return session
+
+    def prompt_history(self, session: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Messages to send to the model before the new user message: summary, then recent turns."""
+        history = []
+        if session["summary"]:
+            history.append({"role": "system", "content": f"Summary of the earlier conversation: {session['summary']}"})
+        return history + [{"role": m["role"], "content": m["content"]} for m in session["messages"]]
+
+    def seed(self, session: Dict[str, Any], messages: List[Dict[str, Any]]) -> None:
+        """Start a new session from a history sent by the client (clients that predate server-side state)."""
+        if session["messages"] or session["summary"]:
+            return
+        session["messages"] = [
+            {"role": m["role"], "content": m["content"]}
+            for m in messages
+            if m.get("role") in ("user", "assistant") and m.get("content")
+        ]
+
+    async def append_turn(
+        self,
+        session: Dict[str, Any],
+        user_message: str,
+        reply: str,
+        appointment_info: Optional[Dict[str, Any]],
+        summarize: Callable[[str, List[Dict[str, str]]], Awaitable[str]]
+    ) -> Dict[str, Any]:
+        """
+        Record a turn, compact the history if it is over budget, and save.
+
+        Args:
+            summarize: async (previous_summary, messages) -> new summary
+
+        Returns:
+            Dict[str, Any]: The saved session (a reloaded copy if another process had saved it meanwhile)
+        """
+        for attempt in range(SAVE_ATTEMPTS):
+            session["messages"].append({"role": "user", "content": user_message})
+            session["messages"].append({"role": "assistant", "content": reply})
+            if appointment_info is not None:
+                session["appointment_info"] = appointment_info
+            await self._compact(session, summarize)
+            if await self.save(session):
+                return session
+            print(f"⚠️ Chat session {session['_id']} was updated elsewhere, reloading (attempt {attempt + 1})")
+            session = await self._load(session["_id"], session["user_id"], session["session_id"])
+        raise RuntimeError(f"Could not save chat session {session['_id']}: concurrent updates")
+
+    async def _compact(self, session: Dict[str, Any], summarize) -> None:
+        messages = session["messages"]
+        if sum(message_tokens(m) for m in messages) <= self.token_budget:
+            return
+
+        # Keep the newest messages within half the budget (and at least keep_messages of
+        # them), so compaction runs every few turns rather than on every one
+        kept, used = 0, 0
+        for message in reversed(messages):
+            cost = message_tokens(message)
+            if kept >= self.keep_messages and used + cost > self.token_budget // 2:
+                break
+            kept += 1
+            used += cost
+        older, recent = messages[:len(messages) - kept], messages[len(messages) - kept:]
+        if not older:
+            return
+
+        try:
+            session["summary"] = await summarize(session["summary"], older)
+        except Exception as e:
+            # Still drop the old turns, so a failing summarizer can't let the prompt grow unbounded
+            print(f"⚠️ Could not summarize chat session {session['_id']}: {e}")
+        session["messages"] = recent
+
+    async def save(self, session: Dict[str, Any]) -> bool:
+        """
+        Save the session if nobody else saved it since it was loaded.
+
+        Returns:
+            bool: False on a version conflict (the cached copy is dropped; reload and retry)
+        """
+        expected = session.get("version", 0)
+        document = {**session, "version": expected + 1, "updated_at": datetime.utcnow()}
+        db = get_database()
+        if expected == 0:
+            # A new session is inserted; if another process created it first, the filter
+            # doesn't match and the upsert's insert hits the duplicate _id
+            try:
+                await db[CHAT_SESSIONS_COLLECTION].replace_one(
+                    {"_id": session["_id"], "version": {"$in": [None, 0]}}, document, upsert=True
+                )
+                saved = True
+            except DuplicateKeyError:
+                saved = False
+        else:
+            # No upsert: a session cleared (or expired) elsewhere must not be brought back by a stale copy
+            result = await db[CHAT_SESSIONS_COLLECTION].replace_one({"_id": session["_id"], "version": expected}, document)
+            saved = result.matched_count == 1
+
+        if not saved:
+            self._sessions.pop(session["_id"], None)
+            return False
+        session.update(document)
+        self._remember(session)
+        return True
+
+    async def clear(self, user_id: str, session_id: Optional[str] = None) -> int:
+        """Delete one session, or all of the user's sessions. Returns the number deleted."""
+        db = get_database()
+        if session_id:
+            keys = [self._key(user_id, session_id)]
+            result = await db[CHAT_SESSIONS_COLLECTION].delete_one({"_id": keys[0]})
+        else:
+            keys = [key for key in self._sessions if key.startswith(f"{user_id}:")]
+            result = await db[CHAT_SESSIONS_COLLECTION].delete_many({"user_id": user_id})
+        for key in keys:
+            self._sessions.pop(key, None)
+        return result.deleted_count
+
+    def _remember(self, session: Dict[str, Any]) -> None:
+        if self.max_cached <= 0:
+            return
+        self._sessions[session["_id"]] = session
+        self._sessions.move_to_end(session["_id"])
+        while len(self._sessions) > self.max_cached:
+            self._sessions.popitem(last=False)
+
+
+chat_sessions = ChatSessionStore(
+    ttl_seconds=settings.CHAT_SESSION_TTL_SECONDS,
+    max_cached=settings.CHAT_SESSION_CACHE_SIZE,
+    token_budget=settings.CHAT_HISTORY_TOKEN_BUDGET,
+    keep_messages=settings.CHAT_HISTORY_KEEP_MESSAGES
+)
@@ -6,7 +6,7 @@ from app.database import db
 from bson import ObjectId
 from datetime import datetime
 from app.utils.serializers import serialize_mongo_doc
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 # CREATE
@@ -71,3 +71,31 @@ async def save_consultation_note(appointment_id: str, transcript: Dict[str, Any]
         result = await db["consultation_notes"].insert_one(consultation_note)
         print("SAVED")
         return str(result.inserted_id)
+
+
+# live transcription: transcript segments are appended as they are finalized
+async def append_transcript_segments(appointment_id: str, segments: List[Dict[str, Any]]) -> None:
+    if not segments:
+        return
+    now = datetime.utcnow()
+    await db.consultation_notes.update_one(
+        {"appointment_id": appointment_id},
+        {
+            "$push": {"transcript": {"$each": [
+                {"start": seg["start"], "end": seg["end"], "text": seg["text"]} for seg in segments
+            ]}},
+            "$set": {"updated_at": now},
+            "$setOnInsert": {"summary": {}, "created_at": now}
+        },
+        upsert=True
+    )
+
+
+async def get_transcript_end(appointment_id: str) -> float:
+    """End time (seconds) of the last transcript segment stored for an appointment, 0 if none."""
+    doc = await db.consultation_notes.find_one(
+        {"appointment_id": appointment_id},
+        {"transcript": {"$slice": -1}}
+    )
+    transcript = (doc or {}).get("transcript") or []
+    return float(transcript[-1].get("end", 0)) if transcript else 0.0
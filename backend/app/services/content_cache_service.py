@@ -0,0 +1,107 @@
+# backend/app/services/content_cache_service.py
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from pymongo import UpdateOne
+from app.database import get_database
+
+TRANSCRIPT_CACHE_COLLECTION = "transcript_cache"
+EMBEDDING_CACHE_COLLECTION = "embedding_cache"
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _options_key(options: Dict[str, Any]) -> str:
+    # Canonical form so the same options always map to the same cache entry
+    return json.dumps(options, sort_keys=True)
+
+
+async def get_cached_transcript(sha256: str, model_name: str, options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Look up a transcript for audio with this content hash.
+
+    Args:
+        sha256: Hash of the audio bytes
+        model_name: Whisper model that produced the transcript
+        options: Settings that change the transcript (e.g. chunking windows)
+
+    Returns:
+        Optional[Dict[str, Any]]: The Whisper result ("text", "segments", ...) or None
+    """
+    db = get_database()
+    entry = await db[TRANSCRIPT_CACHE_COLLECTION].find_one(
+        {"sha256": sha256, "model": model_name, "options": _options_key(options)}
+    )
+    return entry["result"] if entry else None
+
+
+async def save_cached_transcript(sha256: str, model_name: str, options: Dict[str, Any], result: Dict[str, Any]) -> None:
+    db = get_database()
+    await db[TRANSCRIPT_CACHE_COLLECTION].update_one(
+        {"sha256": sha256, "model": model_name, "options": _options_key(options)},
+        {"$set": {
+            "result": {"text": result.get("text", ""), "segments": result.get("segments", []), "language": result.get("language")},
+            "updated_at": datetime.utcnow(),
+        }},
+        upsert=True
+    )
+
+
+async def get_cached_embeddings(texts: List[str], model_name: str) -> Dict[str, List[float]]:
+    """
+    Fetch cached embeddings for the given texts.
+
+    Returns:
+        Dict[str, List[float]]: Embedding by text hash, for the texts that were cached
+    """
+    db = get_database()
+    hashes = list({text_hash(text) for text in texts})
+    cursor = db[EMBEDDING_CACHE_COLLECTION].find(
+        {"text_hash": {"$in": hashes}, "model": model_name},
+        {"_id": 0, "text_hash": 1, "embedding": 1}
+    )
+    return {entry["text_hash"]: entry["embedding"] async for entry in cursor}
+
+
+async def save_cached_embeddings(texts: List[str], embeddings: List[List[float]], model_name: str) -> None:
+    if not texts:
+        return
+    db = get_database()
+    now = datetime.utcnow()
+    await db[EMBEDDING_CACHE_COLLECTION].bulk_write([
+        UpdateOne(
+            {"text_hash": text_hash(text), "model": model_name},
+            {"$set": {"embedding": [float(x) for x in embedding], "updated_at": now}},
+            upsert=True
+        )
+        for text, embedding in zip(texts, embeddings)
+    ], ordered=False)
+
+
+async def embed_with_cache(
+    texts: List[str],
+    embed: Callable[[List[str]], Awaitable[List[List[float]]]],
+    model_name: str
+) -> List[List[float]]:
+    """
+    Embed texts, computing only the ones missing from the embedding cache.
+
+    Args:
+        texts: Texts to embed
+        embed: Async function embedding a list of texts (called for the misses)
+        model_name: Name of the embedding model, part of the cache key
+    """
+    cached = await get_cached_embeddings(texts, model_name)
+    missing = list(dict.fromkeys(text for text in texts if text_hash(text) not in cached))
+    print(f"🧠 Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} to compute")
+
+    if missing:
+        computed = await embed(missing)
+        await save_cached_embeddings(missing, computed, model_name)
+        cached.update({text_hash(text): embedding for text, embedding in zip(missing, computed)})
+
+    return [cached[text_hash(text)] for text in texts]
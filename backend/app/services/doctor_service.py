@@ -4,6 +4,8 @@ from app.models.doctor import Doctor
 from app.database import db
 from bson import ObjectId
 from app.utils.serializers import serialize_mongo_doc
+from app.utils.pagination import fetch_page
+from typing import Optional, Tuple, List
 
 # CREATE
 async def create_doctor_logic(doctor_data: DoctorCreate) -> Doctor:
@@ -17,6 +19,22 @@ async def get_all_doctors() -> list[Doctor]:
     cursor = db.doctors.find()
     return [Doctor(**serialize_mongo_doc(doc)) async for doc in cursor]
 
+# READ a page (keyset pagination)
+async def get_doctors_page(
+    limit: int,
+    cursor: Optional[str] = None,
+    availability: Optional[str] = None,
+    specialization: Optional[str] = None,
+) -> Tuple[List[Doctor], Optional[str]]:
+    query = {}
+    if availability:
+        query["availability"] = availability
+    if specialization:
+        query["specialization"] = specialization
+
+    docs, next_cursor = await fetch_page(db.doctors, query, limit, cursor)
+    return [Doctor(**serialize_mongo_doc(doc)) for doc in docs], next_cursor
+
 # READ BY ID
 async def get_doctor_by_id(doctor_id: str) -> Doctor | None:
     doc = await db.doctors.find_one({"_id": ObjectId(doctor_id)})
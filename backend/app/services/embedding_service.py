@@ -0,0 +1,152 @@
+# backend/app/services/embedding_service.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List
+from app.config.settings import settings
+
+# How the model is executed. The ONNX backends (CPU-friendly; need
+# sentence-transformers[onnx]) use the exports shipped with the model on the
+# Hugging Face hub; "onnx-int8" loads a dynamically quantized one.
+EMBEDDING_BACKENDS = ("torch", "onnx", "onnx-int8")
+
+
+def load_sentence_transformer(model_name: str, backend: str, onnx_int8_file: str = settings.EMBEDDING_ONNX_INT8_FILE):
+    from sentence_transformers import SentenceTransformer
+
+    if backend == "torch":
+        return SentenceTransformer(model_name)
+    if backend == "onnx":
+        return SentenceTransformer(model_name, backend="onnx")
+    if backend == "onnx-int8":
+        return SentenceTransformer(model_name, backend="onnx", model_kwargs={"file_name": onnx_int8_file})
+    raise ValueError(f"Unknown embedding backend '{backend}', expected one of {EMBEDDING_BACKENDS}")
+
+
+class EmbeddingService:
+    """
+    The process's single sentence embedding model.
+
+    Texts are encoded in batches of `batch_size` as L2-normalized float32
+    vectors. Query embeddings are kept in an LRU cache, since chat users
+    repeat the same questions (and the summary endpoint always asks the
+    same one). The model is loaded on first use, with the configured
+    backend (see EMBEDDING_BACKENDS).
+
+    Implements the langchain Embeddings interface (embed_documents /
+    embed_query) and chromadb's embedding function interface (__call__),
+    so the vector store and the standalone RAG pipeline can share it.
+    """
+
+    def __init__(self, model_name: str, backend: str, batch_size: int, query_cache_size: int):
+        if backend not in EMBEDDING_BACKENDS:
+            raise ValueError(f"Unknown embedding backend '{backend}', expected one of {EMBEDDING_BACKENDS}")
+        self.model_name = model_name
+        self.backend = backend
+        self.batch_size = batch_size
+        self.query_cache_size = query_cache_size
+        self._model = None
+        self._load_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._query_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._metrics = {
+            "encode_calls": 0,
+            "texts_encoded": 0,
+            "batches": 0,
+            "total_encode_seconds": 0.0,
+            "max_encode_seconds": 0.0,
+            "query_cache_hits": 0,
+            "query_cache_misses": 0,
+        }
+
+    def _get_model(self):
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    print(f"🧠 Loading embedding model: {self.model_name} ({self.backend})")
+                    self._model = load_sentence_transformer(self.model_name, self.backend)
+                    print("✅ Embedding model loaded.")
+        return self._model
+
+    def load(self) -> None:
+        """Load the model now rather than on first use (blocking)."""
+        self._get_model()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._model is not None
+
+    @property
+    def cache_key(self) -> str:
+        """Identifies the vectors this service produces (backends differ slightly), for the embedding cache."""
+        return self.model_name if self.backend == "torch" else f"{self.model_name}@{self.backend}"
+
+    def encode(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        model = self._get_model()
+        started_at = time.perf_counter()
+        vectors = model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        ).astype("float32")
+        elapsed = time.perf_counter() - started_at
+
+        with self._lock:
+            self._metrics["encode_calls"] += 1
+            self._metrics["texts_encoded"] += len(texts)
+            self._metrics["batches"] += -(-len(texts) // self.batch_size)
+            self._metrics["total_encode_seconds"] += elapsed
+            self._metrics["max_encode_seconds"] = max(self._metrics["max_encode_seconds"], elapsed)
+        return vectors.tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.encode(list(texts))
+
+    def embed_query(self, text: str) -> List[float]:
+        with self._lock:
+            cached = self._query_cache.get(text)
+            if cached is not None:
+                self._query_cache.move_to_end(text)
+                self._metrics["query_cache_hits"] += 1
+                return cached
+            self._metrics["query_cache_misses"] += 1
+
+        vector = self.encode([text])[0]
+        with self._lock:
+            self._query_cache[text] = vector
+            while len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+        return vector
+
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        return self.encode(list(input))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = dict(self._metrics)
+        seconds = metrics["total_encode_seconds"]
+        lookups = metrics["query_cache_hits"] + metrics["query_cache_misses"]
+        return {
+            **metrics,
+            "model": self.model_name,
+            "backend": self.backend,
+            "loaded": self._model is not None,
+            "batch_size": self.batch_size,
+            "query_cache_size": len(self._query_cache),
+            "texts_per_second": metrics["texts_encoded"] / seconds if seconds else 0.0,
+            "avg_encode_seconds": seconds / metrics["encode_calls"] if metrics["encode_calls"] else 0.0,
+            "query_cache_hit_rate": metrics["query_cache_hits"] / lookups if lookups else 0.0,
+        }
+
+
+embedding_service = EmbeddingService(
+    model_name=settings.EMBEDDING_MODEL,
+    backend=settings.EMBEDDING_BACKEND,
+    batch_size=settings.EMBEDDING_BATCH_SIZE,
+    query_cache_size=settings.EMBEDDING_QUERY_CACHE_SIZE
+)
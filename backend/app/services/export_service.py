@@ -0,0 +1,113 @@
+# backend/app/services/export_service.py
+
+import csv
+import io
+import json
+from typing import AsyncIterator, List, Optional
+from app.database import get_database
+from app.services.appointment_service import lookup_appointment_names
+from app.utils.serializers import serialize_mongo_doc
+from app.utils.pagination import date_range_filter
+
+# Collections that can be exported, keyed by the name used in the URL.
+# The second value is the YYYY-MM-DD field used for date filtering (None if unsupported).
+EXPORTABLE_COLLECTIONS = {
+    "appointments": ("appointments_new", "date"),
+    "availabilities": ("availabilities", "date"),
+    "consultation-notes": ("consultation_notes", None),
+}
+
+# CSV columns per export. Optional fields are listed too, so a document missing
+# them gets empty cells instead of the column disappearing. Exports with an
+# open schema (nested transcripts) have no entry and are NDJSON only.
+# patientName/doctorName aren't stored on appointments; they are joined in
+# by build_export_cursor.
+CSV_COLUMNS = {
+    "appointments": [
+        "id", "patient_id", "doctor_id", "patientName", "doctorName", "date", "time", "condition",
+        "status", "audio_file_id", "created_at", "updated_at",
+    ],
+    "availabilities": [
+        "id", "doctorId", "doctorName", "date", "startTime", "endTime", "status", "created_at", "updated_at",
+    ],
+}
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _to_json_line(doc: dict) -> str:
+    return json.dumps(serialize_mongo_doc(doc), default=str) + "\n"
+
+
+def _csv_value(value):
+    # Nested values (e.g. transcripts) are embedded as JSON
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return value
+
+
+async def _with_appointment_names(cursor, batch_size: int) -> AsyncIterator[dict]:
+    # Names are looked up per batch (two queries), not per appointment
+    batch = []
+    async for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            async for enriched in _name_batch(batch):
+                yield enriched
+            batch = []
+    if batch:
+        async for enriched in _name_batch(batch):
+            yield enriched
+
+
+async def _name_batch(docs: List[dict]) -> AsyncIterator[dict]:
+    names = await lookup_appointment_names(get_database(), docs)
+    for doc, (patient_name, doctor_name) in zip(docs, names):
+        yield {**doc, "patientName": patient_name, "doctorName": doctor_name}
+
+
+def build_export_cursor(collection_name: str, batch_size: int, date_from: Optional[str] = None, date_to: Optional[str] = None):
+    """
+    Open a cursor over an exportable collection.
+
+    Appointments come back with patientName and doctorName joined in, a
+    batch at a time.
+
+    Args:
+        collection_name: Key of EXPORTABLE_COLLECTIONS
+        batch_size: Number of documents fetched from Mongo per round trip
+        date_from: Optional lower bound on the date field (YYYY-MM-DD)
+        date_to: Optional upper bound on the date field (YYYY-MM-DD)
+    """
+    db = get_database()
+    mongo_collection, date_field = EXPORTABLE_COLLECTIONS[collection_name]
+    query = date_range_filter(date_field, date_from, date_to) if date_field else {}
+    cursor = db[mongo_collection].find(query, batch_size=batch_size).sort("_id", 1)
+    if collection_name == "appointments":
+        return _with_appointment_names(cursor, batch_size)
+    return cursor
+
+
+async def stream_ndjson(cursor) -> AsyncIterator[str]:
+    """Yield one JSON document per line as the cursor is iterated."""
+    async for doc in cursor:
+        yield _to_json_line(doc)
+
+
+async def stream_csv(cursor, columns: List[str]) -> AsyncIterator[str]:
+    """Yield CSV rows with the given columns as the cursor is iterated (fields outside them are left out)."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, restval="", extrasaction="ignore")
+    writer.writeheader()
+
+    async for doc in cursor:
+        row = serialize_mongo_doc(doc)
+        writer.writerow({key: _csv_value(value) for key, value in row.items()})
+
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    # Header only, for an empty export
+    if buffer.tell():
+        yield buffer.getvalue()
@@ -0,0 +1,171 @@
+# backend/app/services/index_service.py
+
+from typing import Any, Dict, List
+from pymongo import ASCENDING
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.config.settings import settings
+
+# Declarative index registry: every index the application relies on.
+# Each entry is applied with create_index on startup (a no-op if it already exists).
+# "min_server_version" marks indexes older MongoDB servers reject.
+INDEX_REGISTRY: List[Dict[str, Any]] = [
+    {"collection": "appointments_new", "keys": [("id", ASCENDING)], "name": "appointments_id"},
+    {"collection": "appointments_new", "keys": [("patient_id", ASCENDING)], "name": "appointments_patient_id"},
+    {
+        # At most one active appointment per doctor and time slot. $in in a partial
+        # filter needs MongoDB 6.0; check_indexes.py fails when this index is missing
+        "collection": "appointments_new",
+        "keys": [("doctor_id", ASCENDING), ("date", ASCENDING), ("time", ASCENDING)],
+        "name": "appointments_unique_active_slot",
+        "options": {
+            "unique": True,
+            "partialFilterExpression": {"status": {"$in": ["Confirmed", "Pending"]}},
+        },
+        "min_server_version": "6.0",
+    },
+    {"collection": "patients_new", "keys": [("user_id", ASCENDING)], "name": "patients_user_id"},
+    {"collection": "patients_new", "keys": [("id", ASCENDING)], "name": "patients_id"},
+    {"collection": "users", "keys": [("email", ASCENDING)], "name": "users_email", "options": {"unique": True}},
+    {"collection": "consultation_notes", "keys": [("appointment_id", ASCENDING)], "name": "consultation_notes_appointment_id"},
+    {
+        "collection": "availabilities",
+        "keys": [("doctorId", ASCENDING), ("status", ASCENDING), ("date", ASCENDING), ("startTime", ASCENDING)],
+        "name": "availabilities_doctor_status_date_time",
+    },
+    {"collection": "processing_jobs", "keys": [("job_id", ASCENDING)], "name": "processing_jobs_job_id", "options": {"unique": True}},
+    {"collection": "processing_jobs", "keys": [("status", ASCENDING), ("created_at", ASCENDING)], "name": "processing_jobs_status_created_at"},
+    {"collection": "processing_jobs", "keys": [("appointment_id", ASCENDING), ("created_at", ASCENDING)], "name": "processing_jobs_appointment_created_at"},
+    {
+        "collection": "transcript_cache",
+        "keys": [("sha256", ASCENDING), ("model", ASCENDING), ("options", ASCENDING)],
+        "name": "transcript_cache_sha256_model_options",
+        "options": {"unique": True},
+    },
+    {
+        "collection": "embedding_cache",
+        "keys": [("text_hash", ASCENDING), ("model", ASCENDING)],
+        "name": "embedding_cache_text_hash_model",
+        "options": {"unique": True},
+    },
+    {
+        "collection": "vector_partitions",
+        "keys": [("appointment_id", ASCENDING)],
+        "name": "vector_partitions_appointment_id",
+        "options": {"unique": True},
+    },
+    {
+        # Idle chat sessions expire; changing CHAT_SESSION_TTL_SECONDS needs a collMod (or dropping this index)
+        "collection": "chat_sessions",
+        "keys": [("updated_at", ASCENDING)],
+        "name": "chat_sessions_updated_at_ttl",
+        "options": {"expireAfterSeconds": settings.CHAT_SESSION_TTL_SECONDS},
+    },
+    {"collection": "chat_sessions", "keys": [("user_id", ASCENDING)], "name": "chat_sessions_user_id"},
+]
+
+# Hot queries issued by the services, used to verify that each one is served by an index.
+HOT_QUERIES: List[Dict[str, Any]] = [
+    {"name": "appointment by id", "collection": "appointments_new", "filter": {"id": "x"}},
+    {"name": "appointments by patient", "collection": "appointments_new", "filter": {"patient_id": "x"}},
+    {"name": "patient by user_id", "collection": "patients_new", "filter": {"user_id": "x"}},
+    {"name": "patient by id", "collection": "patients_new", "filter": {"id": "x"}},
+    {"name": "user by email", "collection": "users", "filter": {"email": "x"}},
+    {"name": "note by appointment", "collection": "consultation_notes", "filter": {"appointment_id": "x"}},
+    {
+        "name": "available time slots",
+        "collection": "availabilities",
+        "filter": {"doctorId": "x", "status": "Available", "date": {"$gte": "2000-01-01"}},
+        "sort": [("date", ASCENDING), ("startTime", ASCENDING)],
+    },
+    {
+        "name": "book slot",
+        "collection": "availabilities",
+        "filter": {"doctorId": "x", "date": "2000-01-01", "startTime": "00:00", "status": "Available"},
+    },
+]
+
+
+def requirement_note(spec: Dict[str, Any]) -> str:
+    """Hint appended to errors about an index that needs a newer server."""
+    version = spec.get("min_server_version")
+    return f" (requires MongoDB {version}+)" if version else ""
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> Dict[str, List[str]]:
+    """
+    Create every index in INDEX_REGISTRY.
+
+    Failures (e.g. a unique index over existing duplicates) are logged and
+    reported instead of raised so the API can still start.
+
+    Returns:
+        Dict[str, List[str]]: Names of the indexes that were "applied" and that "failed"
+    """
+    report = {"applied": [], "failed": []}
+    for spec in INDEX_REGISTRY:
+        try:
+            await db[spec["collection"]].create_index(spec["keys"], name=spec["name"], **spec.get("options", {}))
+            report["applied"].append(spec["name"])
+        except Exception as e:
+            print(f"❌ Could not create index {spec['name']} on {spec['collection']}{requirement_note(spec)}: {e}")
+            report["failed"].append(spec["name"])
+
+    print(f"✅ Indexes ensured: {len(report['applied'])} applied, {len(report['failed'])} failed")
+    return report
+
+
+def _matches(spec: Dict[str, Any], info: Dict[str, Any]) -> bool:
+    # Same keys and the same unique/partial/TTL options; a plain index on the
+    # same keys doesn't give the guarantee a unique or partial one does
+    if [tuple(key) for key in info["key"]] != list(spec["keys"]):
+        return False
+    return all(info.get(option) == value for option, value in spec.get("options", {}).items())
+
+
+async def find_missing_indexes(db: AsyncIOMotorDatabase) -> List[Dict[str, Any]]:
+    """Return the registry entries whose index (with its options) does not exist in the database."""
+    missing = []
+    for spec in INDEX_REGISTRY:
+        existing = await db[spec["collection"]].index_information()
+        if not any(_matches(spec, info) for info in existing.values()):
+            missing.append(spec)
+    return missing
+
+
+async def find_unused_indexes(db: AsyncIOMotorDatabase) -> List[Dict[str, Any]]:
+    """Return indexes (other than _id) that have not served a single operation since the server started."""
+    unused = []
+    collections = {spec["collection"] for spec in INDEX_REGISTRY}
+    for collection_name in sorted(collections):
+        async for stats in db[collection_name].aggregate([{"$indexStats": {}}]):
+            if stats["name"] != "_id_" and stats["accesses"]["ops"] == 0:
+                unused.append({"collection": collection_name, "name": stats["name"]})
+    return unused
+
+
+def _plan_stages(plan: Dict[str, Any]) -> List[str]:
+    stages = [plan.get("stage")] if plan.get("stage") else []
+    for child_key in ("inputStage", "queryPlan"):
+        if isinstance(plan.get(child_key), dict):
+            stages += _plan_stages(plan[child_key])
+    for child in plan.get("inputStages", []):
+        stages += _plan_stages(child)
+    return stages
+
+
+async def explain_hot_queries(db: AsyncIOMotorDatabase) -> List[Dict[str, Any]]:
+    """Run explain() on every query in HOT_QUERIES and flag the ones planned as a COLLSCAN."""
+    results = []
+    for query in HOT_QUERIES:
+        cursor = db[query["collection"]].find(query["filter"])
+        if query.get("sort"):
+            cursor = cursor.sort(query["sort"])
+        explanation = await cursor.explain()
+        stages = _plan_stages(explanation.get("queryPlanner", {}).get("winningPlan", {}))
+        results.append({
+            "name": query["name"],
+            "collection": query["collection"],
+            "stages": stages,
+            "collscan": "COLLSCAN" in stages,
+        })
+    return results
@@ -0,0 +1,204 @@
+# backend/app/services/job_queue_service.py
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from pymongo import ReturnDocument, DESCENDING
+from app.database import get_database
+import uuid
+
+JOBS_COLLECTION = "processing_jobs"
+
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 30  # doubled after every failed attempt
+DEFAULT_LEASE_SECONDS = 60
+
+
+class LeaseLostError(Exception):
+    """The worker no longer owns the job (its lease expired and another worker may have claimed it)."""
+
+
+async def enqueue_job(job_type: str, stages: List[str], payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add a job to the Mongo-backed queue.
+
+    Args:
+        job_type: Kind of job, used by workers to pick a handler
+        stages: Ordered names of the stages the job goes through (for progress reporting)
+        payload: Job specific fields (e.g. appointment_id, file_id)
+
+    Returns:
+        Dict[str, Any]: The stored job document
+    """
+    db = get_database()
+    now = datetime.utcnow()
+    job = {
+        "job_id": str(uuid.uuid4()),
+        "type": job_type,
+        "status": "queued",
+        "stage": None,
+        "stages": {name: {"status": "pending"} for name in stages},
+        "stage_order": stages,
+        "attempts": 0,
+        "available_at": now,
+        "lease_owner": None,
+        "lease_expires_at": None,
+        "error": None,
+        "created_at": now,
+        "updated_at": now,
+        **payload,
+    }
+    await db[JOBS_COLLECTION].insert_one(job)
+    return job
+
+
+async def claim_next_job(worker_id: str, lease_seconds: int = DEFAULT_LEASE_SECONDS) -> Optional[Dict[str, Any]]:
+    """
+    Atomically lease the oldest runnable job.
+
+    A job is runnable when it is queued and its retry delay has passed, or
+    when it is running but its lease expired (the worker died).
+    """
+    db = get_database()
+    now = datetime.utcnow()
+
+    # Jobs whose worker died on the last allowed attempt will never be claimed again
+    await db[JOBS_COLLECTION].update_many(
+        {"status": "running", "lease_expires_at": {"$lt": now}, "attempts": {"$gte": MAX_ATTEMPTS}},
+        {"$set": {"status": "failed", "error": "Worker lease expired", "updated_at": now}}
+    )
+
+    return await db[JOBS_COLLECTION].find_one_and_update(
+        {
+            "attempts": {"$lt": MAX_ATTEMPTS},
+            "$or": [
+                {"status": "queued", "available_at": {"$lte": now}},
+                {"status": "running", "lease_expires_at": {"$lt": now}},
+            ],
+        },
+        {
+            "$set": {
+                "status": "running",
+                "lease_owner": worker_id,
+                "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                "updated_at": now,
+            },
+            "$inc": {"attempts": 1},
+        },
+        sort=[("created_at", 1)],
+        return_document=ReturnDocument.AFTER
+    )
+
+
+async def heartbeat(job_id: str, worker_id: str, lease_seconds: int = DEFAULT_LEASE_SECONDS) -> bool:
+    """Extend the lease of a job still owned by this worker. Returns False if the lease was lost."""
+    db = get_database()
+    now = datetime.utcnow()
+    result = await db[JOBS_COLLECTION].update_one(
+        {"job_id": job_id, "lease_owner": worker_id, "status": "running"},
+        {"$set": {"lease_expires_at": now + timedelta(seconds=lease_seconds), "updated_at": now}}
+    )
+    return result.matched_count == 1
+
+
+async def start_stage(job_id: str, worker_id: str, stage: str) -> bool:
+    """Record the stage a job is in. Returns False if the worker lost the lease."""
+    db = get_database()
+    now = datetime.utcnow()
+    result = await db[JOBS_COLLECTION].update_one(
+        {"job_id": job_id, "lease_owner": worker_id, "status": "running"},
+        {"$set": {
+            "stage": stage,
+            f"stages.{stage}.status": "running",
+            f"stages.{stage}.started_at": now,
+            "updated_at": now,
+        }}
+    )
+    return result.matched_count == 1
+
+
+async def finish_stage(job_id: str, worker_id: str, stage: str, result: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Mark a stage completed, optionally storing fields on the job so a retry can skip the stage.
+    Returns False if the worker lost the lease.
+    """
+    db = get_database()
+    now = datetime.utcnow()
+    update = await db[JOBS_COLLECTION].update_one(
+        {"job_id": job_id, "lease_owner": worker_id, "status": "running"},
+        {"$set": {
+            f"stages.{stage}.status": "completed",
+            f"stages.{stage}.finished_at": now,
+            "updated_at": now,
+            **(result or {}),
+        }}
+    )
+    return update.matched_count == 1
+
+
+async def complete_job(job_id: str, worker_id: str) -> bool:
+    """Returns False if the worker lost the lease."""
+    db = get_database()
+    now = datetime.utcnow()
+    result = await db[JOBS_COLLECTION].update_one(
+        {"job_id": job_id, "lease_owner": worker_id, "status": "running"},
+        {"$set": {"status": "completed", "stage": None, "error": None, "lease_expires_at": None, "updated_at": now}}
+    )
+    return result.matched_count == 1
+
+
+async def fail_job(job: Dict[str, Any], worker_id: str, error: str, stage: Optional[str] = None) -> bool:
+    """
+    Requeue the job with exponential backoff, or mark it failed once attempts are exhausted.
+    Returns False if the worker lost the lease (the job now belongs to another worker).
+    """
+    db = get_database()
+    now = datetime.utcnow()
+    update = {"error": error, "lease_expires_at": None, "updated_at": now}
+    if job["attempts"] < MAX_ATTEMPTS:
+        update["status"] = "queued"
+        update["available_at"] = now + timedelta(seconds=RETRY_BACKOFF_SECONDS * 2 ** (job["attempts"] - 1))
+    else:
+        update["status"] = "failed"
+    if stage:
+        update[f"stages.{stage}.status"] = "failed"
+
+    result = await db[JOBS_COLLECTION].update_one(
+        {"job_id": job["job_id"], "lease_owner": worker_id, "status": "running"}, {"$set": update}
+    )
+    return result.matched_count == 1
+
+
+async def requeue_job(job: Dict[str, Any], worker_id: str, delay_seconds: float, reason: str,
+                      stage: Optional[str] = None) -> bool:
+    """
+    Put the job back in the queue without counting the attempt, e.g. when the worker is
+    overloaded rather than the job failing. Returns False if the worker lost the lease.
+    """
+    db = get_database()
+    now = datetime.utcnow()
+    update = {
+        "status": "queued",
+        "available_at": now + timedelta(seconds=delay_seconds),
+        "error": reason,
+        "lease_expires_at": None,
+        "updated_at": now,
+    }
+    if stage:
+        update[f"stages.{stage}.status"] = "pending"
+
+    result = await db[JOBS_COLLECTION].update_one(
+        {"job_id": job["job_id"], "lease_owner": worker_id, "status": "running"},
+        {"$set": update, "$inc": {"attempts": -1}}
+    )
+    return result.matched_count == 1
+
+
+async def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    db = get_database()
+    return await db[JOBS_COLLECTION].find_one({"job_id": job_id})
+
+
+async def get_latest_job(**filters) -> Optional[Dict[str, Any]]:
+    """Most recent job matching the given fields (e.g. appointment_id=...)."""
+    db = get_database()
+    return await db[JOBS_COLLECTION].find_one(filters, sort=[("created_at", DESCENDING)])
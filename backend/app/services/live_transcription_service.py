@@ -0,0 +1,172 @@
+# backend/app/services/live_transcription_service.py
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+import numpy as np
+from app.config.settings import settings
+from app.services.consultation_notes_service import append_transcript_segments
+from app.services.transcription_pool import TranscriptionPool
+from app.services.whisper_transcriber_service import SAMPLE_RATE
+
+# Live transcription is the one place the API process runs Whisper itself:
+# a window has to come back within a few seconds, which rules out the
+# Mongo job queue the upload pipeline workers poll. The pool is separate
+# from (and smaller than) the pipeline's, is started on the first live
+# session rather than at startup, and is shut down by the app lifespan.
+# Each Uvicorn worker that serves a live session gets its own pool.
+live_transcription_pool = TranscriptionPool(
+    model_name=settings.WHISPER_MODEL,
+    workers=settings.LIVE_TRANSCRIPTION_WORKERS,
+    max_queue=settings.WHISPER_MAX_QUEUE,
+    queue_timeout=settings.WHISPER_QUEUE_TIMEOUT_SECONDS
+)
+
+# Raw frames: 16-bit little-endian mono PCM at SAMPLE_RATE. Anything else
+# (e.g. MediaRecorder webm/opus) is decoded through a long-running ffmpeg.
+PCM_FORMAT = "pcm_s16le"
+
+
+class StreamDecoder:
+    """Feeds compressed audio frames into ffmpeg and hands back PCM as it is decoded."""
+
+    def __init__(self, on_pcm: Callable[[bytes], None]):
+        self.on_pcm = on_pcm
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        self._process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-loglevel", "error",
+            "-i", "pipe:0",
+            "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE),
+            "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        self._reader = asyncio.create_task(self._read())
+
+    async def _read(self) -> None:
+        while True:
+            data = await self._process.stdout.read(64 * 1024)
+            if not data:
+                return
+            self.on_pcm(data)
+
+    async def write(self, frame: bytes) -> None:
+        self._process.stdin.write(frame)
+        await self._process.stdin.drain()
+
+    async def close(self) -> None:
+        """Flush the decoder; returns once all decoded PCM has been delivered."""
+        if self._process is None:
+            return
+        try:
+            self._process.stdin.close()
+            await self._reader
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # ffmpeg already exited; whatever it decoded was delivered
+        finally:
+            if self._process.returncode is None:
+                try:
+                    await asyncio.wait_for(self._process.wait(), timeout=5)
+                except asyncio.TimeoutError:
+                    self._process.kill()
+                    await self._process.wait()
+            self._process = None
+
+
+class LiveTranscriptionSession:
+    """
+    Sliding-window transcription of a live consultation.
+
+    Incoming audio accumulates in a buffer. Every `step_seconds` of new
+    audio the whole buffer is transcribed in the live transcription pool and the
+    segments are sent to the client as partials. Once the buffer reaches
+    `window_seconds`, every segment but the last is finalized: appended to
+    the appointment's consultation note and cut from the buffer, so the
+    still-changing tail is re-transcribed with its context on the next pass.
+    """
+
+    def __init__(
+        self,
+        appointment_id: str,
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+        start_offset: float = 0.0,
+        step_seconds: float = settings.LIVE_TRANSCRIPTION_STEP_SECONDS,
+        window_seconds: float = settings.LIVE_TRANSCRIPTION_WINDOW_SECONDS,
+    ):
+        self.appointment_id = appointment_id
+        self.send = send
+        self.step_samples = int(step_seconds * SAMPLE_RATE)
+        self.window_samples = int(window_seconds * SAMPLE_RATE)
+        self.buffer = np.zeros(0, dtype=np.float32)
+        self.buffer_offset = start_offset  # recording time (seconds) of buffer[0]
+        self.finalized_count = 0
+        self._new_samples = 0
+        self._remainder = b""
+        self._pass: Optional[asyncio.Task] = None
+
+    def add_pcm(self, pcm: bytes) -> None:
+        # Frames may split a 16-bit sample
+        pcm = self._remainder + pcm
+        usable = len(pcm) - len(pcm) % 2
+        self._remainder = pcm[usable:]
+        samples = np.frombuffer(pcm[:usable], np.int16).astype(np.float32) / 32768.0
+        self.buffer = np.concatenate([self.buffer, samples])
+        self._new_samples += len(samples)
+
+    def maybe_transcribe(self) -> None:
+        """Start a background pass if enough new audio arrived and none is running."""
+        if self._new_samples >= self.step_samples and (self._pass is None or self._pass.done()):
+            self._pass = asyncio.create_task(self._run_pass(final=False))
+
+    async def finish(self) -> int:
+        """Wait for the running pass, then transcribe and finalize whatever is left. Returns the finalized segment count."""
+        if self._pass is not None:
+            await asyncio.gather(self._pass, return_exceptions=True)
+        if len(self.buffer):
+            await self._run_pass(final=True)
+        return self.finalized_count
+
+    async def _run_pass(self, final: bool) -> None:
+        self._new_samples = 0
+        # New frames replace self.buffer with a new array, so this snapshot stays stable
+        audio = self.buffer
+        offset = self.buffer_offset
+        try:
+            result = await live_transcription_pool.transcribe_array(audio)
+        except Exception as e:
+            await self.send({"type": "error", "detail": str(e)})
+            return
+        if result.get("text", "").startswith("Transcription failed"):
+            await self.send({"type": "error", "detail": result["text"]})
+            return
+
+        segments = [
+            {"start": offset + seg["start"], "end": offset + seg["end"], "text": seg["text"].strip()}
+            for seg in result.get("segments", [])
+            if seg.get("text", "").strip()
+        ]
+        if final:
+            finalized, partial = segments, []
+        elif len(audio) >= 2 * self.window_samples:
+            # No pause worth cutting at; don't let the window grow without bound
+            finalized, partial = segments, []
+        elif len(audio) >= self.window_samples:
+            finalized, partial = segments[:-1], segments[-1:]
+        else:
+            finalized, partial = [], segments
+
+        if finalized:
+            await append_transcript_segments(self.appointment_id, finalized)
+            self.finalized_count += len(finalized)
+            cut = min(len(audio), int((finalized[-1]["end"] - offset) * SAMPLE_RATE))
+            self.buffer = self.buffer[cut:]
+            self.buffer_offset = offset + cut / SAMPLE_RATE
+            await self.send({"type": "final", "segments": finalized})
+        elif not segments and len(audio) >= self.window_samples:
+            # A full window of silence; nothing to keep
+            self.buffer = self.buffer[len(audio):]
+            self.buffer_offset = offset + len(audio) / SAMPLE_RATE
+        await self.send({"type": "partial", "segments": partial})
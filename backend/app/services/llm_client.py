@@ -0,0 +1,149 @@
+# backend/app/services/llm_client.py
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, Optional
+import httpx
+from openai import AsyncOpenAI, APIConnectionError, APIStatusError, APITimeoutError
+from app.config.settings import settings
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class LLMClient:
+    """
+    The process's single AsyncOpenAI client.
+
+    All chat completions go through one httpx connection pool, so
+    connections to the Azure endpoint are reused instead of re-established
+    per request. A semaphore bounds how many completions are in flight;
+    every call has a timeout; 429/5xx responses and connection errors are
+    retried with exponential backoff and jitter (honouring Retry-After),
+    within a per-call retry budget.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        api_version: str,
+        max_connections: int,
+        timeout: float,
+        max_concurrency: int,
+        max_retries: int,
+        backoff_seconds: float,
+        backoff_max_seconds: float,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.api_version = api_version
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self._http_client = http_client
+        self._client: Optional[AsyncOpenAI] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._metrics = {
+            "calls": 0,
+            "in_flight": 0,
+            "retries": 0,
+            "failures": 0,
+            "total_seconds": 0.0,
+            "max_seconds": 0.0,
+        }
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        # Created lazily so the httpx pool binds to the running event loop
+        if self._client is None:
+            http_client = self._http_client or httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+                timeout=httpx.Timeout(self.timeout, connect=10.0)
+            )
+            self._client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                default_query={"api-version": self.api_version},
+                http_client=http_client,
+                max_retries=0,  # retried here, with our own budget
+            )
+        return self._client
+
+    async def chat(self, timeout: Optional[float] = None, **kwargs):
+        """
+        Create a chat completion (same arguments as client.chat.completions.create).
+
+        Args:
+            timeout: Seconds allowed per attempt (defaults to the client timeout)
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._semaphore:
+            self._metrics["in_flight"] += 1
+            started_at = time.perf_counter()
+            try:
+                return await self._with_retries(timeout or self.timeout, kwargs)
+            except Exception:
+                self._metrics["failures"] += 1
+                raise
+            finally:
+                elapsed = time.perf_counter() - started_at
+                self._metrics["in_flight"] -= 1
+                self._metrics["calls"] += 1
+                self._metrics["total_seconds"] += elapsed
+                self._metrics["max_seconds"] = max(self._metrics["max_seconds"], elapsed)
+
+    async def _with_retries(self, timeout: float, kwargs: Dict[str, Any]):
+        attempt = 0
+        while True:
+            try:
+                return await self.client.chat.completions.create(timeout=timeout, **kwargs)
+            except (APIStatusError, APIConnectionError, APITimeoutError) as e:
+                status = getattr(e, "status_code", None)
+                retryable = status is None or status in RETRYABLE_STATUS_CODES
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt, e)
+                attempt += 1
+                self._metrics["retries"] += 1
+                print(f"⚠️ LLM call failed ({status or type(e).__name__}), retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max_seconds)
+            except ValueError:
+                pass
+        # Full jitter, so clients throttled together don't retry together
+        return random.uniform(0, min(self.backoff_max_seconds, self.backoff_seconds * 2 ** attempt))
+
+    def stats(self) -> Dict[str, Any]:
+        calls = self._metrics["calls"]
+        return {
+            **self._metrics,
+            "max_concurrency": self.max_concurrency,
+            "avg_seconds": self._metrics["total_seconds"] / calls if calls else 0.0,
+        }
+
+
+llm_client = LLMClient(
+    api_key=settings.AZURE_OPENAI_API_KEY,
+    base_url=settings.AZURE_OPENAI_ENDPOINT,
+    api_version=settings.AZURE_OPENAI_API_VERSION,
+    max_connections=settings.OPENAI_MAX_CONNECTIONS,
+    timeout=settings.OPENAI_TIMEOUT_SECONDS,
+    max_concurrency=settings.OPENAI_MAX_CONCURRENCY,
+    max_retries=settings.OPENAI_MAX_RETRIES,
+    backoff_seconds=settings.OPENAI_BACKOFF_SECONDS,
+    backoff_max_seconds=settings.OPENAI_BACKOFF_MAX_SECONDS,
+)
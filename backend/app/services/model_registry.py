@@ -0,0 +1,96 @@
+# backend/app/services/model_registry.py
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class ModelEntry:
+    def __init__(self, name: str, loader: Callable[[], Any], is_loaded: Callable[[], bool]):
+        self.name = name
+        self.loader = loader
+        self.is_loaded = is_loaded
+        self.status = "not_loaded"  # not_loaded -> loading -> ready | failed
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+
+
+class ModelRegistry:
+    """
+    Knows every heavy model/resource the API can load and how to load it.
+
+    Nothing is loaded at import time: each resource loads on first use (the
+    services do that themselves) or when warm_up() loads it in the
+    background after the server has started accepting traffic. The
+    registry tracks the state of each one for the readiness endpoint.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, ModelEntry] = {}
+
+    def register(self, name: str, loader: Callable[[], Any], is_loaded: Callable[[], bool]) -> None:
+        """
+        Args:
+            name: Resource name reported by the readiness endpoint
+            loader: Blocking function that loads the resource (run in a thread)
+            is_loaded: Whether the resource was loaded, e.g. by first use
+        """
+        self._entries[name] = ModelEntry(name, loader, is_loaded)
+
+    async def load(self, name: str) -> bool:
+        entry = self._entries[name]
+        if entry.is_loaded():
+            entry.status = "ready"
+            return True
+
+        entry.status = "loading"
+        started_at = time.perf_counter()
+        try:
+            await asyncio.to_thread(entry.loader)
+        except Exception as e:
+            entry.status = "failed"
+            entry.error = str(e)
+            print(f"❌ Failed to load {name}: {e}")
+            return False
+        entry.load_seconds = time.perf_counter() - started_at
+        entry.status = "ready"
+        entry.error = None
+        print(f"✅ {name} loaded in {entry.load_seconds:.1f}s")
+        return True
+
+    async def warm_up(self, names: Iterable[str]) -> None:
+        """Load the given resources one after another (they compete for the same CPU)."""
+        for name in names:
+            if name not in self._entries:
+                print(f"⚠️ Unknown model '{name}' in warm-up list")
+                continue
+            await self.load(name)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        report = {}
+        for name, entry in self._entries.items():
+            # Loaded on first use by a request rather than by the registry
+            if entry.status == "not_loaded" and entry.is_loaded():
+                entry.status = "ready"
+            report[name] = {"status": entry.status, "load_seconds": entry.load_seconds, "error": entry.error}
+        return report
+
+    def is_ready(self, names: Iterable[str]) -> bool:
+        status = self.status()
+        return all(status.get(name, {}).get("status") == "ready" for name in names)
+
+
+def _build_registry() -> ModelRegistry:
+    from app.services.embedding_service import embedding_service
+    from app.services.vector_store_service import vector_store
+    # The API process only runs Whisper for live sessions; uploads go to the pipeline workers
+    from app.services.live_transcription_service import live_transcription_pool
+
+    registry = ModelRegistry()
+    registry.register("embedding_model", embedding_service.load, lambda: embedding_service.is_loaded)
+    registry.register("vector_store", vector_store.load, lambda: vector_store.is_loaded)
+    registry.register("whisper", live_transcription_pool.warm_up, lambda: live_transcription_pool.warmed_up)
+    return registry
+
+
+model_registry = _build_registry()
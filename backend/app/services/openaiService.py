@@ -1,27 +1,69 @@
+import asyncio
+import json
 import logging
-from typing import List, Dict
-from openai import OpenAI
-from dotenv import load_dotenv
-import os
-
-load_dotenv()
-AZURE_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
-AZURE_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
-API_VERSION = os.getenv("AZURE_OPENAI_API_VERSION")
-deployment_name = os.getenv("AZURE_OPENAI_MODEL")
+from datetime import date
+from typing import List, Dict, Optional
+from app.config.settings import settings
+from app.services.llm_client import llm_client
+
+APPOINTMENT_INFO_FIELDS = ("condition", "date", "time", "urgency")
+
+# How /api/chat gets the appointment fields each turn:
+#   "structured"  - one completion returns the reply and the fields (JSON schema)
+#   "incremental" - reply and a small extraction over the newest message only, concurrently
+#   "full"        - reply, then extraction over the whole conversation (two sequential calls)
+CHAT_EXTRACTION_MODES = ("structured", "incremental", "full")
+
+APPOINTMENT_INFO_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "condition": {"type": "string", "description": "detailed description of symptoms or medical condition, or empty string"},
+        "date": {"type": "string", "description": "preferred appointment date in YYYY-MM-DD format, or empty string"},
+        "time": {"type": "string", "description": "preferred appointment time in 24-hour HH:MM format, or empty string"},
+        "urgency": {"type": "string", "enum": ["urgent", "regular", "checkup", ""]},
+    },
+    "required": list(APPOINTMENT_INFO_FIELDS),
+    "additionalProperties": False,
+}
+
+CHAT_REPLY_SCHEMA = {
+    "name": "chat_reply",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "reply": {"type": "string", "description": "the message shown to the patient"},
+            "appointmentInfo": APPOINTMENT_INFO_SCHEMA,
+        },
+        "required": ["reply", "appointmentInfo"],
+        "additionalProperties": False,
+    },
+}
+
+
+def empty_appointment_info() -> Dict:
+    return {field: "" for field in APPOINTMENT_INFO_FIELDS}
+
+
+def merge_appointment_info(previous: Optional[Dict], update: Optional[Dict]) -> Dict:
+    """Fields found in `update` replace the previous ones; empty fields keep what was already known."""
+    merged = empty_appointment_info()
+    for source in (previous or {}, update or {}):
+        for field in APPOINTMENT_INFO_FIELDS:
+            value = source.get(field)
+            if isinstance(value, str) and value.strip():
+                merged[field] = value.strip()
+    return merged
 
 
 class OpenAIService:
     def __init__(self):
-        logging.debug("[OpenAIService] Initializing OpenAI Azure client...")
-        self.client = OpenAI(
-            api_key=AZURE_API_KEY,
-            base_url=AZURE_ENDPOINT,
-            default_query={"api-version": "preview"},
-        )
+        # Shared async client: pooled connections, timeouts, retries and a concurrency bound
+        self.client = llm_client
         self.deployment_name = "gpt-4o"
-        logging.debug(
-            f"[OpenAIService] Client initialized with endpoint {AZURE_ENDPOINT} and deployment '{self.deployment_name}'")
+        if settings.CHAT_EXTRACTION_MODE not in CHAT_EXTRACTION_MODES:
+            raise ValueError(f"Unknown CHAT_EXTRACTION_MODE '{settings.CHAT_EXTRACTION_MODE}', expected one of {CHAT_EXTRACTION_MODES}")
+        self.extraction_mode = settings.CHAT_EXTRACTION_MODE
 
     def get_system_prompt(self) -> str:
         return """You are a friendly and professional medical assistant chatbot for a healthcare platform. Your role is to:
@@ -78,7 +120,7 @@ class OpenAIService:
 Current conversation context: You are starting a new conversation with a patient.
         """
 
-    def extract_patient_info_with_llm(self, conversation_history: List[Dict]) -> Dict:
+    async def extract_patient_info_with_llm(self, conversation_history: List[Dict]) -> Dict:
         user_messages = "\n".join(
             msg["content"] for msg in conversation_history if msg.get("role") == "user" or msg.get("isUser")
         )
@@ -109,7 +151,7 @@ Current conversation context: You are starting a new conversation with a patient
     """
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat(
                 model=self.deployment_name,
                 messages=[
                     {"role": "system", "content": extraction_prompt},
@@ -122,7 +164,6 @@ Current conversation context: You are starting a new conversation with a patient
             extracted_text = response.choices[0].message.content.strip()
             
             # Try to parse JSON
-            import json
             try:
                 extracted_data = json.loads(extracted_text)
                 return extracted_data
@@ -150,7 +191,7 @@ Current conversation context: You are starting a new conversation with a patient
                 "medicalHistory": ""
             }
 
-    def extract_appointment_info_with_llm(self, conversation_history: List[Dict]) -> Dict:
+    async def extract_appointment_info_with_llm(self, conversation_history: List[Dict]) -> Dict:
         """Extract appointment information from conversation for existing patients"""
         user_messages = "\n".join(
             msg["content"] for msg in conversation_history if msg.get("role") == "user" or msg.get("isUser")
@@ -179,7 +220,7 @@ Current conversation context: You are starting a new conversation with a patient
     """
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat(
                 model=self.deployment_name,
                 messages=[
                     {"role": "system", "content": extraction_prompt},
@@ -192,7 +233,6 @@ Current conversation context: You are starting a new conversation with a patient
             extracted_text = response.choices[0].message.content.strip()
             
             # Try to parse JSON
-            import json
             try:
                 extracted_data = json.loads(extracted_text)
                 return extracted_data
@@ -312,7 +352,7 @@ Current conversation context: You are starting a new conversation with an existi
         # Return just the specialty name for searching
         return specialty
 
-    def recommend_doctors_with_llm(self, patient_info: Dict, doctors_database: List[Dict]) -> Dict:
+    async def recommend_doctors_with_llm(self, patient_info: Dict, doctors_database: List[Dict]) -> Dict:
         recommendation_prompt = f"""You are a medical specialist matcher.
         Patient Information:
         - Symptoms: {patient_info.get('symptoms')}
@@ -359,7 +399,7 @@ Rules:
         """
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat(
                 model=self.deployment_name,
                 messages=[{"role": "user", "content": recommendation_prompt}],
                 max_tokens=1000,
@@ -375,7 +415,7 @@ Rules:
                 "doctors": []
             }
 
-    def chat_with_patient(self, user_message: str, conversation_history: List[Dict] = None) -> Dict:
+    async def chat_with_patient(self, user_message: str, conversation_history: List[Dict] = None) -> Dict:
         conversation_history = conversation_history or []
         messages = [{"role": "system", "content": self.get_appointment_system_prompt()}] + conversation_history + [
             {"role": "user", "content": user_message}]
@@ -383,7 +423,7 @@ Rules:
         logging.debug("[chat_with_patient] Sending messages to OpenAI:\n%s", messages)
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat(
                 model=self.deployment_name,
                 messages=messages,
                 max_tokens=1000,
@@ -406,6 +446,154 @@ Rules:
                 "error": str(e)
             }
 
+    async def chat_with_extraction(self, user_message: str, conversation_history: List[Dict] = None,
+                                   previous_info: Optional[Dict] = None) -> Dict:
+        """
+        Reply to the patient and extract the appointment fields, using self.extraction_mode.
+
+        Returns the chat_with_patient response plus "appointmentInfo" (condition/date/time/urgency).
+        """
+        if self.extraction_mode == "structured":
+            return await self.chat_with_patient_structured(user_message, conversation_history, previous_info)
+
+        if self.extraction_mode == "incremental" and (previous_info is not None or not conversation_history):
+            # The extraction only needs the newest message, so it runs alongside the reply
+            ai_response, extracted_info = await asyncio.gather(
+                self.chat_with_patient(user_message, conversation_history),
+                self.extract_appointment_info_incremental(user_message, previous_info, conversation_history)
+            )
+        else:
+            # "full", or "incremental" without a previous state to build on
+            ai_response = await self.chat_with_patient(user_message, conversation_history)
+            if not ai_response.get("success"):
+                return ai_response
+            extracted_info = merge_appointment_info(
+                previous_info, await self.extract_appointment_info_with_llm(ai_response["conversationHistory"])
+            )
+
+        ai_response["appointmentInfo"] = extracted_info
+        return ai_response
+
+    async def chat_with_patient_structured(self, user_message: str, conversation_history: List[Dict] = None,
+                                           previous_info: Optional[Dict] = None) -> Dict:
+        """One completion returning both the reply and the updated appointment fields (JSON schema output)."""
+        conversation_history = conversation_history or []
+        previous_info = merge_appointment_info(previous_info, None)
+        system_prompt = self.get_appointment_system_prompt() + f"""
+Output format: return a JSON object with
+- "reply": your message to the patient, following the rules above
+- "appointmentInfo": the appointment details known so far, updated with the patient's latest message:
+  condition (detailed description of symptoms), date (YYYY-MM-DD), time (24-hour HH:MM),
+  urgency ("urgent", "regular" or "checkup"). Use empty strings for anything not mentioned.
+  Today is {date.today().isoformat()}. Previously extracted: {json.dumps(previous_info)}
+"""
+        messages = [{"role": "system", "content": system_prompt}] + conversation_history + [
+            {"role": "user", "content": user_message}]
+
+        try:
+            response = await self.client.chat(
+                model=self.deployment_name,
+                messages=messages,
+                max_tokens=1000,
+                temperature=0.7,
+                top_p=0.9,
+                response_format={"type": "json_schema", "json_schema": CHAT_REPLY_SCHEMA}
+            )
+            content = response.choices[0].message.content
+            try:
+                output = json.loads(content)
+                reply = output["reply"]
+                extracted_info = merge_appointment_info(previous_info, output.get("appointmentInfo"))
+            except (json.JSONDecodeError, KeyError, TypeError):
+                logging.warning("[chat_with_patient_structured] Reply was not valid JSON, keeping previous info")
+                reply, extracted_info = content, previous_info
+        except Exception as e:
+            logging.error(f"[chat_with_patient_structured] OpenAI Chat Error: {e}")
+            return {
+                "success": False,
+                "message": "I'm having trouble processing your request right now. Please try again later.",
+                "error": str(e)
+            }
+
+        # Same history shape as chat_with_patient (the plain appointment prompt, not the output instructions)
+        return {
+            "success": True,
+            "message": reply,
+            "conversationHistory": [{"role": "system", "content": self.get_appointment_system_prompt()}]
+                                   + conversation_history + [{"role": "user", "content": user_message}],
+            "appointmentInfo": extracted_info
+        }
+
+    async def extract_appointment_info_incremental(self, user_message: str, previous_info: Optional[Dict] = None,
+                                                   conversation_history: List[Dict] = None) -> Dict:
+        """
+        Update the previously extracted appointment fields from the newest patient message only.
+
+        The last assistant message is included so short answers ("yes, 10am works") can be resolved.
+        """
+        previous_info = merge_appointment_info(previous_info, None)
+        last_assistant_message = next(
+            (msg["content"] for msg in reversed(conversation_history or [])
+             if msg.get("role") == "assistant" and not msg.get("isUser")),
+            ""
+        )
+
+        extraction_prompt = f"""You are a data extraction specialist. Update appointment booking information with the patient's newest message.
+
+    Previously extracted: {json.dumps(previous_info)}
+    Assistant's last message: {last_assistant_message}
+    Today is {date.today().isoformat()}.
+
+    Return ONLY a valid JSON object with the fields condition, date, time and urgency:
+    - Keep previous values unless the new message changes or adds to them
+    - For condition, combine the previous description with any new symptoms
+    - For date, use YYYY-MM-DD format; for time, use 24-hour format (HH:MM)
+    - For urgency, use "urgent", "regular", or "checkup"
+    - Use empty string for anything still unknown
+    """
+
+        try:
+            response = await self.client.chat(
+                model=self.deployment_name,
+                messages=[
+                    {"role": "system", "content": extraction_prompt},
+                    {"role": "user", "content": user_message}
+                ],
+                temperature=0.1,
+                max_tokens=300,
+                response_format={"type": "json_object"}
+            )
+            update = json.loads(response.choices[0].message.content)
+            return merge_appointment_info(previous_info, update)
+        except Exception as e:
+            logging.error(f"Error extracting appointment info incrementally: {e}")
+            return previous_info
+
+    async def summarize_conversation(self, previous_summary: str, messages: List[Dict]) -> str:
+        """Fold older chat turns into the rolling conversation summary (see chat_session_service)."""
+        transcript = "\n".join(f"{msg['role']}: {msg['content']}" for msg in messages)
+        prompt = f"""Update the summary of a conversation between a patient and a medical appointment assistant.
+
+    Current summary:
+    {previous_summary or "(none)"}
+
+    New messages:
+    {transcript}
+
+    Rules:
+    - Keep every fact needed to continue the conversation: symptoms and condition, preferred dates and times,
+      urgency, doctors that were suggested or chosen, and what the assistant last asked
+    - Write at most 150 words, in plain sentences, with no other text
+    """
+
+        response = await self.client.chat(
+            model=self.deployment_name,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.1,
+            max_tokens=300
+        )
+        return response.choices[0].message.content.strip()
+
     def is_confirming_recommendations(self, user_message: str) -> bool:
         confirmations = [
             'yes', 'sure', 'okay', 'please', 'go ahead', 'proceed', 'continue', 'ok', 'yeah', 'yep',
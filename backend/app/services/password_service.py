@@ -0,0 +1,83 @@
+# backend/app/services/password_service.py
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+from passlib.context import CryptContext
+from app.config.settings import settings
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt hashing/verification in a bounded thread pool.
+
+    bcrypt deliberately takes ~200ms per call; running it directly in an
+    async handler blocks the event loop for every other request. The C
+    implementation releases the GIL, so a thread pool gives real parallelism.
+    A semaphore caps how many calls may be queued or running at once, so a
+    login storm waits here instead of piling work onto the executor.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._semaphore = None
+        self._metrics = {
+            "calls": 0,
+            "in_flight": 0,
+            "total_wait_seconds": 0.0,
+            "total_run_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.pwd_context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(self.pwd_context.verify, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        calls = self._metrics["calls"]
+        return {
+            **self._metrics,
+            "max_workers": self._max_workers,
+            "max_pending": self._max_pending,
+            "avg_wait_seconds": self._metrics["total_wait_seconds"] / calls if calls else 0.0,
+            "avg_run_seconds": self._metrics["total_run_seconds"] / calls if calls else 0.0,
+        }
+
+    async def _run(self, func: Callable, *args):
+        # Created lazily so it binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_pending)
+
+        queued_at = time.perf_counter()
+        async with self._semaphore:
+            self._metrics["in_flight"] += 1
+            try:
+                loop = asyncio.get_running_loop()
+                result, started_at, finished_at = await loop.run_in_executor(self._executor, self._timed, func, args)
+            finally:
+                self._metrics["in_flight"] -= 1
+
+        waited = started_at - queued_at
+        self._metrics["calls"] += 1
+        self._metrics["total_wait_seconds"] += waited
+        self._metrics["total_run_seconds"] += finished_at - started_at
+        self._metrics["max_wait_seconds"] = max(self._metrics["max_wait_seconds"], waited)
+        return result
+
+    @staticmethod
+    def _timed(func: Callable, args: tuple):
+        started_at = time.perf_counter()
+        result = func(*args)
+        return result, started_at, time.perf_counter()
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
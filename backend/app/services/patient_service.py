@@ -1,10 +1,12 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 import uuid
 
 from app.schemas.patient_schema import PatientCreate, PatientResponse, PatientUpdate
 from app.models.patient import Patient
 from app.utils.serializers import serialize_mongo_doc
+from app.utils.pagination import fetch_page
+from app.services.principal_cache import principal_cache
 from app.database import get_database
 from bson import ObjectId
 
@@ -25,6 +27,7 @@ async def create_patient_logic(patient_data: PatientCreate, user_id: str) -> Pat
     
     result = await db.patients_new.insert_one(patient_dict)
     created_patient = await db.patients_new.find_one({"_id": result.inserted_id})
+    principal_cache.invalidate_user(user_id)
     return Patient(**serialize_mongo_doc(created_patient))
 
 # READ ALL (admin only)
@@ -34,6 +37,12 @@ async def get_all_patients() -> List[Patient]:
     patients = [Patient(**serialize_mongo_doc(doc)) async for doc in cursor]
     return patients
 
+# READ a page (admin only, keyset pagination)
+async def get_patients_page(limit: int, cursor: Optional[str] = None) -> Tuple[List[Patient], Optional[str]]:
+    db = get_database()
+    docs, next_cursor = await fetch_page(db.patients_new, {}, limit, cursor)
+    return [Patient(**serialize_mongo_doc(doc)) for doc in docs], next_cursor
+
 # READ by ID
 async def get_patient_by_id(patient_id: str) -> Optional[Patient]:
     db = get_database()
@@ -42,6 +51,11 @@ async def get_patient_by_id(patient_id: str) -> Optional[Patient]:
 
 # READ by user_id (for patients to get their own profile)
 async def get_patient_by_user_id(user_id: str) -> Optional[Patient]:
+    # Authenticated requests usually already resolved the patient in get_current_user
+    cached = principal_cache.get_by_user_id(user_id)
+    if cached is not None:
+        return cached.patient
+
     db = get_database()
     doc = await db.patients_new.find_one({"user_id": user_id})
     return Patient(**serialize_mongo_doc(doc)) if doc else None
@@ -49,8 +63,11 @@ async def get_patient_by_user_id(user_id: str) -> Optional[Patient]:
 # DELETE
 async def delete_patient(patient_id: str) -> bool:
     db = get_database()
-    result = await db.patients_new.delete_one({"id": patient_id})
-    return result.deleted_count == 1
+    deleted = await db.patients_new.find_one_and_delete({"id": patient_id}, projection={"user_id": 1})
+    if not deleted:
+        return False
+    principal_cache.invalidate_user(deleted.get("user_id"))
+    return True
 
 # UPDATE
 async def update_patient(patient_id: str, data: PatientUpdate) -> Optional[Patient]:
@@ -65,4 +82,5 @@ async def update_patient(patient_id: str, data: PatientUpdate) -> Optional[Patie
     )
     if not result:
         return None
+    principal_cache.invalidate_user(result.get("user_id"))
     return Patient(**serialize_mongo_doc(result))
\ No newline at end of file
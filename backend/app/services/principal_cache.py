@@ -0,0 +1,76 @@
+# backend/app/services/principal_cache.py
+
+import time
+from collections import OrderedDict
+from typing import Optional
+from pydantic import BaseModel
+from app.models.user import User
+from app.models.patient import Patient
+from app.config.settings import settings
+
+
+class Principal(BaseModel):
+    user: User
+    patient: Optional[Patient] = None
+
+
+class PrincipalCache:
+    """
+    In-process TTL + LRU cache of authenticated principals.
+
+    Entries are keyed by the token subject (the user's contact) and hold the
+    User together with its Patient profile, so an authenticated request does
+    not have to hit `users` and `patients_new` every time. The TTL bounds how
+    stale an entry can get in other worker processes, which cannot see this
+    process's invalidations.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, tuple[float, Principal]]" = OrderedDict()
+        self._subject_by_user_id: dict[str, str] = {}
+
+    def get(self, subject: str) -> Optional[Principal]:
+        entry = self._entries.get(subject)
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if expires_at < time.monotonic():
+            self._remove(subject)
+            return None
+        self._entries.move_to_end(subject)
+        return principal
+
+    def get_by_user_id(self, user_id: str) -> Optional[Principal]:
+        subject = self._subject_by_user_id.get(user_id)
+        return self.get(subject) if subject else None
+
+    def set(self, subject: str, principal: Principal) -> None:
+        self._remove(subject)
+        self._entries[subject] = (time.monotonic() + self.ttl_seconds, principal)
+        self._subject_by_user_id[principal.user.id] = subject
+        while len(self._entries) > self.max_size:
+            oldest_subject = next(iter(self._entries))
+            self._remove(oldest_subject)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop the cached principal for a user (call after the user or its patient changes)."""
+        subject = self._subject_by_user_id.get(user_id)
+        if subject:
+            self._remove(subject)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._subject_by_user_id.clear()
+
+    def _remove(self, subject: str) -> None:
+        entry = self._entries.pop(subject, None)
+        if entry is not None:
+            self._subject_by_user_id.pop(entry[1].user.id, None)
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_size=settings.PRINCIPAL_CACHE_SIZE
+)
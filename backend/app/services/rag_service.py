@@ -1,40 +1,14 @@
-import os
 from app.database import db
-from sentence_transformers import SentenceTransformer
-from langchain.vectorstores import Chroma
-from langchain.embeddings import HuggingFaceEmbeddings
-
-# ✅ Embedding setup
-embedding_model_name = "all-MiniLM-L6-v2"
-embedding_function = HuggingFaceEmbeddings(model_name=embedding_model_name)
-
-VECTOR_DB_DIR = os.path.join(os.getcwd(), "vector_db")
+from app.services.content_cache_service import embed_with_cache
+from app.services.vector_store_service import vector_store
 
 # ✅ Function to clear existing vector store data for an appointment
 async def clear_vector_store_for_appointment(appointment_id: str) -> bool:
     try:
         print(f"🧹 Clearing existing vector store data for appointment: {appointment_id}")
         
-        # Load the vector store
-        vectorstore = Chroma(
-            persist_directory=VECTOR_DB_DIR,
-            embedding_function=embedding_function
-        )
-        
-        # Get all documents with this appointment_id
-        results = vectorstore.similarity_search(
-            "",  # Empty query to get all documents
-            k=1000,  # Large number to get all documents
-            filter={"appointment_id": appointment_id}
-        )
-        
-        if results:
-            print(f"🗑️ Found {len(results)} existing documents to remove")
-            # Remove documents by their IDs
-            doc_ids = [doc.metadata.get("id", "") for doc in results if doc.metadata.get("id")]
-            if doc_ids:
-                vectorstore._collection.delete(ids=doc_ids)
-                print(f"✅ Removed {len(doc_ids)} documents")
+        await vector_store.delete_by_appointment(appointment_id)
+        print(f"✅ Cleared vector store data for appointment: {appointment_id}")
         
         return True
     except Exception as e:
@@ -87,18 +61,19 @@ async def build_vector_store_from_appointment(appointment_id: str) -> bool:
         print(f"📄 Prepared {len(texts)} text chunks", flush=True)
         print(f"📄 Sample texts: {texts[:2]}", flush=True)  # Show first 2 chunks
 
-        # Step 4: Load vector store and insert
-        print(f"📦 Initializing Chroma at: {VECTOR_DB_DIR}", flush=True)
-        vectorstore = Chroma(
-            persist_directory=VECTOR_DB_DIR,
-            embedding_function=embedding_function
-        )
+        # Step 4: Upsert into the shared vector store, keyed by the deterministic chunk ids
+        # Unchanged chunks (re-uploads, manual rebuilds) reuse their cached embeddings
+        embeddings = await embed_with_cache(texts, vector_store.embed_documents, vector_store.embedding_model_name)
 
         print("➕ Adding documents to vector store...", flush=True)
-        vectorstore.add_texts(texts=texts, metadatas=metadatas)
-
-        vectorstore.persist()
-        print(f"✅ Vector store persisted to: {VECTOR_DB_DIR}", flush=True)
+        await vector_store.add(
+            appointment_id,
+            texts=texts,
+            metadatas=metadatas,
+            ids=[metadata["id"] for metadata in metadatas],
+            embeddings=embeddings
+        )
+        print(f"✅ Vector store updated at: {vector_store.location}", flush=True)
         return True
 
     except Exception as e:
@@ -0,0 +1,142 @@
+# backend/app/services/transcription_pool.py
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Optional
+import numpy as np
+from app.config.settings import settings
+
+
+class TranscriptionPoolSaturatedError(RuntimeError):
+    """Raised when no transcription slot frees up within the queue timeout."""
+
+
+def _init_worker(model_name: str) -> None:
+    # Preload the model once per worker process, before the first job arrives
+    from app.services.whisper_transcriber_service import load_model
+    load_model(model_name)
+
+
+def _check_worker() -> bool:
+    from app.services import whisper_transcriber_service
+    return whisper_transcriber_service.model is not None
+
+
+def _transcribe_in_worker(audio_file_path: str) -> Dict[str, Any]:
+    from app.services.whisper_transcriber_service import transcribe_audio_file
+    return transcribe_audio_file(audio_file_path)
+
+
+def _transcribe_shared_array_in_worker(shm_name: str, length: int) -> Dict[str, Any]:
+    from app.services.whisper_transcriber_service import transcribe_audio_array
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        # Copy out so Whisper's tensors don't keep the segment mapped
+        audio = np.ndarray((length,), dtype=np.float32, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+    return transcribe_audio_array(audio)
+
+
+class TranscriptionPool:
+    """
+    Hosts the Whisper model in a pool of separate worker processes.
+
+    Each worker loads the model once at startup, so the calling process
+    never imports or loads Whisper itself, and transcriptions run in
+    parallel across cores. At most `workers + max_queue` transcriptions are
+    accepted at a time; further callers wait up to `queue_timeout` seconds
+    for a slot and then get TranscriptionPoolSaturatedError.
+    """
+
+    def __init__(self, model_name: str, workers: int, max_queue: int, queue_timeout: float):
+        self.model_name = model_name
+        self.workers = workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._start_lock = threading.Lock()
+        self.in_flight = 0
+        self.warmed_up = False
+
+    def _ensure_started(self) -> None:
+        self._start_executor()
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers + self.max_queue)
+
+    def _start_executor(self) -> None:
+        with self._start_lock:
+            if self._executor is not None:
+                return
+            print(f"🎙️ Starting transcription pool: {self.workers} workers, model '{self.model_name}'")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.model_name,)
+            )
+
+    def warm_up(self) -> None:
+        """Start a worker and wait until it has loaded the model (blocking)."""
+        self._start_executor()
+        if not self._executor.submit(_check_worker).result():
+            raise RuntimeError(f"Whisper model '{self.model_name}' failed to load")
+        self.warmed_up = True
+
+    async def transcribe(self, audio_file_path: str) -> Dict[str, Any]:
+        return await self._submit(_transcribe_in_worker, audio_file_path)
+
+    async def transcribe_array(self, audio: np.ndarray, wait_for_slot: bool = False) -> Dict[str, Any]:
+        """
+        Transcribe decoded mono float32 audio at 16 kHz.
+
+        The samples are handed to the worker through shared memory rather
+        than pickled over the pool's pipe, which matters for long recordings.
+        Pass wait_for_slot=True for windows of a recording that is already
+        being transcribed, so they queue instead of timing out.
+        """
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, audio.nbytes))
+        try:
+            np.ndarray(audio.shape, dtype=np.float32, buffer=shm.buf)[:] = audio
+            return await self._submit(_transcribe_shared_array_in_worker, shm.name, len(audio), wait_for_slot=wait_for_slot)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    async def _submit(self, func: Callable, *args, wait_for_slot: bool = False) -> Dict[str, Any]:
+        self._ensure_started()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=None if wait_for_slot else self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise TranscriptionPoolSaturatedError(
+                f"Transcription pool is saturated ({self.in_flight} in flight)"
+            )
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, func, *args)
+            self.warmed_up = True
+            return result
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+transcription_pool = TranscriptionPool(
+    model_name=settings.WHISPER_MODEL,
+    workers=settings.WHISPER_WORKERS or max(1, (os.cpu_count() or 2) // 2),
+    max_queue=settings.WHISPER_MAX_QUEUE,
+    queue_timeout=settings.WHISPER_QUEUE_TIMEOUT_SECONDS
+)
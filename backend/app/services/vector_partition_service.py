@@ -0,0 +1,97 @@
+# backend/app/services/vector_partition_service.py
+
+import re
+from collections import OrderedDict
+from datetime import datetime
+from app.database import get_database
+from app.config.settings import settings
+
+PARTITIONS_COLLECTION = "vector_partitions"
+
+# Collection langchain's Chroma wrapper uses by default; chunks written before
+# partitioning (and appointments without a route) live here.
+LEGACY_COLLECTION = "langchain"
+
+PARTITION_STRATEGIES = ("doctor", "month", "none")
+
+# Partition key used when an appointment has no doctor or no usable date
+UNKNOWN_PARTITION_KEY = "unknown"
+
+
+def partition_name(strategy: str, doctor_id: str, date: str) -> str:
+    """Chroma collection for an appointment under a partitioning strategy."""
+    if strategy == "doctor":
+        name = f"notes_doctor_{doctor_id or UNKNOWN_PARTITION_KEY}"
+    elif strategy == "month":
+        month = (date or "")[:7]
+        if not re.fullmatch(r"\d{4}-\d{2}", month):
+            month = UNKNOWN_PARTITION_KEY
+        name = f"notes_month_{month}"
+    else:
+        return LEGACY_COLLECTION
+    # Chroma collection names: [a-zA-Z0-9._-], 3-512 characters, starting and ending alphanumeric
+    return re.sub(r"[^a-zA-Z0-9._-]", "_", name).rstrip("._-")[:512]
+
+
+class VectorPartitionRouter:
+    """
+    Routing table from appointment to the Chroma collection holding its chunks.
+
+    Routes are stored in Mongo (`vector_partitions`) so they survive a change
+    of strategy: an appointment keeps being read from the collection it was
+    written to until it is re-ingested or migrated. Routes rarely change,
+    so lookups are cached in-process.
+    """
+
+    def __init__(self, strategy: str, max_cached: int = 10000):
+        if strategy not in PARTITION_STRATEGIES:
+            raise ValueError(f"Unknown vector partition strategy '{strategy}'")
+        self.strategy = strategy
+        self.max_cached = max_cached
+        self._routes: "OrderedDict[str, str]" = OrderedDict()
+
+    async def get(self, appointment_id: str) -> str:
+        """Collection to read an appointment's chunks from."""
+        cached = self._routes.get(appointment_id)
+        if cached:
+            self._routes.move_to_end(appointment_id)
+            return cached
+        db = get_database()
+        route = await db[PARTITIONS_COLLECTION].find_one({"appointment_id": appointment_id})
+        collection = route["collection"] if route else LEGACY_COLLECTION
+        if route:
+            self._remember(appointment_id, collection)
+        return collection
+
+    async def resolve(self, appointment_id: str) -> str:
+        """Partition an appointment belongs in under the current strategy (not recorded)."""
+        from app.services.appointment_service import get_appointment_by_id
+
+        appointment = await get_appointment_by_id(appointment_id)
+        if not appointment:
+            return LEGACY_COLLECTION
+        return partition_name(self.strategy, appointment.doctor_id, appointment.date)
+
+    async def assign(self, appointment_id: str) -> str:
+        """Route an appointment to its partition under the current strategy and record it."""
+        collection = await self.resolve(appointment_id)
+        await self.set(appointment_id, collection)
+        return collection
+
+    async def set(self, appointment_id: str, collection: str) -> None:
+        db = get_database()
+        await db[PARTITIONS_COLLECTION].update_one(
+            {"appointment_id": appointment_id},
+            {"$set": {"collection": collection, "strategy": self.strategy, "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+        self._remember(appointment_id, collection)
+
+    def _remember(self, appointment_id: str, collection: str) -> None:
+        self._routes[appointment_id] = collection
+        self._routes.move_to_end(appointment_id)
+        while len(self._routes) > self.max_cached:
+            self._routes.popitem(last=False)
+
+
+partition_router = VectorPartitionRouter(settings.VECTOR_PARTITION_STRATEGY)
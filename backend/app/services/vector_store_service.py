@@ -0,0 +1,162 @@
+# backend/app/services/vector_store_service.py
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+from app.config.settings import settings
+from app.services.vector_partition_service import partition_router
+from app.services.embedding_service import embedding_service, EmbeddingService
+
+VECTOR_DB_DIR = os.path.join(os.getcwd(), "vector_db")
+
+
+class VectorStoreService:
+    """
+    One Chroma client per process, behind async methods.
+
+    By default the persist directory is opened in-process
+    (PersistentClient), which needs nothing else running but is not safe
+    to share between processes. Deployments where the API and the audio
+    pipeline workers run as separate processes set CHROMA_SERVER_HOST, so
+    every process talks to one Chroma server (chromadb.HttpClient).
+
+    Ingestion (rag_service) and the notes chatbot share this instance, so
+    both use the same warm index instead of each opening the persist
+    directory. Embeddings come from the shared EmbeddingService. Chroma
+    and the embedding model are synchronous, so every call runs on a small
+    thread pool rather than blocking the event loop. Both are loaded on
+    first use.
+
+    Chunks are partitioned into several collections (see
+    vector_partition_service); every appointment-scoped call is routed to
+    the collection holding that appointment, so a query only searches a
+    small index.
+    """
+
+    def __init__(self, persist_directory: str, embeddings: EmbeddingService, max_workers: int,
+                 server_host: str = "", server_port: int = 8001):
+        self.persist_directory = persist_directory
+        self.server_host = server_host
+        self.server_port = server_port
+        self.embeddings = embeddings
+        self.embedding_model_name = embeddings.cache_key
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chroma")
+        self._lock = threading.Lock()
+        self._client = None
+        self._stores: Dict[str, Any] = {}
+
+    def _ensure_client(self) -> None:
+        if self._client is not None:
+            return
+        with self._lock:
+            if self._client is None:
+                import chromadb
+
+                print(f"📦 Opening vector store at: {self.location}")
+                if self.server_host:
+                    self._client = chromadb.HttpClient(host=self.server_host, port=self.server_port)
+                else:
+                    self._client = chromadb.PersistentClient(path=self.persist_directory)
+
+    def load(self) -> None:
+        """Open the client now rather than on first use (blocking); raises if the Chroma server is unreachable."""
+        self._ensure_client()
+        if self.server_host:
+            self._client.heartbeat()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._client is not None
+
+    @property
+    def location(self) -> str:
+        """Where the index lives, for log messages."""
+        if self.server_host:
+            return f"http://{self.server_host}:{self.server_port}"
+        return self.persist_directory
+
+    def get_store(self, collection_name: str):
+        """langchain Chroma wrapper for one collection (blocking; created on first use)."""
+        store = self._stores.get(collection_name)
+        if store is not None:
+            return store
+        self._ensure_client()
+        with self._lock:
+            if collection_name not in self._stores:
+                from langchain.vectorstores import Chroma
+
+                self._stores[collection_name] = Chroma(
+                    client=self._client,
+                    collection_name=collection_name,
+                    embedding_function=self.embeddings
+                )
+            return self._stores[collection_name]
+
+    def list_collections(self) -> List[str]:
+        """Names of every collection in the vector store (blocking)."""
+        self._ensure_client()
+        return [collection.name for collection in self._client.list_collections()]
+
+    async def _run(self, func: Callable, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self._run(self.embeddings.embed_documents, texts)
+
+    async def add(
+        self,
+        appointment_id: str,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        embeddings: Optional[List[List[float]]] = None
+    ) -> None:
+        """
+        Upsert an appointment's chunks under the given ids into its partition;
+        embeddings are computed here unless precomputed ones are passed.
+        Re-adding the same ids replaces the chunks.
+        """
+        collection_name = await partition_router.assign(appointment_id)
+
+        def add():
+            store = self.get_store(collection_name)
+            vectors = embeddings if embeddings is not None else self.embeddings.embed_documents(texts)
+            store._collection.upsert(ids=ids, embeddings=vectors, documents=texts, metadatas=metadatas)
+        await self._run(add)
+
+    async def delete_by_appointment(self, appointment_id: str) -> None:
+        """Remove every chunk of an appointment."""
+        collection_name = await partition_router.get(appointment_id)
+        # One metadata-filtered delete: no id lookup first, so no window for chunks added in between
+        await self._run(
+            lambda: self.get_store(collection_name)._collection.delete(where={"appointment_id": appointment_id})
+        )
+
+    async def query(self, query: str, appointment_id: str, k: int = 3) -> List[str]:
+        """Texts of the k chunks of an appointment most similar to the query."""
+        collection_name = await partition_router.get(appointment_id)
+        results = await self._run(
+            lambda: self.get_store(collection_name).similarity_search(query, k=k, filter={"appointment_id": appointment_id})
+        )
+        return [doc.page_content for doc in results]
+
+    async def count(self, collection_name: Optional[str] = None) -> int:
+        """Chunks in one collection, or across all of them."""
+        def count():
+            if collection_name:
+                return self.get_store(collection_name)._collection.count()
+            return sum(self.get_store(name)._collection.count() for name in self.list_collections())
+        return await self._run(count)
+
+
+vector_store = VectorStoreService(
+    persist_directory=VECTOR_DB_DIR,
+    server_host=settings.CHROMA_SERVER_HOST,
+    server_port=settings.CHROMA_SERVER_PORT,
+    embeddings=embedding_service,
+    max_workers=settings.VECTOR_STORE_WORKERS
+)
@@ -1,18 +1,34 @@
 # backend/app/services/whisper_transcriber.py
 
-import whisper
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import tempfile
 import os
 
-# Load the Whisper model once globally
-print("Loading Whisper model...")
-try:
-    model = whisper.load_model("base")  # You can also use "small", "medium", or "large"
-    print("Whisper model loaded successfully")
-except Exception as e:
-    print(f"❌ Error loading Whisper model: {e}")
-    model = None
+# The Whisper model is loaded on first use (normally inside a transcription
+# pool worker process), so importing this module stays cheap.
+model = None
+model_name: Optional[str] = None
+
+# Whisper expects mono audio at this rate
+SAMPLE_RATE = 16000
+
+
+def load_model(name: str = "base"):
+    """Load the Whisper model into this process, once."""
+    global model, model_name
+    if model is not None and model_name == name:
+        return model
+
+    import whisper
+    print(f"Loading Whisper model '{name}' in process {os.getpid()}...")
+    try:
+        model = whisper.load_model(name)  # You can also use "small", "medium", or "large"
+        model_name = name
+        print("Whisper model loaded successfully")
+    except Exception as e:
+        print(f"❌ Error loading Whisper model: {e}")
+        model = None
+    return model
 
 
 def test_whisper_installation():
@@ -59,6 +75,8 @@ def transcribe_audio_file(audio_file_path: str) -> Dict[str, Any]:
     """
     Transcribe an audio file using Whisper
     """
+    if model is None:
+        load_model()
     if model is None:
         print("❌ Whisper model not loaded")
         return {
@@ -110,6 +128,54 @@ def transcribe_audio_file(audio_file_path: str) -> Dict[str, Any]:
         }
 
 
+def transcribe_audio_array(audio) -> Dict[str, Any]:
+    """
+    Transcribe already decoded audio (mono float32 NumPy array at 16 kHz)
+    """
+    if model is None:
+        load_model()
+    if model is None:
+        print("❌ Whisper model not loaded")
+        return {
+            "text": "Transcription failed: Whisper model not loaded",
+            "segments": [
+                {
+                    "start": 0,
+                    "end": 1,
+                    "text": "Transcription failed: Whisper model not loaded"
+                }
+            ]
+        }
+
+    try:
+        print(f"Transcribing {len(audio) / SAMPLE_RATE:.1f}s of decoded audio")
+
+        if len(audio) == 0:
+            raise ValueError("Decoded audio is empty")
+
+        # Whisper skips its own ffmpeg decode when given an array
+        result = model.transcribe(audio)
+
+        print(f"Transcription successful. Text length: {len(result.get('text', ''))}")
+        print(f"Number of segments: {len(result.get('segments', []))}")
+
+        return result
+    except Exception as e:
+        print(f"Error transcribing audio: {e}")
+        import traceback
+        traceback.print_exc()
+        return {
+            "text": f"Transcription failed: {str(e)}",
+            "segments": [
+                {
+                    "start": 0,
+                    "end": 1,
+                    "text": f"Transcription failed: {str(e)}"
+                }
+            ]
+        }
+
+
 def merge_segments_by_token_limit(segments, max_tokens=300) -> List[Dict[str, Any]]:
     merged_chunks = []
     current_chunk = {"start": None, "end": None, "text": "", "token_count": 0}
@@ -0,0 +1,79 @@
+# backend/app/utils/audio_segmentation.py
+
+from typing import Any, Dict, List, Tuple
+import numpy as np
+
+FRAME_MS = 30
+SMOOTHING_FRAMES = 10  # ~300ms, so a cut lands in a pause rather than between syllables
+
+
+def frame_energy(audio: np.ndarray, sample_rate: int, frame_ms: int = FRAME_MS) -> np.ndarray:
+    """RMS energy of consecutive non-overlapping frames."""
+    frame = int(sample_rate * frame_ms / 1000)
+    n_frames = len(audio) // frame
+    if n_frames == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = audio[:n_frames * frame].reshape(n_frames, frame)
+    return np.sqrt(np.mean(frames ** 2, axis=1))
+
+
+def find_silence_splits(
+    audio: np.ndarray,
+    sample_rate: int,
+    window_seconds: float,
+    search_seconds: float,
+) -> List[Tuple[int, int]]:
+    """
+    Split audio into windows of roughly `window_seconds`, cutting at silence.
+
+    Energy-based VAD: for every target cut point the quietest stretch of
+    (smoothed) frame energy within `search_seconds` either side is chosen,
+    so windows end in pauses instead of mid-word.
+
+    Returns:
+        List[Tuple[int, int]]: (start_sample, end_sample) for each window
+    """
+    total = len(audio)
+    window = int(window_seconds * sample_rate)
+    if total <= window:
+        return [(0, total)]
+
+    frame = int(sample_rate * FRAME_MS / 1000)
+    energy = frame_energy(audio, sample_rate)
+    smoothed = np.convolve(energy, np.ones(SMOOTHING_FRAMES) / SMOOTHING_FRAMES, mode="same")
+    search = int(search_seconds * 1000 / FRAME_MS)
+
+    windows = []
+    start = 0
+    while total - start > window:
+        target = (start + window) // frame
+        lo = max(start // frame + 1, target - search)
+        hi = min(len(smoothed), target + search + 1)
+        cut = (lo + int(np.argmin(smoothed[lo:hi]))) * frame if hi > lo else start + window
+        windows.append((start, cut))
+        start = cut
+    windows.append((start, total))
+    return windows
+
+
+def stitch_transcripts(results: List[Dict[str, Any]], offsets: List[float]) -> Dict[str, Any]:
+    """
+    Combine per-window Whisper results into one, shifting segment times by
+    each window's offset (seconds) so they line up with the full recording.
+    """
+    segments = []
+    for result, offset in zip(results, offsets):
+        for seg in result.get("segments", []):
+            shifted = {**seg, "id": len(segments), "start": seg["start"] + offset, "end": seg["end"] + offset}
+            if "words" in seg:
+                shifted["words"] = [
+                    {**word, "start": word["start"] + offset, "end": word["end"] + offset}
+                    for word in seg["words"]
+                ]
+            segments.append(shifted)
+
+    return {
+        "text": "".join(result.get("text", "") for result in results),
+        "segments": segments,
+        "language": results[0].get("language") if results else None,
+    }
@@ -0,0 +1,66 @@
+# backend/app/utils/pagination.py
+
+import base64
+import json
+from typing import Optional, Tuple, List
+from bson import ObjectId
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Response header carrying the cursor for the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(last_id: ObjectId) -> str:
+    """Turn the _id of the last returned document into an opaque cursor string."""
+    raw = json.dumps({"_id": str(last_id)}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> ObjectId:
+    """Decode a cursor produced by encode_cursor. Raises ValueError if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return ObjectId(data["_id"])
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def date_range_filter(field: str, date_from: Optional[str] = None, date_to: Optional[str] = None) -> dict:
+    """Build an inclusive range filter on a YYYY-MM-DD string field."""
+    bounds = {}
+    if date_from:
+        bounds["$gte"] = date_from
+    if date_to:
+        bounds["$lte"] = date_to
+    return {field: bounds} if bounds else {}
+
+
+async def fetch_page(collection, query: dict, limit: int, cursor: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+    """
+    Fetch one page of documents using keyset pagination on _id.
+
+    Args:
+        collection: Motor collection to read from
+        query: Mongo filter applied before paging
+        limit: Maximum number of documents to return
+        cursor: Cursor returned by the previous page, if any
+
+    Returns:
+        Tuple[List[dict], Optional[str]]: The raw documents and the cursor for the
+        next page (None when there are no more documents)
+    """
+    if cursor:
+        query = {"$and": [query, {"_id": {"$gt": decode_cursor(cursor)}}]}
+
+    # Ask for one extra document to know whether another page exists
+    docs = await collection.find(query).sort("_id", 1).limit(limit + 1).to_list(length=limit + 1)
+
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_cursor(docs[-1]["_id"])
+
+    return docs, next_cursor
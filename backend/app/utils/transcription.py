@@ -2,9 +2,123 @@
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+import asyncio
 import os
 import tempfile
-from app.services.whisper_transcriber_service import transcribe_audio_file
+import numpy as np
+from app.config.settings import settings
+from app.services.transcription_pool import transcription_pool, TranscriptionPoolSaturatedError
+from app.services.whisper_transcriber_service import SAMPLE_RATE
+from app.utils.audio_segmentation import find_silence_splits, stitch_transcripts
+from app.services.content_cache_service import get_cached_transcript, save_cached_transcript
+
+
+class AudioDecodeError(RuntimeError):
+    """Raised when ffmpeg cannot decode the audio it is piped."""
+
+
+async def decode_audio_stream(grid_out) -> np.ndarray:
+    """
+    Decode a GridFS download stream to mono float32 PCM at Whisper's sample rate.
+
+    The stored chunks are piped straight into ffmpeg's stdin while its stdout
+    is read concurrently, so the recording never touches the disk.
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-loglevel", "error", "-threads", "0",
+            "-i", "pipe:0",
+            "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE),
+            "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except FileNotFoundError as e:
+        raise AudioDecodeError("ffmpeg is not installed") from e
+
+    async def feed():
+        try:
+            while True:
+                chunk = await grid_out.readchunk()
+                if not chunk:
+                    break
+                process.stdin.write(chunk)
+                await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # ffmpeg gave up on the input; its exit code and stderr say why
+            pass
+        finally:
+            process.stdin.close()
+
+    _, pcm, stderr = await asyncio.gather(feed(), process.stdout.read(), process.stderr.read())
+    if await process.wait() != 0:
+        raise AudioDecodeError(f"ffmpeg failed: {stderr.decode(errors='replace').strip()}")
+
+    # Same conversion whisper.load_audio does
+    return np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+
+
+def transcription_options():
+    """Settings that change the transcript, part of the transcript cache key."""
+    return {
+        "chunked_min_seconds": settings.WHISPER_CHUNKED_MIN_SECONDS,
+        "window_seconds": settings.WHISPER_WINDOW_SECONDS,
+        "split_search_seconds": settings.WHISPER_SPLIT_SEARCH_SECONDS,
+    }
+
+
+async def transcribe_long_audio(audio: np.ndarray):
+    """
+    Split a long recording at silences and transcribe the windows in parallel
+    across the transcription pool, then stitch the segments back together
+    with their times relative to the whole recording.
+    """
+    windows = find_silence_splits(
+        audio, SAMPLE_RATE,
+        window_seconds=settings.WHISPER_WINDOW_SECONDS,
+        search_seconds=settings.WHISPER_SPLIT_SEARCH_SECONDS
+    )
+    print(f"✂️ Split {len(audio) / SAMPLE_RATE:.1f}s of audio into {len(windows)} windows")
+
+    # At most one window per pool worker from this recording at a time
+    limit = asyncio.Semaphore(transcription_pool.workers)
+
+    async def transcribe_window(start, end):
+        async with limit:
+            return await transcription_pool.transcribe_array(audio[start:end], wait_for_slot=True)
+
+    results = await asyncio.gather(*(transcribe_window(start, end) for start, end in windows))
+    for result in results:
+        if result.get("text", "").startswith("Transcription failed"):
+            return result
+    return stitch_transcripts(results, [start / SAMPLE_RATE for start, _ in windows])
+
+
+async def _transcribe_via_temp_file(fs, file_id, filename):
+    # Fallback for containers ffmpeg cannot read from a pipe (e.g. MP4/M4A
+    # with the moov atom at the end of the file)
+    grid_out = await fs.open_download_stream(file_id)
+    contents = await grid_out.read()
+    print(f"📦 Downloaded {len(contents)} bytes")
+
+    _, ext = os.path.splitext(filename)
+    if not ext:
+        ext = ".wav"  # Default to wav if no extension found
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as temp_file:
+        temp_file.write(contents)
+        temp_file_path = temp_file.name
+        print(f"💾 Created temporary file: {temp_file_path}")
+
+    try:
+        return await transcription_pool.transcribe(temp_file_path)
+    finally:
+        try:
+            os.unlink(temp_file_path)
+            print(f"🧹 Cleaned up temporary file: {temp_file_path}")
+        except:
+            pass
 
 
 async def transcribe_audio_from_gridfs(db, file_id_str):
@@ -17,34 +131,35 @@ async def transcribe_audio_from_gridfs(db, file_id_str):
     try:
         file_info = await db.fs.files.find_one({"_id": file_id})
         filename = file_info.get("filename", "audio.wav") if file_info else "audio.wav"
+        sha256 = ((file_info or {}).get("metadata") or {}).get("sha256")
         print(f"📁 File metadata: {file_info}")
     except Exception as e:
         print(f"⚠️ Warning: Could not get file metadata: {e}")
         filename = "audio.wav"
-    
-    # Download the file content
-    print(f"📥 Downloading file content...")
-    grid_out = await fs.open_download_stream(file_id)
-    contents = await grid_out.read()
-    print(f"📦 Downloaded {len(contents)} bytes")
-    
-    # Extract extension from filename
-    _, ext = os.path.splitext(filename)
-    if not ext:
-        ext = ".wav"  # Default to wav if no extension found
-    
-    print(f"📄 File extension: {ext}")
-    
-    # Create a temporary file with the correct extension
-    with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as temp_file:
-        temp_file.write(contents)
-        temp_file_path = temp_file.name
-        print(f"💾 Created temporary file: {temp_file_path}")
+        sha256 = None
+
+    # Identical audio was transcribed before with the same model and options
+    if sha256:
+        cached = await get_cached_transcript(sha256, settings.WHISPER_MODEL, transcription_options())
+        if cached:
+            print(f"♻️ Using cached transcript for sha256 {sha256[:12]}...")
+            return cached
 
     try:
-        # Transcribe the audio file using Whisper
+        # Whisper runs in the transcription worker pool, off this process
         print(f"🎤 Starting audio transcription for file: {filename}")
-        result = transcribe_audio_file(temp_file_path)
+        try:
+            grid_out = await fs.open_download_stream(file_id)
+            audio = await decode_audio_stream(grid_out)
+            print(f"🎚️ Decoded {len(audio) / SAMPLE_RATE:.1f}s of audio in memory")
+            if len(audio) / SAMPLE_RATE > settings.WHISPER_CHUNKED_MIN_SECONDS:
+                result = await transcribe_long_audio(audio)
+            else:
+                result = await transcription_pool.transcribe_array(audio)
+        except AudioDecodeError as e:
+            print(f"⚠️ In-memory decode failed ({e}), falling back to a temporary file")
+            result = await _transcribe_via_temp_file(fs, file_id, filename)
+
         print(f"✅ Transcription completed successfully")
         print(f"📝 Transcribed text length: {len(result.get('text', ''))}")
         print(f"📝 Transcribed text preview: {result.get('text', '')[:200]}...")
@@ -54,8 +169,14 @@ async def transcribe_audio_from_gridfs(db, file_id_str):
         if "Audio file uploaded successfully" in result.get('text', ''):
             print("⚠️ WARNING: Still getting placeholder text instead of actual transcription!")
             print("🔍 This suggests Whisper transcription is not working properly")
-        
+
+        if sha256 and not result.get("text", "").startswith("Transcription failed"):
+            await save_cached_transcript(sha256, settings.WHISPER_MODEL, transcription_options(), result)
+
         return result
+    except TranscriptionPoolSaturatedError:
+        # Let the caller retry later instead of storing a failure transcript
+        raise
     except Exception as e:
         print(f"❌ Error during transcription: {e}")
         import traceback
@@ -71,10 +192,3 @@ async def transcribe_audio_from_gridfs(db, file_id_str):
                 }
             ]
         }
-    finally:
-        # Clean up the temporary file
-        try:
-            os.unlink(temp_file_path)
-            print(f"🧹 Cleaned up temporary file: {temp_file_path}")
-        except:
-            pass
@@ -0,0 +1,189 @@
+# backend/app/workers/audio_pipeline_worker.py
+"""
+Worker for the upload-audio pipeline: transcribe -> chunk -> save note -> build vectors.
+
+Jobs are leased from the Mongo-backed queue in job_queue_service. Run
+standalone with:
+
+    python -m app.workers.audio_pipeline_worker --workers 2
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+from typing import Any, Dict, List, Optional
+from app.database import get_database
+from app.services import job_queue_service
+from app.services.job_queue_service import DEFAULT_LEASE_SECONDS, LeaseLostError
+
+AUDIO_PIPELINE_JOB = "audio_pipeline"
+AUDIO_PIPELINE_STAGES = ["transcribe", "chunk", "save_note", "build_vectors"]
+
+POLL_INTERVAL_SECONDS = 2
+SATURATED_RETRY_SECONDS = 15  # delay before a job is retried when the transcription pool was full
+
+
+async def enqueue_audio_pipeline(appointment_id: str, file_id: str, audio_sha256: Optional[str] = None) -> Dict[str, Any]:
+    """Queue the transcription pipeline for an uploaded recording."""
+    return await job_queue_service.enqueue_job(
+        AUDIO_PIPELINE_JOB,
+        AUDIO_PIPELINE_STAGES,
+        {"appointment_id": appointment_id, "file_id": file_id, "audio_sha256": audio_sha256}
+    )
+
+
+async def _keep_lease(job_id: str, worker_id: str, handler: asyncio.Task) -> None:
+    """Extend the lease while the handler runs; stop the handler if the lease is lost."""
+    while True:
+        await asyncio.sleep(DEFAULT_LEASE_SECONDS / 3)
+        if not await job_queue_service.heartbeat(job_id, worker_id):
+            print(f"⚠️ [{worker_id}] Lost lease on job {job_id}, stopping it")
+            # Another worker may claim the job; two copies must not save the note or vectors
+            handler.cancel()
+            return
+
+
+async def _run_stage(job: Dict[str, Any], worker_id: str, stage: str, state: Dict[str, Any], func):
+    # Stages completed by an earlier attempt are skipped; their output is on the job
+    if job["stages"].get(stage, {}).get("status") == "completed":
+        print(f"⏭️ [{worker_id}] Skipping completed stage '{stage}' for job {job['job_id']}")
+        return
+    state["stage"] = stage
+    if not await job_queue_service.start_stage(job["job_id"], worker_id, stage):
+        raise LeaseLostError(f"Lost lease before stage '{stage}'")
+    result = await func()
+    if not await job_queue_service.finish_stage(job["job_id"], worker_id, stage, result):
+        raise LeaseLostError(f"Lost lease after stage '{stage}'")
+    if result:
+        job.update(result)
+
+
+async def process_audio_pipeline(job: Dict[str, Any], worker_id: str, state: Dict[str, Any]) -> None:
+    # Heavy imports stay out of the API process that only enqueues jobs
+    from app.utils.transcription import transcribe_audio_from_gridfs
+    from app.services.whisper_transcriber_service import merge_segments_by_token_limit
+    from app.services.consultation_notes_service import save_consultation_note
+    from app.services.rag_service import build_vector_store_from_appointment
+
+    appointment_id = job["appointment_id"]
+
+    async def transcribe():
+        transcript = await transcribe_audio_from_gridfs(get_database(), job["file_id"])
+        if transcript.get("text", "").startswith("Transcription failed"):
+            raise RuntimeError(transcript["text"])
+        return {"segments": transcript.get("segments", [])}
+
+    async def chunk():
+        chunks: List[Dict[str, Any]] = merge_segments_by_token_limit(job["segments"], max_tokens=300)
+        print(f"📦 [{worker_id}] Created {len(chunks)} chunks")
+        return {"chunks": chunks}
+
+    async def save_note():
+        await save_consultation_note(appointment_id, job["chunks"])
+        return None
+
+    async def build_vectors():
+        if not await build_vector_store_from_appointment(appointment_id):
+            raise RuntimeError("Failed to build vector store")
+        return None
+
+    await _run_stage(job, worker_id, "transcribe", state, transcribe)
+    await _run_stage(job, worker_id, "chunk", state, chunk)
+    await _run_stage(job, worker_id, "save_note", state, save_note)
+    await _run_stage(job, worker_id, "build_vectors", state, build_vectors)
+
+
+JOB_HANDLERS = {
+    AUDIO_PIPELINE_JOB: process_audio_pipeline,
+}
+
+
+async def run_worker(worker_id: str) -> None:
+    """Claim and process jobs forever, one at a time."""
+    from app.services.transcription_pool import TranscriptionPoolSaturatedError
+
+    print(f"👷 Worker {worker_id} started")
+    while True:
+        job = await job_queue_service.claim_next_job(worker_id)
+        if not job:
+            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+            continue
+
+        print(f"🚀 [{worker_id}] Processing job {job['job_id']} (attempt {job['attempts']})")
+        state = {"stage": None}
+        handler = asyncio.create_task(JOB_HANDLERS[job["type"]](job, worker_id, state))
+        lease_task = asyncio.create_task(_keep_lease(job["job_id"], worker_id, handler))
+        try:
+            await handler
+            if not await job_queue_service.complete_job(job["job_id"], worker_id):
+                raise LeaseLostError("Lost lease before completing")
+            print(f"✅ [{worker_id}] Job {job['job_id']} completed")
+        except LeaseLostError as e:
+            print(f"⚠️ [{worker_id}] Abandoned job {job['job_id']}: {e}")
+        except asyncio.CancelledError:
+            # Cancelled by _keep_lease (lease lost), or the worker itself is shutting down
+            if not (lease_task.done() and not lease_task.cancelled()):
+                raise
+            print(f"⚠️ [{worker_id}] Abandoned job {job['job_id']} in stage '{state['stage']}': lease lost")
+        except TranscriptionPoolSaturatedError as e:
+            # Backpressure, not a failure of the job: retry later without using up an attempt
+            print(f"⏳ [{worker_id}] Transcription pool busy, requeueing job {job['job_id']} in {SATURATED_RETRY_SECONDS}s")
+            await job_queue_service.requeue_job(job, worker_id, SATURATED_RETRY_SECONDS, str(e), state["stage"])
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            print(f"❌ [{worker_id}] Job {job['job_id']} failed in stage '{state['stage']}': {e}")
+            if not await job_queue_service.fail_job(job, worker_id, str(e), state["stage"]):
+                print(f"⚠️ [{worker_id}] Job {job['job_id']} is no longer ours, failure not recorded")
+        finally:
+            lease_task.cancel()
+
+
+async def run_workers(worker_id: str, concurrency: int) -> None:
+    """Run several job loops concurrently so they can share the transcription pool."""
+    await asyncio.gather(*(run_worker(f"{worker_id}-{slot}") for slot in range(concurrency)))
+
+
+def run_worker_process(index: int) -> None:
+    """Entry point for a worker process."""
+    from app.services.transcription_pool import transcription_pool
+
+    worker_id = f"{socket.gethostname()}-{os.getpid()}-{index}"
+    try:
+        # One job per transcription worker; extra jobs would only wait on the pool
+        asyncio.run(run_workers(worker_id, transcription_pool.workers))
+    finally:
+        transcription_pool.shutdown()
+
+
+def start_worker_processes(count: int) -> List[multiprocessing.Process]:
+    """Start local worker processes (spawned, so each gets its own Mongo client)."""
+    context = multiprocessing.get_context("spawn")
+    processes = []
+    for index in range(count):
+        process = context.Process(target=run_worker_process, args=(index,), name=f"audio-pipeline-{index}")
+        process.start()
+        processes.append(process)
+    return processes
+
+
+def stop_worker_processes(processes: List[multiprocessing.Process]) -> None:
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join(timeout=10)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run audio pipeline workers")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    processes = start_worker_processes(args.workers)
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        stop_worker_processes(processes)
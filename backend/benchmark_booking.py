@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Offline load test for the booking hot path.
+
+Runs the real FastAPI routes in-process against an in-memory Mongo
+(mongomock-motor), fires requests at a configurable concurrency and
+writes p50/p95/p99 latency and throughput per endpoint to a JSON report
+that can be diffed across commits.
+
+Usage:
+    python benchmark_booking.py --concurrency 50 --requests 500 --doctors 20 --output bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+# Add the backend directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Settings are required at import time; none of them are used offline
+for key in ["AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT", "MONGO_DB_NAME"]:
+    os.environ.setdefault(key, "benchmark")
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+
+from mongomock_motor import AsyncMongoMockClient
+import app.database
+
+# Swap the database before any service module binds to it
+mock_db = AsyncMongoMockClient()["benchmark"]
+app.database.db = mock_db
+
+import httpx
+from fastapi import FastAPI, Request
+from app.routes import appointment_routes, appointment_chatbot_routes
+from app.routes.auth_routes import get_current_user
+from app.models.user import User
+
+ENDPOINTS = ["patient_create", "book_from_chat", "doctor_availability", "list_appointments"]
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    # Nearest-rank percentile
+    index = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def seed(doctors: int, slots_per_doctor: int, patients: int, appointments: int):
+    """Fill the in-memory database and return the ids needed to build requests."""
+    print(f"🌱 Seeding {doctors} doctors, {doctors * slots_per_doctor} slots, {patients} patients, {appointments} appointments...")
+    now = datetime.utcnow()
+    start_date = (now + timedelta(days=1)).date()
+
+    doctor_docs = [{
+        "name": f"Doctor {i}",
+        "specialization": "general physician",
+        "location": "Lahore",
+        "contact": f"doctor{i}@example.com",
+        "experience": 10,
+        "rating": 4.5,
+        "availability": "Available",
+        "description": None
+    } for i in range(doctors)]
+    result = await mock_db.doctors.insert_many(doctor_docs)
+    doctor_ids = [str(_id) for _id in result.inserted_ids]
+
+    slots = []
+    for doctor_id in doctor_ids:
+        for j in range(slots_per_doctor):
+            day = start_date + timedelta(days=j // 16)
+            minutes = 9 * 60 + (j % 16) * 30
+            slots.append({
+                "doctorId": doctor_id,
+                "doctorName": "Doctor",
+                "date": day.isoformat(),
+                "startTime": f"{minutes // 60:02d}:{minutes % 60:02d}",
+                "endTime": f"{(minutes + 30) // 60:02d}:{(minutes + 30) % 60:02d}",
+                "status": "Available"
+            })
+    await mock_db.availabilities.insert_many(slots)
+
+    users = {}
+    patient_docs = []
+    for i in range(patients):
+        user_id = str(uuid.uuid4())
+        patient_id = str(uuid.uuid4())
+        users[user_id] = User(id=user_id, email=f"patient{i}@example.com", password_hash="", role="patient",
+                              created_at=now, updated_at=now)
+        patient_docs.append({
+            "id": patient_id, "user_id": user_id, "name": f"Patient {i}", "date_of_birth": "1990-01-01",
+            "gender": "other", "contact": f"patient{i}@example.com", "created_at": now, "updated_at": now
+        })
+    await mock_db.patients_new.insert_many(patient_docs)
+
+    admin_id = str(uuid.uuid4())
+    users[admin_id] = User(id=admin_id, email="admin@example.com", password_hash="", role="admin",
+                           created_at=now, updated_at=now)
+
+    if appointments:
+        await mock_db.appointments_new.insert_many([{
+            "id": str(uuid.uuid4()),
+            "patient_id": patient_docs[i % patients]["id"],
+            "doctor_id": doctor_ids[i % doctors],
+            "date": (start_date - timedelta(days=1 + i // 16)).isoformat(),
+            "time": "09:00",
+            "condition": "Seeded",
+            "status": "Completed",
+            "created_at": now,
+            "updated_at": now
+        } for i in range(appointments)])
+
+    return {"doctor_ids": doctor_ids, "slots": slots, "patients": patient_docs, "users": users, "admin_id": admin_id}
+
+
+def build_app(users: dict) -> FastAPI:
+    bench_app = FastAPI()
+    bench_app.include_router(appointment_routes.router)
+    bench_app.include_router(appointment_chatbot_routes.router)
+
+    # Authenticate by user id header instead of a signed JWT
+    async def bench_current_user(request: Request) -> User:
+        return users[request.headers["X-Bench-User"]]
+
+    bench_app.dependency_overrides[get_current_user] = bench_current_user
+    return bench_app
+
+
+def build_requests(endpoint: str, count: int, data: dict):
+    """Return (method, url, user_id, json_body) tuples for one endpoint."""
+    patients = data["patients"]
+    slots = data["slots"]
+    requests = []
+    for i in range(count):
+        patient = patients[i % len(patients)]
+        slot = slots[i % len(slots)]
+        if endpoint == "patient_create":
+            requests.append(("POST", "/appointments/patient-create", patient["user_id"], {
+                "patient_id": patient["id"], "doctor_id": slot["doctorId"],
+                "date": slot["date"], "time": slot["startTime"], "condition": "Benchmark"
+            }))
+        elif endpoint == "book_from_chat":
+            # Book from the other end of the slot list so both booking endpoints see fresh slots
+            slot = slots[-(i % len(slots)) - 1]
+            requests.append(("POST", "/api/book-appointment-from-chat", patient["user_id"], {
+                "patientId": patient["id"], "doctorId": slot["doctorId"],
+                "date": slot["date"], "time": slot["startTime"], "condition": "Benchmark"
+            }))
+        elif endpoint == "doctor_availability":
+            doctor_id = data["doctor_ids"][i % len(data["doctor_ids"])]
+            requests.append(("GET", f"/api/doctors/{doctor_id}/availability", patient["user_id"], None))
+        elif endpoint == "list_appointments":
+            requests.append(("GET", "/appointments/", data["admin_id"], None))
+    return requests
+
+
+async def run_endpoint(client: httpx.AsyncClient, requests: list, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    status_codes = {}
+
+    async def one(method, url, user_id, body):
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.request(method, url, json=body, headers={"X-Bench-User": user_id})
+            latencies.append((time.perf_counter() - started) * 1000)
+            status_codes[response.status_code] = status_codes.get(response.status_code, 0) + 1
+
+    wall_started = time.perf_counter()
+    await asyncio.gather(*(one(*request) for request in requests))
+    wall_seconds = time.perf_counter() - wall_started
+
+    latencies.sort()
+    return {
+        "requests": len(requests),
+        "status_codes": {str(code): n for code, n in sorted(status_codes.items())},
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "mean_ms": sum(latencies) / len(latencies) if latencies else None,
+        "throughput_rps": len(requests) / wall_seconds if wall_seconds else None,
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+async def main(args):
+    data = await seed(args.doctors, args.slots_per_doctor, args.patients, args.appointments)
+    bench_app = build_app(data["users"])
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.utcnow().isoformat(),
+        "config": vars(args),
+        "results": {}
+    }
+
+    transport = httpx.ASGITransport(app=bench_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for endpoint in args.endpoints:
+            print(f"🚀 {endpoint}: {args.requests} requests at concurrency {args.concurrency}...")
+            requests = build_requests(endpoint, args.requests, data)
+            result = await run_endpoint(client, requests, args.concurrency)
+            report["results"][endpoint] = result
+            print(f"   p50={result['p50_ms']:.1f}ms p95={result['p95_ms']:.1f}ms "
+                  f"p99={result['p99_ms']:.1f}ms {result['throughput_rps']:.0f} req/s {result['status_codes']}")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline benchmark for the booking hot path")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint")
+    parser.add_argument("--doctors", type=int, default=10)
+    parser.add_argument("--slots-per-doctor", type=int, default=64)
+    parser.add_argument("--patients", type=int, default=50)
+    parser.add_argument("--appointments", type=int, default=1000, help="Pre-existing appointments")
+    parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=ENDPOINTS)
+    parser.add_argument("--output", default="benchmark_report.json")
+    asyncio.run(main(parser.parse_args()))
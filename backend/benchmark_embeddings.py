@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Compare embedding backends on the stored consultation transcripts.
+
+Encodes the transcript chunks in `consultation_notes` with the current
+langchain HuggingFaceEmbeddings setup (the baseline) and with each
+EmbeddingService backend, then reports encode throughput and retrieval
+recall@k against the baseline: for a sample of queries, the share of the
+baseline's top-k chunks that the backend also ranks in its top-k.
+
+Usage:
+    python benchmark_embeddings.py --backends torch onnx onnx-int8 --notes 200 --queries 100 --k 5 --output embeddings_bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+from datetime import datetime
+import numpy as np
+from app.database import get_database
+from app.config.settings import settings
+from app.services.embedding_service import EmbeddingService, EMBEDDING_BACKENDS
+
+
+async def load_chunks(max_notes: int):
+    db = get_database()
+    cursor = db.consultation_notes.find({"transcript": {"$exists": True}}, {"transcript": 1}).limit(max_notes)
+    chunks = []
+    async for doc in cursor:
+        transcript = doc.get("transcript")
+        if isinstance(transcript, list):
+            chunks.extend(seg.get("text", "") for seg in transcript if seg.get("text", "").strip())
+    return chunks
+
+
+def make_queries(chunks, count: int, seed: int):
+    """Short questions-like queries: the opening words of randomly picked chunks."""
+    rng = random.Random(seed)
+    picked = rng.sample(chunks, min(count, len(chunks)))
+    return [" ".join(chunk.split()[:8]) for chunk in picked]
+
+
+def timed_encode(encode, texts):
+    encode(texts[:8])  # warm-up (model load, first-batch allocations)
+    started = time.perf_counter()
+    vectors = np.asarray(encode(texts), dtype=np.float32)
+    return vectors, time.perf_counter() - started
+
+
+def top_k(doc_vectors, query_vectors, k):
+    # Cosine similarity on normalized vectors
+    doc_vectors = doc_vectors / np.linalg.norm(doc_vectors, axis=1, keepdims=True)
+    query_vectors = query_vectors / np.linalg.norm(query_vectors, axis=1, keepdims=True)
+    scores = query_vectors @ doc_vectors.T
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def recall_at_k(baseline_top, candidate_top):
+    overlaps = [len(set(b) & set(c)) / len(b) for b, c in zip(baseline_top, candidate_top)]
+    return float(np.mean(overlaps))
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+async def main(args):
+    print(f"📥 Loading transcript chunks from up to {args.notes} consultation notes...")
+    chunks = await load_chunks(args.notes)
+    if len(chunks) < args.k:
+        print(f"❌ Only {len(chunks)} chunks found, need at least {args.k}")
+        return
+    queries = make_queries(chunks, args.queries, args.seed)
+    print(f"📄 {len(chunks)} chunks, {len(queries)} queries")
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.utcnow().isoformat(),
+        "config": vars(args),
+        "chunks": len(chunks),
+        "results": {}
+    }
+
+    print(f"🧠 Baseline: HuggingFaceEmbeddings({settings.EMBEDDING_MODEL})")
+    from langchain.embeddings import HuggingFaceEmbeddings
+    baseline = HuggingFaceEmbeddings(model_name=settings.EMBEDDING_MODEL)
+    baseline_docs, seconds = timed_encode(baseline.embed_documents, chunks)
+    baseline_queries = np.asarray(baseline.embed_documents(queries), dtype=np.float32)
+    baseline_top = top_k(baseline_docs, baseline_queries, args.k)
+    report["results"]["huggingface"] = {"texts_per_second": len(chunks) / seconds, "recall_at_k": 1.0}
+    print(f"   {len(chunks) / seconds:.0f} texts/s")
+
+    for backend in args.backends:
+        print(f"🧠 Backend: {backend}")
+        try:
+            service = EmbeddingService(settings.EMBEDDING_MODEL, backend, args.batch_size, query_cache_size=0)
+            docs, seconds = timed_encode(service.embed_documents, chunks)
+        except Exception as e:
+            print(f"   ❌ {e}")
+            report["results"][backend] = {"error": str(e)}
+            continue
+        query_vectors = np.asarray(service.embed_documents(queries), dtype=np.float32)
+        result = {
+            "texts_per_second": len(chunks) / seconds,
+            "speedup": (len(chunks) / seconds) / report["results"]["huggingface"]["texts_per_second"],
+            "recall_at_k": recall_at_k(baseline_top, top_k(docs, query_vectors, args.k)),
+            # Candidate queries against baseline-embedded chunks, i.e. switching backends without re-indexing
+            "recall_at_k_mixed": recall_at_k(baseline_top, top_k(baseline_docs, query_vectors, args.k)),
+        }
+        report["results"][backend] = result
+        print(f"   {result['texts_per_second']:.0f} texts/s ({result['speedup']:.2f}x), "
+              f"recall@{args.k}={result['recall_at_k']:.3f}, mixed={result['recall_at_k_mixed']:.3f}")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark embedding backends on stored transcripts")
+    parser.add_argument("--backends", nargs="+", choices=EMBEDDING_BACKENDS, default=list(EMBEDDING_BACKENDS))
+    parser.add_argument("--notes", type=int, default=200, help="Consultation notes to take chunks from")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=settings.EMBEDDING_BATCH_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="embeddings_benchmark_report.json")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Check that the indexes the API relies on exist, report unused ones,
+and explain() each hot query to flag collection scans.
+"""
+
+import asyncio
+import sys
+from app.database import get_database
+from app.services.index_service import (
+    ensure_indexes,
+    find_missing_indexes,
+    find_unused_indexes,
+    explain_hot_queries,
+    requirement_note
+)
+
+async def check_indexes(apply: bool = False):
+    """Report missing/unused indexes and COLLSCAN hot queries."""
+    try:
+        print("🔍 Checking database indexes...")
+
+        db = get_database()
+
+        if apply:
+            print("\n🛠️ Applying index registry...")
+            await ensure_indexes(db)
+
+        # Registered indexes that are not present
+        missing = await find_missing_indexes(db)
+        print(f"\n📋 Missing indexes: {len(missing)}")
+        for spec in missing:
+            print(f"  ❌ {spec['collection']}.{spec['name']} {spec['keys']}{requirement_note(spec)}")
+
+        # Indexes that have never been used since the server started
+        try:
+            unused = await find_unused_indexes(db)
+            print(f"\n💤 Unused indexes: {len(unused)}")
+            for index in unused:
+                print(f"  ⚠️ {index['collection']}.{index['name']}")
+        except Exception as e:
+            print(f"\n⚠️ Could not read index usage stats: {e}")
+
+        # Query plans for the hot queries
+        print(f"\n🎯 Hot query plans:")
+        results = await explain_hot_queries(db)
+        for result in results:
+            status = "❌ COLLSCAN" if result["collscan"] else "✅"
+            print(f"  {status} {result['name']} ({result['collection']}): {' <- '.join(result['stages'])}")
+
+        collscans = [result for result in results if result["collscan"]]
+        print(f"\n🎉 Index check completed! {len(missing)} missing, {len(collscans)} collection scans")
+        return not missing and not collscans
+
+    except Exception as e:
+        print(f"❌ Check failed with error: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("Starting index check...")
+    ok = asyncio.run(check_indexes(apply="--apply" in sys.argv))
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Azure OpenAI chat completions endpoint.
+
+Answers POST /chat/completions with a canned completion after an optional
+delay, and can be told to fail the next N requests with a given status
+(e.g. 429 or 503, optionally with Retry-After). It records how many
+requests were in flight at once, so tests can check the client's
+concurrency bound. Used by test_llm_client.py; can also be run on its own
+to exercise the API without calling Azure:
+
+    python fake_openai_server.py --port 8089 --latency 0.5
+    AZURE_OPENAI_ENDPOINT=http://127.0.0.1:8089 uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+class FakeOpenAIState:
+    def __init__(self, latency: float = 0.0, reply: str = "This is a fake completion."):
+        self.latency = latency
+        self.reply = reply
+        self.failures_left = 0
+        self.failure_status = 503
+        self.retry_after = None
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def fail_next(self, count: int, status: int = 503, retry_after: float = None):
+        self.failures_left = count
+        self.failure_status = status
+        self.retry_after = retry_after
+
+    def reset(self):
+        self.failures_left = 0
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+def create_app(state: FakeOpenAIState = None) -> FastAPI:
+    app = FastAPI(title="Fake OpenAI")
+    app.state.fake = state or FakeOpenAIState()
+
+    @app.post("/chat/completions")
+    async def chat_completions(request: Request):
+        fake: FakeOpenAIState = app.state.fake
+        body = await request.json()
+        fake.requests += 1
+        fake.in_flight += 1
+        fake.max_in_flight = max(fake.max_in_flight, fake.in_flight)
+        try:
+            if fake.latency:
+                await asyncio.sleep(fake.latency)
+
+            if fake.failures_left > 0:
+                fake.failures_left -= 1
+                headers = {"retry-after": str(fake.retry_after)} if fake.retry_after is not None else {}
+                return JSONResponse(
+                    status_code=fake.failure_status,
+                    content={"error": {"message": "Injected failure", "type": "fake_error", "code": str(fake.failure_status)}},
+                    headers=headers
+                )
+
+            return {
+                "id": f"chatcmpl-{uuid.uuid4().hex}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", "fake"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": fake.reply},
+                    "finish_reason": "stop"
+                }],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+            }
+        finally:
+            fake.in_flight -= 1
+
+    @app.get("/stats")
+    async def stats():
+        fake: FakeOpenAIState = app.state.fake
+        return {"requests": fake.requests, "in_flight": fake.in_flight, "max_in_flight": fake.max_in_flight}
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run a fake OpenAI chat completions server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before each response")
+    args = parser.parse_args()
+    uvicorn.run(create_app(FakeOpenAIState(latency=args.latency)), host=args.host, port=args.port)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Re-partition the vector store (vector_db/chroma.sqlite3).
+
+Copies every chunk of the single legacy collection (or of any other
+collection, e.g. after changing VECTOR_PARTITION_STRATEGY) into the
+collection its appointment is routed to under the current strategy,
+records the routes in `vector_partitions` once every chunk has been
+copied, and optionally deletes the moved chunks from the source. Embeddings are copied, not recomputed.
+
+Usage:
+    python migrate_vector_partitions.py [--source langchain] [--batch-size 500] [--delete-source] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import sys
+from collections import defaultdict
+from app.services.vector_partition_service import partition_router, LEGACY_COLLECTION
+from app.services.vector_store_service import vector_store
+
+
+async def migrate(source_name: str, batch_size: int, delete_source: bool, dry_run: bool):
+    try:
+        print(f"🔀 Re-partitioning '{source_name}' by {partition_router.strategy} in {vector_store.location}")
+        if source_name not in vector_store.list_collections():
+            print(f"❌ Collection '{source_name}' does not exist")
+            return False
+
+        source = vector_store.get_store(source_name)._collection
+        total = source.count()
+        print(f"📦 {total} chunks in '{source_name}'")
+
+        moved_ids = []
+        moved_by_collection = defaultdict(int)
+        routes = {}
+        offset = 0
+        while offset < total:
+            batch = source.get(limit=batch_size, offset=offset, include=["embeddings", "documents", "metadatas"])
+            offset += batch_size
+            if not batch["ids"]:
+                break
+
+            # Group the batch by target collection
+            grouped = defaultdict(lambda: {"ids": [], "embeddings": [], "documents": [], "metadatas": []})
+            for i, chunk_id in enumerate(batch["ids"]):
+                metadata = batch["metadatas"][i] or {}
+                appointment_id = metadata.get("appointment_id")
+                if not appointment_id:
+                    continue
+                if appointment_id not in routes:
+                    routes[appointment_id] = await partition_router.resolve(appointment_id)
+                target = routes[appointment_id]
+                if target == source_name:
+                    continue
+                group = grouped[target]
+                group["ids"].append(chunk_id)
+                group["embeddings"].append(batch["embeddings"][i])
+                group["documents"].append(batch["documents"][i])
+                group["metadatas"].append(metadata)
+
+            for target, group in grouped.items():
+                moved_by_collection[target] += len(group["ids"])
+                if not dry_run:
+                    vector_store.get_store(target)._collection.upsert(**group)
+                moved_ids.extend(group["ids"])
+            print(f"  ➡️ {min(offset, total)}/{total} chunks scanned, {len(moved_ids)} moved")
+
+        # Routes are recorded only now that every chunk is in its target: an
+        # appointment's chunks can span batches, and a route recorded earlier
+        # would send reads to a partition still missing some of them (or, if
+        # the migration failed, to one that was never written)
+        if not dry_run:
+            for appointment_id, target in routes.items():
+                await partition_router.set(appointment_id, target)
+
+        print(f"\n📋 {len(routes)} appointments routed:")
+        for target, count in sorted(moved_by_collection.items()):
+            print(f"  📁 {target}: {count} chunks")
+
+        if delete_source and not dry_run and moved_ids:
+            for start in range(0, len(moved_ids), batch_size):
+                source.delete(ids=moved_ids[start:start + batch_size])
+            print(f"🧹 Deleted {len(moved_ids)} moved chunks from '{source_name}'")
+
+        print(f"\n🎉 Migration {'dry run ' if dry_run else ''}completed!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Migration failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-partition the Chroma vector store")
+    parser.add_argument("--source", default=LEGACY_COLLECTION, help="Collection to move chunks out of")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--delete-source", action="store_true", help="Delete moved chunks from the source collection")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be moved")
+    args = parser.parse_args()
+    ok = asyncio.run(migrate(args.source, args.batch_size, args.delete_source, args.dry_run))
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark: importing app.main must stay fast and must not
+load any ML model or framework (they are loaded lazily by the model registry).
+"""
+
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules that mean a model or ML framework was loaded at import time
+HEAVY_MODULES = ["whisper", "torch", "sentence_transformers", "transformers", "chromadb", "langchain", "onnxruntime"]
+
+MAX_IMPORT_SECONDS = float(os.getenv("MAX_IMPORT_SECONDS", "5"))
+
+PROBE = f"""
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "heavy": sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)}}))
+"""
+
+
+def _env():
+    env = dict(os.environ)
+    # Settings are required at import time; nothing connects during import
+    for key in ["AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT", "MONGO_DB_NAME"]:
+        env.setdefault(key, "import-benchmark")
+    env.setdefault("MONGO_URI", "mongodb://localhost:27017")
+    return env
+
+
+def _slowest_imports(limit=10):
+    """Top cumulative import times from python -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR, env=_env(), capture_output=True, text=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time: self [us] | cumulative | imported package"
+        _, cumulative_us, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        rows.append((int(cumulative_us), name))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def test_import_time():
+    """Import app.main in a fresh interpreter and check time and loaded modules."""
+    try:
+        print("🧪 Testing app.main import time...")
+
+        import json
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=BACKEND_DIR, env=_env(), capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            print(f"   ❌ Import failed:\n{result.stderr}")
+            return False
+        probe = json.loads(result.stdout.strip().splitlines()[-1])
+
+        print(f"1. Import took {probe['seconds']:.2f}s (limit {MAX_IMPORT_SECONDS}s)")
+        fast = probe["seconds"] <= MAX_IMPORT_SECONDS
+        print("   ✅ Fast enough" if fast else "   ❌ Too slow")
+
+        print("2. Heavy modules loaded at import time:")
+        if probe["heavy"]:
+            print(f"   ❌ {', '.join(probe['heavy'])}")
+        else:
+            print("   ✅ None")
+
+        print("3. Slowest imports (cumulative):")
+        for cumulative_us, name in _slowest_imports():
+            print(f"   {cumulative_us / 1000:8.1f}ms  {name}")
+
+        ok = fast and not probe["heavy"]
+        print(f"\n🎉 Import time test {'passed' if ok else 'failed'}!")
+        return ok
+
+    except Exception as e:
+        print(f"❌ Test failed with error: {e}")
+        return False
+
+if __name__ == "__main__":
+    sys.exit(0 if test_import_time() else 1)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test the shared LLM client against the local fake OpenAI server:
+retries on 429/5xx, no retries on other errors, the concurrency bound
+and per-call timeouts. No Azure credentials needed.
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+
+# Settings are required at import time; the fake server stands in for Azure
+for key in ["AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT", "MONGO_DB_NAME"]:
+    os.environ.setdefault(key, "llm-client-test")
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+
+import uvicorn
+from openai import APITimeoutError, BadRequestError, RateLimitError
+from fake_openai_server import FakeOpenAIState, create_app
+from app.services.llm_client import LLMClient
+
+
+def start_fake_server(state: FakeOpenAIState) -> str:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(create_app(state), host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+def make_client(base_url: str, **overrides) -> LLMClient:
+    options = dict(
+        api_key="test", base_url=base_url, api_version="preview", max_connections=10, timeout=5.0,
+        max_concurrency=4, max_retries=3, backoff_seconds=0.01, backoff_max_seconds=0.1
+    )
+    options.update(overrides)
+    return LLMClient(**options)
+
+
+async def ask(client: LLMClient, **kwargs):
+    response = await client.chat(model="fake", messages=[{"role": "user", "content": "hello"}], **kwargs)
+    return response.choices[0].message.content
+
+
+async def run_checks(base_url: str, fake: FakeOpenAIState) -> bool:
+    ok = True
+
+    print("1. Plain completion...")
+    fake.reset()
+    reply = await ask(make_client(base_url))
+    print(f"   ✅ Reply: {reply}" if reply == fake.reply else f"   ❌ Unexpected reply: {reply}")
+    ok &= reply == fake.reply
+
+    print("2. Two 503s, then success (retried)...")
+    fake.reset()
+    fake.fail_next(2, 503)
+    client = make_client(base_url)
+    reply = await ask(client)
+    passed = reply == fake.reply and client.stats()["retries"] == 2 and fake.requests == 3
+    print(f"   {'✅' if passed else '❌'} retries={client.stats()['retries']}, requests={fake.requests}")
+    ok &= passed
+
+    print("3. 429 with Retry-After beyond the retry budget...")
+    fake.reset()
+    fake.fail_next(10, 429, retry_after=0.05)
+    client = make_client(base_url, max_retries=2)
+    try:
+        await ask(client)
+        print("   ❌ Expected RateLimitError")
+        ok = False
+    except RateLimitError:
+        passed = fake.requests == 3 and client.stats()["failures"] == 1
+        print(f"   {'✅' if passed else '❌'} Gave up after {fake.requests} attempts")
+        ok &= passed
+
+    print("4. 400 is not retried...")
+    fake.reset()
+    fake.fail_next(1, 400)
+    try:
+        await ask(make_client(base_url))
+        print("   ❌ Expected BadRequestError")
+        ok = False
+    except BadRequestError:
+        print(f"   {'✅' if fake.requests == 1 else '❌'} requests={fake.requests}")
+        ok &= fake.requests == 1
+
+    print("5. Concurrency bound (12 calls, max_concurrency=3)...")
+    fake.reset()
+    fake.latency = 0.2
+    client = make_client(base_url, max_concurrency=3)
+    started = time.perf_counter()
+    replies = await asyncio.gather(*[ask(client) for _ in range(12)])
+    elapsed = time.perf_counter() - started
+    fake.latency = 0.0
+    passed = len(replies) == 12 and fake.max_in_flight <= 3
+    print(f"   {'✅' if passed else '❌'} max in flight at server={fake.max_in_flight}, took {elapsed:.2f}s")
+    ok &= passed
+
+    print("6. Per-call timeout...")
+    fake.reset()
+    fake.latency = 1.0
+    client = make_client(base_url, max_retries=0)
+    started = time.perf_counter()
+    try:
+        await ask(client, timeout=0.2)
+        print("   ❌ Expected APITimeoutError")
+        ok = False
+    except APITimeoutError:
+        elapsed = time.perf_counter() - started
+        print(f"   {'✅' if elapsed < 0.9 else '❌'} Timed out after {elapsed:.2f}s")
+        ok &= elapsed < 0.9
+    fake.latency = 0.0
+
+    print("7. Other coroutines keep running during a slow completion...")
+    fake.reset()
+    fake.latency = 0.5
+    client = make_client(base_url)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.05)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    await ask(client)
+    task.cancel()
+    fake.latency = 0.0
+    print(f"   {'✅' if ticks >= 5 else '❌'} Event loop ticked {ticks} times")
+    ok &= ticks >= 5
+
+    return ok
+
+
+def test_llm_client():
+    try:
+        print("🧪 Testing LLM client against the fake OpenAI server...")
+        fake = FakeOpenAIState()
+        base_url = start_fake_server(fake)
+        print(f"🔗 Fake server at {base_url}")
+
+        ok = asyncio.run(run_checks(base_url, fake))
+        print(f"\n🎉 LLM client test {'passed' if ok else 'failed'}!")
+        return ok
+
+    except Exception as e:
+        print(f"❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+if __name__ == "__main__":
+    sys.exit(0 if test_llm_client() else 1)
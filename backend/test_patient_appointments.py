@@ -13,7 +13,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.database import get_database
 from app.services.patient_service import get_patient_by_user_id
-from app.services.appointment_service import get_appointments_by_patient_id, update_slot_status_to_booked
+from app.services.appointment_service import get_appointments_by_patient_id
 
 async def test_patient_appointments():
     """Test patient appointment functionality"""
@@ -52,43 +52,8 @@ async def test_patient_appointments():
         for status, count in status_counts.items():
             print(f"   {status}: {count} slots")
         
-        # Test 4: Test slot status update function
-        print("\n4. Testing slot status update function...")
-        if availabilities:
-            # Find an available slot
-            available_slot = None
-            for slot in availabilities:
-                if slot.get('status') == 'Available':
-                    available_slot = slot
-                    break
-            
-            if available_slot:
-                doctor_id = available_slot.get('doctorId')
-                date_str = available_slot.get('date')
-                time_str = available_slot.get('startTime')
-                
-                print(f"   Testing with slot: Doctor {doctor_id} on {date_str} at {time_str}")
-                
-                # Test the update function
-                result = await update_slot_status_to_booked(doctor_id, date_str, time_str)
-                print(f"   Update result: {result}")
-                
-                # Check if it was actually updated
-                updated_slot = await db.availabilities.find_one({
-                    "doctorId": doctor_id,
-                    "date": date_str,
-                    "startTime": time_str
-                })
-                
-                if updated_slot:
-                    print(f"   Updated slot status: {updated_slot.get('status')}")
-                else:
-                    print(f"   Slot not found after update")
-            else:
-                print("   No available slots found to test with")
-        
-        # Test 5: Check appointment creation flow
-        print("\n5. Testing appointment creation flow...")
+        # Test 4: Check appointment creation flow
+        print("\n4. Testing appointment creation flow...")
         if patients and availabilities:
             patient = patients[0]
             available_slot = None
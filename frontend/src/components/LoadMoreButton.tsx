@@ -0,0 +1,39 @@
+import React, { useState } from 'react';
+import { Button } from "@/components/ui/button";
+import { useData, type PagedList } from "@/contexts/DataContext";
+import { useToast } from "@/hooks/use-toast";
+
+// Shown under a paged list while the server has more pages; appends the next one
+const LoadMoreButton = ({ list }: { list: PagedList }) => {
+  const { hasMore, loadMore } = useData();
+  const { toast } = useToast();
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  if (!hasMore(list)) return null;
+
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    try {
+      await loadMore(list);
+    } catch (error) {
+      console.error(`Error loading more ${list}:`, error);
+      toast({
+        title: "Error",
+        description: "Failed to load more results. Please try again.",
+        variant: "destructive"
+      });
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  return (
+    <div className="flex justify-center mt-6">
+      <Button onClick={handleLoadMore} disabled={loadingMore} className="btn-secondary">
+        {loadingMore ? "Loading..." : "Load more"}
+      </Button>
+    </div>
+  );
+};
+
+export default LoadMoreButton;
@@ -89,6 +89,13 @@ export interface Message {
   }[];
 }
 
+// Lists loaded a page at a time; the rest is fetched with loadMore
+export type PagedList = 'patients' | 'doctors' | 'timeSlots' | 'appointments';
+
+type NextCursors = Record<PagedList, string | null>;
+
+const NO_MORE_PAGES: NextCursors = { patients: null, doctors: null, timeSlots: null, appointments: null };
+
 interface DataContextType {
   patients: Patient[];
   doctors: Doctor[];
@@ -97,6 +104,8 @@ interface DataContextType {
   voiceNotes: VoiceNote[];
   messages: Message[];
   loading: boolean;
+  hasMore: (list: PagedList) => boolean;
+  loadMore: (list: PagedList) => Promise<void>;
   addPatient: (patient: Omit<Patient, 'id'>) => Promise<void>;
   updatePatient: (id: string, patient: Partial<Patient>) => Promise<void>;
   deletePatient: (id: string) => Promise<void>;
@@ -125,6 +134,7 @@ export const DataProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
   const [voiceNotes, setVoiceNotes] = useState<VoiceNote[]>([]);
   const [messages, setMessages] = useState<Message[]>([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursors, setNextCursors] = useState<NextCursors>(NO_MORE_PAGES);
   const { token, user } = useAuth();
 
   const loadData = async () => {
@@ -150,48 +160,56 @@ export const DataProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
 
       console.log("Loading data with token:", token ? "Token exists" : "No token");
       console.log("User role:", user?.role);
+      setNextCursors(NO_MORE_PAGES);
 
       // Load data based on user role
       if (user?.role === 'admin') {
-        // Admin can see all data
-        const [patientsData, doctorsData, timeSlotsData] = await Promise.all([
-          patientsService.getAll(token),
-          doctorsService.getAll(token),
-          timeSlotsService.getAll(token)
+        // Admin can see all data; only the first page of each list is loaded here
+        const [patientsPage, doctorsPage, timeSlotsPage] = await Promise.all([
+          patientsService.getPage(token),
+          doctorsService.getPage(token),
+          timeSlotsService.getPage(token)
         ]);
 
-        console.log("Loaded patients:", patientsData.length);
-        console.log("Loaded doctors:", doctorsData.length);
-        console.log("Loaded time slots:", timeSlotsData.length);
-
-        setPatients(patientsData);
-        setDoctors(doctorsData);
-        setTimeSlots(timeSlotsData);
-
-        // Load all appointments for admin
-        console.log("Loading all appointments for admin...");
+        console.log("Loaded patients:", patientsPage.items.length);
+        console.log("Loaded doctors:", doctorsPage.items.length);
+        console.log("Loaded time slots:", timeSlotsPage.items.length);
+
+        setPatients(patientsPage.items);
+        setDoctors(doctorsPage.items);
+        setTimeSlots(timeSlotsPage.items);
+        setNextCursors({
+          ...NO_MORE_PAGES,
+          patients: patientsPage.nextCursor,
+          doctors: doctorsPage.nextCursor,
+          timeSlots: timeSlotsPage.nextCursor
+        });
+
+        console.log("Loading appointments for admin...");
         try {
-          const appointmentsData = await appointmentsService.getAll(token);
-          console.log("Loaded appointments for admin:", appointmentsData);
-          setAppointments(appointmentsData);
+          const appointmentsPage = await appointmentsService.getPage(token);
+          console.log("Loaded appointments for admin:", appointmentsPage.items);
+          setAppointments(appointmentsPage.items);
+          setNextCursors(prev => ({ ...prev, appointments: appointmentsPage.nextCursor }));
         } catch (error) {
           console.error("Error loading admin appointments:", error);
           setAppointments([]);
         }
       } else if (user?.role === 'patient') {
         // Patient can only see their own profile and doctors
-        const [doctorsData, timeSlotsData] = await Promise.all([
-          doctorsService.getAll(token),
-          timeSlotsService.getAll(token)
+        const [doctorsPage, timeSlotsPage] = await Promise.all([
+          doctorsService.getPage(token),
+          timeSlotsService.getPage(token)
         ]);
 
-        console.log("Loaded doctors:", doctorsData.length);
-        console.log("Loaded time slots:", timeSlotsData.length);
+        console.log("Loaded doctors:", doctorsPage.items.length);
+        console.log("Loaded time slots:", timeSlotsPage.items.length);
 
         // For patients, we don't load all patients - they only see their own profile
         setPatients([]);
-        setDoctors(doctorsData);
-        setTimeSlots(timeSlotsData);
+        setDoctors(doctorsPage.items);
+        setTimeSlots(timeSlotsPage.items);
+        setNextCursors({ ...NO_MORE_PAGES, doctors: doctorsPage.nextCursor, timeSlots: timeSlotsPage.nextCursor });
 
         // Load patient's own appointments
         console.log("Loading patient's own appointments...");
@@ -235,6 +253,42 @@ export const DataProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     loadData();
   }, [token, user]);
 
+  const hasMore = (list: PagedList) => nextCursors[list] !== null;
+
+  // Appends the next page of a list, following the cursor from the last page loaded
+  const loadMore = async (list: PagedList) => {
+    if (!token) throw new Error("No authentication token");
+    const cursor = nextCursors[list];
+    if (!cursor) return;
+
+    switch (list) {
+      case 'patients': {
+        const page = await patientsService.getPage(token, cursor);
+        setPatients(prev => [...prev, ...page.items]);
+        setNextCursors(prev => ({ ...prev, patients: page.nextCursor }));
+        break;
+      }
+      case 'doctors': {
+        const page = await doctorsService.getPage(token, cursor);
+        setDoctors(prev => [...prev, ...page.items]);
+        setNextCursors(prev => ({ ...prev, doctors: page.nextCursor }));
+        break;
+      }
+      case 'timeSlots': {
+        const page = await timeSlotsService.getPage(token, cursor);
+        setTimeSlots(prev => [...prev, ...page.items]);
+        setNextCursors(prev => ({ ...prev, timeSlots: page.nextCursor }));
+        break;
+      }
+      case 'appointments': {
+        const page = await appointmentsService.getPage(token, cursor);
+        setAppointments(prev => [...prev, ...page.items]);
+        setNextCursors(prev => ({ ...prev, appointments: page.nextCursor }));
+        break;
+      }
+    }
+  };
+
   // CRUD handlers
   const addPatient = async (patientData: Omit<Patient, 'id'>) => {
     if (!token) throw new Error("No authentication token");
@@ -436,6 +490,8 @@ const addMessage = async (messageData: Omit<Message, 'id'>) => {
         voiceNotes,
         messages,
         loading,
+        hasMore,
+        loadMore,
         addPatient,
         updatePatient,
         deletePatient,
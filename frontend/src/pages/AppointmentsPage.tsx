@@ -5,6 +5,7 @@ import { Label } from "@/components/ui/label";
 import { SidebarTrigger } from "@/components/ui/sidebar";
 import { Calendar, Plus, Trash2, Edit, Search } from "lucide-react";
 import { Badge } from "@/components/ui/badge";
+import LoadMoreButton from "@/components/LoadMoreButton";
 import { useData, type Appointment } from "@/contexts/DataContext";
 import { useAuth } from "@/contexts/AuthContext";
 import { useState, useRef } from "react";
@@ -547,6 +548,8 @@ const AppointmentsPage = () => {
           })
         )}
       </div>
+
+      <LoadMoreButton list="appointments" />
     </div>
   );
 };
@@ -6,6 +6,7 @@ import { Label } from "@/components/ui/label";
 import { SidebarTrigger } from "@/components/ui/sidebar";
 import { Clock, Plus, Trash2, Calendar } from "lucide-react";
 import { Badge } from "@/components/ui/badge";
+import LoadMoreButton from "@/components/LoadMoreButton";
 import { useData } from "@/contexts/DataContext";
 import { useToast } from "@/hooks/use-toast";
 import type { TimeSlot } from "@/contexts/DataContext";
@@ -240,6 +241,8 @@ const AvailabilityPage = () => {
           ))
         )}
       </div>
+
+      <LoadMoreButton list="timeSlots" />
     </div>
   );
 };
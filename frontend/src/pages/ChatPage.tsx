@@ -60,6 +60,8 @@ const ChatPage = () => {
   const [showTimeSlotsDialog, setShowTimeSlotsDialog] = useState(false);
   const [isBooking, setIsBooking] = useState(false);
   const messagesEndRef = useRef<HTMLDivElement>(null);
+  // Server-side conversation state is keyed by this id; a new page starts a new conversation
+  const sessionIdRef = useRef<string>(crypto.randomUUID());
   const { token, user, isAuthenticated } = useAuth();
 
   // Check if user is authenticated and is a patient
@@ -115,12 +117,6 @@ const ChatPage = () => {
     }
 
     try {
-      const conversationHistory = messages.map(msg => ({
-        role: msg.isUser ? 'user' : 'assistant',
-        content: msg.text,
-        isUser: msg.isUser
-      }));
-
       console.log('Sending request with token:', token ? 'Token exists' : 'No token');
       console.log('Request headers:', {
         'Content-Type': 'application/json',
@@ -133,9 +129,10 @@ const ChatPage = () => {
           'Content-Type': 'application/json',
           'Authorization': `Bearer ${token}`,
         },
+        // The conversation history is kept server-side; only the new message is sent
         body: JSON.stringify({
           message,
-          conversationHistory
+          sessionId: sessionIdRef.current
         }),
       });
 
@@ -356,7 +353,7 @@ const data = await response.json();
   const handleClearChat = async () => {
     try {
       // Clear session on backend
-      await fetch('http://localhost:8000/api/clear-session', {
+      await fetch(`http://localhost:8000/api/clear-session?session_id=${sessionIdRef.current}`, {
         method: 'POST',
         headers: {
           'Authorization': `Bearer ${token}`,
@@ -367,6 +364,7 @@ const data = await response.json();
     }
 
     // Clear local state
+    sessionIdRef.current = crypto.randomUUID();
     setMessages([]);
     setPatientInfo(null);
     setDoctorRecommendations([]);
@@ -7,6 +7,7 @@ import { Label } from "@/components/ui/label";
 import { SidebarTrigger } from "@/components/ui/sidebar";
 import { UserCheck, UserPlus, Trash2, Search, MapPin } from "lucide-react";
 import { Badge } from "@/components/ui/badge";
+import LoadMoreButton from "@/components/LoadMoreButton";
 import { useData } from "@/contexts/DataContext";
 import { useToast } from "@/hooks/use-toast";
 
@@ -256,6 +257,8 @@ const DoctorsPage = () => {
           <p className="text-slate-400">No doctors found matching your criteria.</p>
         </div>
       )}
+
+      <LoadMoreButton list="doctors" />
     </div>
   );
 };
@@ -7,6 +7,7 @@ import { Label } from "@/components/ui/label";
 import { SidebarTrigger } from "@/components/ui/sidebar";
 import { Users, UserPlus, Trash2, Search } from "lucide-react";
 import { Badge } from "@/components/ui/badge";
+import LoadMoreButton from "@/components/LoadMoreButton";
 import { useData } from "@/contexts/DataContext";
 import { useToast } from "@/hooks/use-toast";
 
@@ -234,6 +235,7 @@ const PatientsPage = () => {
               </table>
             </div>
           )}
+          <LoadMoreButton list="patients" />
         </div>
       </div>
     </div>
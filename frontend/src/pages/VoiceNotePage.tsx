@@ -1386,8 +1386,8 @@ const fetchSummary = async () => {
       if (!response.ok) throw new Error("Upload failed");
 
       const data = await response.json();
-      alert("Audio uploaded and transcribed successfully!");
-      console.log("Transcript:", data.transcript);
+      alert("Audio uploaded! Transcription is running in the background.");
+      console.log("Processing job:", data.job_id);
     } catch (error) {
       console.error("Upload error:", error);
       alert("Failed to upload audio. Check console for details.");
@@ -1,22 +1,17 @@
+import { fetchPage } from "./pagination";
+
 const API_URL = "http://localhost:8000";
 
 export const appointmentsService = {
-  async getAll(token: string) {
-    console.log("Calling getAll appointments with token:", token ? "Token exists" : "No token");
-    const res = await fetch(`${API_URL}/appointments/`, {
+  async getPage(token: string, cursor?: string | null) {
+    console.log("Calling getPage appointments with token:", token ? "Token exists" : "No token");
+    const data = await fetchPage<any>(`${API_URL}/appointments/`, {
       headers: {
         "Authorization": `Bearer ${token}`,
         "Content-Type": "application/json"
       }
-    });
-    console.log("getAll appointments response status:", res.status);
-    if (!res.ok) {
-      const errorText = await res.text();
-      console.error("getAll appointments error:", errorText);
-      throw new Error("Failed to fetch appointments");
-    }
-    const data = await res.json();
-    console.log("getAll appointments response data:", data);
+    }, "Failed to fetch appointments", cursor);
+    console.log("getPage appointments response data:", data);
     return data;
   },
 
@@ -1,17 +1,16 @@
 import { Doctor } from "@/contexts/DataContext";
+import { fetchPage, Page } from "./pagination";
 
 const API_URL = "http://localhost:8000";
 
 export const doctorsService = {
-  async getAll(token: string): Promise<Doctor[]> {
-    const res = await fetch(`${API_URL}/doctors/`, {
+  async getPage(token: string, cursor?: string | null): Promise<Page<Doctor>> {
+    return fetchPage<Doctor>(`${API_URL}/doctors/`, {
       headers: {
         "Authorization": `Bearer ${token}`,
         "Content-Type": "application/json"
       }
-    });
-    if (!res.ok) throw new Error("Failed to fetch doctors");
-    return res.json();
+    }, "Failed to fetch doctors", cursor);
   },
 
   async create(doctor: Omit<Doctor, "id">, token: string): Promise<Doctor> {
@@ -1,3 +1,5 @@
+import { fetchPage } from "./pagination";
+
 const API_URL = "http://localhost:8000";
 
 // Helper function to get auth token
@@ -10,12 +12,10 @@ const getAuthHeaders = () => {
 };
 
 export const messagesService = {
-  async getAll() {
-    const res = await fetch(`${API_URL}/messages/`, {
+  async getPage(cursor?: string | null) {
+    return fetchPage(`${API_URL}/messages/`, {
       headers: getAuthHeaders(),
-    });
-    if (!res.ok) throw new Error("Failed to fetch messages");
-    return res.json();
+    }, "Failed to fetch messages", cursor);
   },
 
   async create(message) {
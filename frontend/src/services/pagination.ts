@@ -0,0 +1,27 @@
+export interface Page<T> {
+  items: T[];
+  // Pass back as `cursor` to get the next page; null on the last page
+  nextCursor: string | null;
+}
+
+// Fetches one page of a paginated list endpoint. The cursor for the next
+// page comes back in the X-Next-Cursor header; the UI asks for it when the
+// user loads more, rather than walking the whole collection up front.
+export async function fetchPage<T>(
+  url: string,
+  init: RequestInit,
+  errorMessage: string,
+  cursor?: string | null
+): Promise<Page<T>> {
+  const pageUrl = cursor ? `${url}?cursor=${encodeURIComponent(cursor)}` : url;
+  const res = await fetch(pageUrl, init);
+  if (!res.ok) {
+    const errorText = await res.text();
+    console.error(errorMessage, errorText);
+    throw new Error(errorMessage);
+  }
+  return {
+    items: await res.json(),
+    nextCursor: res.headers.get("X-Next-Cursor"),
+  };
+}
@@ -1,17 +1,16 @@
 import { Patient } from "@/contexts/DataContext";
+import { fetchPage, Page } from "./pagination";
 
 const API_URL = "http://localhost:8000";
 
 export const patientsService = {
-  async getAll(token: string): Promise<Patient[]> {
-    const res = await fetch(`${API_URL}/patients/`, {
+  async getPage(token: string, cursor?: string | null): Promise<Page<Patient>> {
+    return fetchPage<Patient>(`${API_URL}/patients/`, {
       headers: {
         "Authorization": `Bearer ${token}`,
         "Content-Type": "application/json"
       }
-    });
-    if (!res.ok) throw new Error("Failed to fetch patients");
-    return res.json();
+    }, "Failed to fetch patients", cursor);
   },
 
   async create(patient: Omit<Patient, "id">, token: string): Promise<Patient> {
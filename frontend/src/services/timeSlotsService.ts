@@ -1,17 +1,16 @@
 import { TimeSlot } from "@/contexts/DataContext";
+import { fetchPage, Page } from "./pagination";
 
 const API_URL = "http://localhost:8000";
 
 export const timeSlotsService = {
-  async getAll(token: string): Promise<TimeSlot[]> {
-    const res = await fetch(`${API_URL}/availabilities/`, {
+  async getPage(token: string, cursor?: string | null): Promise<Page<TimeSlot>> {
+    return fetchPage<TimeSlot>(`${API_URL}/availabilities/`, {
       headers: {
         "Authorization": `Bearer ${token}`,
         "Content-Type": "application/json"
       }
-    });
-    if (!res.ok) throw new Error("Failed to fetch time slots");
-    return res.json();
+    }, "Failed to fetch time slots", cursor);
   },
 
   async create(slot: Omit<TimeSlot, "id">, token: string): Promise<TimeSlot> {